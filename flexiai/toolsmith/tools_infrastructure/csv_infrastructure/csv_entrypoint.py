@@ -1,27 +1,58 @@
 # FILE: flexiai/toolsmith/tools_infrastructure/csv_infrastructure/csv_entrypoint.py
 
+import sys
 import logging
-from typing import Any, Dict, List, Optional, Union
+import functools
+import importlib
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.utils.file_handler import check_file_exists
+from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.utils.file_handler import check_file_exists, get_full_path
 from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.utils.error_handler import handle_error_response
 from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.exceptions.csv_exceptions import CSVError
-
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.create_operations import create_csv
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.delete_operations import delete_csv, delete_row
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.read_operations import (
-    read_csv, read_row, read_column, generate_csv_summary,
-)
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.update_operations import (
-    append_row, append_rows, update_cell,
-)
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.filter_operations import filter_rows
-from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations.data_validation_operations import (
-    validate_csv_structure,
-)
+from flexiai.toolsmith.tools_infrastructure.dispatch_helpers import pick, required_message
 
 logger = logging.getLogger(__name__)
 
+_OPERATIONS_PACKAGE = "flexiai.toolsmith.tools_infrastructure.csv_infrastructure.operations"
+
+
+@functools.lru_cache(maxsize=None)
+def _load_handler(module: str, name: str) -> Callable[..., Dict[str, Any]]:
+    """Import an operation handler on first use, so unused operation modules are never loaded."""
+    return getattr(importlib.import_module(f"{_OPERATIONS_PACKAGE}.{module}"), name)
+
+
+# operation -> ((operations module, handler name), required parameters, kwargs
+# builder). Handlers are imported on first use via _load_handler. The builder maps
+# the entrypoint's parameters onto the handler's keyword arguments (path and
+# file_name are always passed).
+_CSV_OPS: Dict[str, Tuple[Tuple[str, str], Tuple[str, ...], Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "create": (("create_operations", "create_csv"), (), pick("headers")),
+    "delete": (("delete_operations", "delete_csv"), (), pick()),
+    "read": (("read_operations", "read_csv"), (), pick()),
+    "read_row": (("read_operations", "read_row"), ("index",), pick("index")),
+    "read_column": (("read_operations", "read_column"), ("column",), pick("column")),
+    "summary": (("read_operations", "generate_csv_summary"), (), pick()),
+    "append_row": (("update_operations", "append_row"), ("row",), pick("row")),
+    "append_rows": (("update_operations", "append_rows"), ("rows",), pick("rows")),
+    "update_cell": (
+        ("update_operations", "update_cell"),
+        ("index", "column", "value"),
+        pick("column", "value", index="row_index"),
+    ),
+    "delete_row": (("delete_operations", "delete_row"), ("index",), pick(index="row_index")),
+    "filter_rows": (
+        ("filter_operations", "filter_rows"),
+        ("column", "condition_type", "condition_value"),
+        pick("column", "condition_type", "condition_value"),
+    ),
+    "validate": (
+        ("data_validation_operations", "validate_csv_structure"),
+        ("required_columns",),
+        pick("required_columns"),
+    ),
+}
+
 
 def csv_entrypoint(
     operation: str,
@@ -44,99 +75,31 @@ def csv_entrypoint(
         append_row, append_rows, update_cell, delete_row,
         filter_rows, validate
     """
+    # Tool input arrives as fresh strings; interning lets the table lookup match the
+    # (compiler-interned) literal keys by identity.
+    operation = sys.intern(operation) if isinstance(operation, str) else operation
+    # Snapshot of the call arguments, consumed by the _CSV_OPS kwargs builders.
+    params = dict(locals())
     try:
-        # For anything except creation, file_name must be provided and exist
-        if operation != "create":
-            if not file_name:
-                raise CSVError("Parameter 'file_name' is required.")
-            check_file_exists(path, file_name)
+        entry = _CSV_OPS.get(operation)
+        if entry is None:
+            raise CSVError(f"Unsupported CSV operation: '{operation}'")
+        handler_ref, required, build_kwargs = entry
 
-        # 1. CREATE
         if operation == "create":
             if not file_name:
                 raise CSVError("Parameter 'file_name' is required for 'create'.")
-            return create_csv(path=path, file_name=file_name, headers=headers)
-
-        # 2. DELETE WHOLE FILE
-        if operation == "delete":
-            return delete_csv(path=path, file_name=file_name)
-
-        # 3. READ ALL ROWS
-        if operation == "read":
-            return read_csv(path=path, file_name=file_name)
-
-        # 4. READ SINGLE ROW
-        if operation == "read_row":
-            if index is None:
-                raise CSVError("Parameter 'index' is required for 'read_row'.")
-            return read_row(index=index, path=path, file_name=file_name)
-
-        # 5. READ A COLUMN
-        if operation == "read_column":
-            if column is None:
-                raise CSVError("Parameter 'column' is required for 'read_column'.")
-            return read_column(column=column, path=path, file_name=file_name)
-
-        # 6. SUMMARY
-        if operation == "summary":
-            return generate_csv_summary(path=path, file_name=file_name)
-
-        # 7. APPEND ONE ROW
-        if operation == "append_row":
-            if row is None:
-                raise CSVError("Parameter 'row' is required for 'append_row'.")
-            return append_row(row=row, path=path, file_name=file_name)
-
-        # 8. APPEND MULTIPLE ROWS
-        if operation == "append_rows":
-            if rows is None:
-                raise CSVError("Parameter 'rows' is required for 'append_rows'.")
-            return append_rows(rows=rows, path=path, file_name=file_name)
-
-        # 9. UPDATE ONE CELL
-        if operation == "update_cell":
-            if index is None or column is None or value is None:
-                raise CSVError("Parameters 'index', 'column', and 'value' are required for 'update_cell'.")
-            return update_cell(
-                row_index=index,
-                column=column,
-                value=value,
-                path=path,
-                file_name=file_name
-            )
-
-        # 10. DELETE A ROW
-        if operation == "delete_row":
-            if index is None:
-                raise CSVError("Parameter 'index' is required for 'delete_row'.")
-            return delete_row(row_index=index, path=path, file_name=file_name)
-
-        # 11. FILTER ROWS
-        if operation == "filter_rows":
-            if column is None or condition_type is None or condition_value is None:
-                raise CSVError(
-                    "Parameters 'column', 'condition_type', and 'condition_value' are required for 'filter_rows'."
-                )
-            return filter_rows(
-                column=column,
-                condition_type=condition_type,
-                condition_value=condition_value,
-                path=path,
-                file_name=file_name
-            )
-
-        # 12. VALIDATE STRUCTURE
-        if operation == "validate":
-            if required_columns is None:
-                raise CSVError("Parameter 'required_columns' is required for 'validate'.")
-            return validate_csv_structure(
-                required_columns=required_columns,
-                path=path,
-                file_name=file_name
-            )
-
-        # UNKNOWN OPERATION
-        raise CSVError(f"Unsupported CSV operation: '{operation}'")
+        else:
+            # For anything except creation, file_name must be provided and exist
+            if not file_name:
+                raise CSVError("Parameter 'file_name' is required.")
+            check_file_exists(path, file_name)
+
+        if any(params[name] is None for name in required):
+            raise CSVError(required_message(required, operation, noun=""))
+
+        handler = _load_handler(*handler_ref)
+        return handler(path=path, file_name=file_name, **build_kwargs(params))
 
     except CSVError as e:
         logger.error(f"[csv_entrypoint][{operation}] {e}")
@@ -145,3 +108,86 @@ def csv_entrypoint(
     except Exception as e:
         logger.exception(f"[csv_entrypoint][{operation}] unexpected")
         return handle_error_response(f"Unexpected error in '{operation}': {e}")
+
+
+# operation -> (CSVManager call, whether it modifies the file). Only operations on an
+# existing file can be batched; create and delete act on the file itself.
+_BATCH_OPS: Dict[str, Tuple[Callable[[Any, Dict[str, Any]], Any], bool]] = {
+    "read": (lambda manager, op: manager.read_all(), False),
+    "read_row": (lambda manager, op: manager.read_row(op["index"]), False),
+    "read_column": (lambda manager, op: manager.read_column(op["column"]), False),
+    "summary": (lambda manager, op: manager.generate_summary(), False),
+    "append_row": (lambda manager, op: manager.append_row(op["row"]), True),
+    "append_rows": (lambda manager, op: manager.append_rows(op["rows"]), True),
+    "update_cell": (lambda manager, op: manager.update_cell(op["index"], op["column"], op["value"]), True),
+    "delete_row": (lambda manager, op: manager.delete_row(op["index"]), True),
+    "filter_rows": (
+        lambda manager, op: manager.filter_rows(op["column"], op["condition_type"], op["condition_value"]),
+        False,
+    ),
+    "validate": (lambda manager, op: manager.validate_structure(op["required_columns"]), False),
+}
+
+
+def csv_entrypoint_batch(
+    ops: List[Dict[str, Any]],
+    path: str = "flexiai/toolsmith/data/csv",
+    file_name: str = "",
+) -> Dict[str, Any]:
+    """
+    Apply several CSV operations to one file with a single load and at most one save.
+
+    Each entry of ops is a dict with an 'operation' key plus that operation's
+    csv_entrypoint parameters (index, column, row, rows, value, condition_type,
+    condition_value, required_columns). Operations run in order against the
+    in-memory data and the file is written once at the end, only if something
+    changed. If any operation fails, nothing is written.
+
+    Supported operations:
+      - read, read_row, read_column, summary, append_row, append_rows,
+        update_cell, delete_row, filter_rows, validate
+
+    Returns:
+        Dict[str, Any]: Standardized response whose result lists, in order,
+        {'operation': str, 'result': Any} for each operation.
+    """
+    try:
+        if not file_name:
+            raise CSVError("Parameter 'file_name' is required.")
+        if not ops:
+            raise CSVError("Parameter 'ops' must contain at least one operation.")
+
+        # Validate the whole batch before touching the file.
+        for op in ops:
+            operation = op.get("operation")
+            if operation not in _BATCH_OPS:
+                raise CSVError(f"Unsupported CSV batch operation: '{operation}'")
+            required = _CSV_OPS[operation][1]
+            if any(op.get(name) is None for name in required):
+                raise CSVError(required_message(required, operation, noun=""))
+
+        check_file_exists(path, file_name)
+        # Imported here, like the operation handlers, to keep pandas off the import path.
+        from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.managers.csv_manager import CSVManager
+        manager = CSVManager(file_path=get_full_path(path, file_name), autosave=False)
+
+        results = []
+        modified = False
+        for op in ops:
+            call, mutates = _BATCH_OPS[op["operation"]]
+            results.append({"operation": op["operation"], "result": call(manager, op)})
+            modified = modified or mutates
+        if modified:
+            manager.save()
+
+        message = f"Applied {len(ops)} operations to '{file_name}'."
+        logger.info(message)
+        return {"status": True, "message": message, "result": results}
+
+    except CSVError as e:
+        logger.error(f"[csv_entrypoint_batch] {e}")
+        return handle_error_response(str(e))
+
+    except Exception as e:
+        logger.exception("[csv_entrypoint_batch] unexpected")
+        return handle_error_response(f"Unexpected error in CSV batch: {e}")
@@ -1,9 +1,11 @@
 # FILE: flexiai/toolsmith/tools_infrastructure/csv_infrastructure/managers/csv_manager.py
 
 import os
+import csv
 import logging
+import numpy as np
 import pandas as pd
-from typing import Any, Dict, List, Optional, Union, Callable
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.exceptions.csv_exceptions import CSVError
 from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.utils.file_handler import (
@@ -19,16 +21,27 @@ class CSVManager:
     Manages CRUD and utility operations on CSV files using pandas.
     """
 
-    def __init__(self, file_path: str, load_csv: bool = True):
+    def __init__(self, file_path: str, load_csv: bool = True, autosave: bool = True):
         """
         Initialize the CSVManager.
 
         Args:
             file_path (str): Path to the CSV file.
             load_csv (bool): Whether to load the CSV into memory on init. Defaults to True.
+            autosave (bool): Whether each modifying method writes the file immediately.
+                With False, changes stay in memory until save() is called. Defaults to True.
         """
         self.file_path = file_path
+        # Split once; the file checks take (directory, name) on every operation.
+        self._dir = os.path.dirname(file_path)
+        self._name = os.path.basename(file_path)
+        self._full_path = get_full_path(self._dir, self._name)
+        self.autosave = autosave
         self.df: Optional[pd.DataFrame] = None
+        # Per-column arrays derived for filter_rows, reused by repeated filters on the
+        # same data; tied to the frame they were built from and cleared on mutation.
+        self._column_cache: Dict[Tuple[str, str], pd.Series] = {}
+        self._column_cache_frame: Optional[pd.DataFrame] = None
         logger.debug(f"Initialized CSVManager for '{self.file_path}'.")
         if load_csv:
             self._load_csv()
@@ -42,8 +55,7 @@ class CSVManager:
         """
         try:
             # Ensure the file exists before reading
-            path, name = os.path.dirname(self.file_path), os.path.basename(self.file_path)
-            check_file_exists(path, name)
+            check_file_exists(self._dir, self._name)
             # Load all columns as strings, don't auto-convert blanks to NaN
             self.df = pd.read_csv(self.file_path, dtype=str, keep_default_na=False)
             # Clean up whitespace, convert empty strings to NaN, drop blank rows, etc.
@@ -53,37 +65,107 @@ class CSVManager:
             logger.error(f"Failed to load CSV '{self.file_path}': {e}")
             raise CSVError(f"Failed to load CSV '{self.file_path}': {e}") from e
 
+    @staticmethod
+    def _records(frame: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Convert a DataFrame to a list of row dicts by zipping its column lists.
+
+        Equivalent to frame.to_dict(orient="records") (values are converted to
+        native Python types by tolist()) without pandas' per-cell boxing.
+
+        Args:
+            frame (pd.DataFrame): Frame to convert.
+
+        Returns:
+            List[Dict[str, Any]]: One dict per row.
+        """
+        columns = frame.columns.tolist()
+        if not columns:
+            return [{} for _ in range(len(frame))]
+        values = [frame.iloc[:, i].tolist() for i in range(len(columns))]
+        return [dict(zip(columns, row)) for row in zip(*values)]
+
+    def _read_stream_header(self) -> Optional[List[str]]:
+        """
+        Read the header row directly from disk.
+
+        Returns:
+            Optional[List[str]]: The header, or None if pandas would rename it
+            (empty, duplicated or blank names), which streaming cannot mirror.
+        """
+        check_file_exists(self._dir, self._name)
+        with open(self.file_path, newline="", encoding="utf-8") as fh:
+            header = next(csv.reader(fh), [])
+        if not header or len(set(header)) != len(header) or any(not name.strip() for name in header):
+            return None
+        return header
+
+    def _iter_clean_rows(self, header: List[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Stream data rows with the csv module, cleaned like _clean_and_validate.
+
+        Values are trimmed, blank cells become None, fully blank rows are skipped
+        and short rows are padded, so positions match the loaded DataFrame.
+
+        Args:
+            header (List[str]): Header returned by _read_stream_header().
+
+        Yields:
+            Dict[str, Any]: One cleaned row.
+
+        Raises:
+            CSVError: If a row has more fields than the header.
+        """
+        width = len(header)
+        with open(self.file_path, newline="", encoding="utf-8") as fh:
+            reader = csv.reader(fh)
+            next(reader, None)
+            for fields in reader:
+                if len(fields) > width:
+                    raise CSVError(
+                        f"Line {reader.line_num} of '{self.file_path}' has {len(fields)} fields, expected {width}."
+                    )
+                values = [field.strip() or None for field in fields]
+                if all(value is None for value in values):
+                    continue
+                values.extend([None] * (width - len(values)))
+                yield dict(zip(header, values))
+
     def _clean_and_validate(self, required_columns: Optional[List[str]] = None) -> None:
         """
         Trim whitespace, convert empty strings to NaN, drop blank rows,
         and optionally ensure required_columns have no missing values.
         """
-        # 1) Strip whitespace on all string columns
+        # 1) Strip whitespace on all string columns and, in the same pass, convert
+        #    the resulting empty strings (blank or whitespace-only cells) to NaN
+        #    The loader already yields str values in object columns, so the astype(str)
+        #    copy is only made for columns of another dtype.
         for col in self.df.columns:
-            self.df[col] = self.df[col].astype(str).str.strip()
+            values = self.df[col]
+            if values.dtype != object:
+                values = values.astype(str)
+            stripped = values.str.strip()
+            self.df[col] = stripped.mask(stripped.eq(""), pd.NA)
 
-        # 2) Convert empty strings (or whitespace-only) to actual NaN
-        self.df.replace({"": pd.NA, r"^\s*$": pd.NA}, regex=True, inplace=True)
-
-        # 3) Drop rows that are entirely blank (all NaN)
+        # 2) Drop rows that are entirely blank (all NaN)
         before = len(self.df)
         self.df.dropna(how="all", inplace=True)
         after = len(self.df)
         if before != after:
             logger.warning(f"Dropped {before - after} fully blank rows from '{self.file_path}'.")
 
-        # 4) If required_columns provided, ensure they exist and have no missing
+        # 3) If required_columns provided, ensure they exist and have no missing
         if required_columns:
             missing_cols = [c for c in required_columns if c not in self.df.columns]
             if missing_cols:
                 raise CSVError(f"Missing required columns after load: {missing_cols}")
 
-            nulls = {}
-            for c in required_columns:
-                cnt = int(self.df[c].isna().sum())
-                if cnt:
-                    nulls[c] = cnt
-            if nulls:
+            # One vectorized any() over the required columns; counts are only
+            # computed for the columns that actually have gaps.
+            has_nulls = self.df[required_columns].isna().any()
+            bad = has_nulls[has_nulls].index.tolist()
+            if bad:
+                nulls = {c: int(self.df[c].isna().sum()) for c in bad}
                 raise CSVError(f"Column(s) with missing values: {nulls}")
 
     def _ensure_loaded(self) -> None:
@@ -107,6 +189,26 @@ class CSVManager:
             logger.error(f"Failed to save CSV '{self.file_path}': {e}")
             raise CSVError(f"Failed to save CSV '{self.file_path}': {e}") from e
 
+    def _autosave(self) -> None:
+        """
+        Persist a modification now, unless autosave is off (batched changes).
+
+        Every modifying method calls this, so it also drops the filter column cache.
+        """
+        self._column_cache.clear()
+        if self.autosave:
+            self._save_csv()
+
+    def save(self) -> None:
+        """
+        Write the in-memory DataFrame to disk, e.g. after batched changes.
+
+        Raises:
+            CSVError: If saving fails.
+        """
+        self._ensure_loaded()
+        self._save_csv()
+
     def create_csv(self, headers: Optional[List[str]] = None) -> None:
         """
         Create a new CSV file. Fails if the file already exists.
@@ -117,7 +219,7 @@ class CSVManager:
         Raises:
             CSVError: If the file exists or creation fails.
         """
-        full_path = get_full_path(os.path.dirname(self.file_path), os.path.basename(self.file_path))
+        full_path = self._full_path
         if os.path.exists(full_path):
             raise CSVError(f"Cannot create. File '{full_path}' already exists.")
         try:
@@ -156,7 +258,7 @@ class CSVManager:
         """
         self._ensure_loaded()
         try:
-            records = self.df.to_dict(orient="records")
+            records = self._records(self.df)
             logger.info(f"Read {len(records)} rows from '{self.file_path}'.")
             return records
         except Exception as e:
@@ -180,7 +282,7 @@ class CSVManager:
         self._ensure_loaded()
         try:
             slice_df = self.df.iloc[start:start + count]
-            records = slice_df.to_dict(orient="records")
+            records = self._records(slice_df)
             logger.info(f"Read rows {start} to {start + count - 1} from '{self.file_path}'.")
             return records
         except Exception as e:
@@ -202,8 +304,7 @@ class CSVManager:
         """
         self._ensure_loaded()
         try:
-            row = self.df.iloc[index]
-            record = row.to_dict()
+            record = dict(zip(self.df.columns.tolist(), self.df.iloc[index].tolist()))
             logger.info(f"Read row {index} from '{self.file_path}'.")
             return record
         except Exception as e:
@@ -214,6 +315,9 @@ class CSVManager:
         """
         Read an entire column by name or 0-based index.
 
+        While nothing is loaded, only that column is parsed from disk when the
+        result is guaranteed to match the full load (see _read_column_projected).
+
         Args:
             column (Union[str,int]): Column name or zero-based index.
 
@@ -223,6 +327,16 @@ class CSVManager:
         Raises:
             CSVError: If column not found or reading fails.
         """
+        if self.df is None:
+            try:
+                values = self._read_column_projected(column)
+                if values is not None:
+                    logger.info(f"Read column '{column}' from '{self.file_path}' (projected).")
+                    return values
+            except Exception as e:
+                logger.error(f"Failed to read column {column}: {e}")
+                raise CSVError(f"Failed to read column {column}: {e}") from e
+
         self._ensure_loaded()
         try:
             if isinstance(column, int):
@@ -236,6 +350,75 @@ class CSVManager:
             logger.error(f"Failed to read column {column}: {e}")
             raise CSVError(f"Failed to read column {column}: {e}") from e
 
+    def _read_column_projected(self, column: Union[str, int]) -> Optional[List[Any]]:
+        """
+        Parse a single column from disk with usecols, cleaned like _clean_and_validate.
+
+        Whether a row is dropped as fully blank depends on every column, so the
+        projection is only exact when the column has no blank cells; headers
+        pandas would rename and unknown columns also defer to the full load.
+
+        Args:
+            column (Union[str,int]): Column name or zero-based index.
+
+        Returns:
+            Optional[List[Any]]: The trimmed values, or None if the file must be loaded.
+        """
+        header = self._read_stream_header()
+        if header is None:
+            return None
+        if isinstance(column, int):
+            if not -len(header) <= column < len(header):
+                return None
+            col_name = header[column]
+        elif column in header:
+            col_name = column
+        else:
+            return None
+        values = pd.read_csv(self.file_path, usecols=[col_name], dtype=str, keep_default_na=False)[col_name]
+        stripped = values.str.strip()
+        if stripped.eq("").any():
+            return None
+        return stripped.tolist()
+
+    def _stream_append(self, rows: List[Dict[str, Any]]) -> bool:
+        """
+        Append rows to the end of the file without loading or rewriting it.
+
+        Only used while the DataFrame is not loaded and autosave is on, and only
+        when every key of every row is an existing header; anything else (new
+        columns, index keys, a header-less file) returns False so the caller takes
+        the DataFrame path.
+
+        Args:
+            rows (List[Dict[str, Any]]): Row mappings to append.
+
+        Returns:
+            bool: True if the rows were written.
+        """
+        if self.df is not None or not self.autosave:
+            return False
+        try:
+            with open(self.file_path, newline="", encoding="utf-8") as fh:
+                header = next(csv.reader(fh), [])
+        except OSError:
+            return False
+        known = set(header)
+        if not header or len(known) != len(header) or any(key not in known for row in rows for key in row):
+            return False
+
+        with open(self.file_path, "rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            size = fh.tell()
+            fh.seek(max(size - 1, 0))
+            needs_newline = size > 0 and fh.read(1) not in (b"\n", b"\r")
+        # Same line terminator as DataFrame.to_csv, so both paths write alike.
+        with open(self.file_path, "a", newline="", encoding="utf-8") as fh:
+            if needs_newline:
+                fh.write(os.linesep)
+            csv.DictWriter(fh, fieldnames=header, lineterminator=os.linesep).writerows(rows)
+        return True
+
     def append_row(self, row: Dict[str, Any]) -> None:
         """
         Append a single row to the CSV.
@@ -246,10 +429,27 @@ class CSVManager:
         Raises:
             CSVError: If append or save fails.
         """
+        try:
+            if self._stream_append([row]):
+                logger.info(f"Appended row to '{self.file_path}': {row}")
+                return
+        except Exception as e:
+            logger.error(f"Failed to append row: {e}")
+            raise CSVError(f"Failed to append row: {e}") from e
+
         self._ensure_loaded()
         try:
-            self.df = pd.concat([self.df, pd.DataFrame([row])], ignore_index=True)
-            self._save_csv()
+            if row and all(key in self.df.columns for key in row):
+                # Enlarge in place rather than concat, which copies every column. Labels
+                # are kept as 0..n-1 (what concat's ignore_index gave) so later positional
+                # row indices still line up after blank rows were dropped on load.
+                if not self.df.index.equals(pd.RangeIndex(len(self.df))):
+                    self.df.reset_index(drop=True, inplace=True)
+                self.df.loc[len(self.df), list(row.keys())] = list(row.values())
+            else:
+                # New columns (or index keys) still go through concat.
+                self.df = pd.concat([self.df, pd.DataFrame([row])], ignore_index=True)
+            self._autosave()
             logger.info(f"Appended row to '{self.file_path}': {row}")
         except Exception as e:
             logger.error(f"Failed to append row: {e}")
@@ -265,10 +465,18 @@ class CSVManager:
         Raises:
             CSVError: If append or save fails.
         """
+        try:
+            if self._stream_append(rows):
+                logger.info(f"Appended {len(rows)} rows to '{self.file_path}'.")
+                return
+        except Exception as e:
+            logger.error(f"Failed to append rows: {e}")
+            raise CSVError(f"Failed to append rows: {e}") from e
+
         self._ensure_loaded()
         try:
             self.df = pd.concat([self.df, pd.DataFrame(rows)], ignore_index=True)
-            self._save_csv()
+            self._autosave()
             logger.info(f"Appended {len(rows)} rows to '{self.file_path}'.")
         except Exception as e:
             logger.error(f"Failed to append rows: {e}")
@@ -298,12 +506,54 @@ class CSVManager:
             else:
                 col_name = column
             self.df.at[row_index, col_name] = value
-            self._save_csv()
+            self._autosave()
             logger.info(f"Updated cell ({row_index}, {col_name}) to '{value}'.")
         except Exception as e:
             logger.error(f"Failed to update cell: {e}")
             raise CSVError(f"Failed to update cell: {e}") from e
 
+    def _stream_delete(self, row_index: int) -> bool:
+        """
+        Delete a row by rewriting the file in one streamed pass, without loading it.
+
+        Rows are cleaned as on load and written with the csv module, which is what
+        DataFrame.to_csv uses, so the result matches the DataFrame path. The new
+        file is written next to the old one and swapped in atomically. Only used
+        while nothing is loaded, autosave is on and row_index is not negative.
+
+        Args:
+            row_index (int): Zero-based row index.
+
+        Returns:
+            bool: True if the row was deleted; False if the DataFrame path is needed.
+
+        Raises:
+            IndexError: If row_index is past the last row.
+        """
+        if self.df is not None or not self.autosave or row_index < 0:
+            return False
+        header = self._read_stream_header()
+        if header is None:
+            return False
+
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        total = 0
+        try:
+            with open(tmp_path, "w", newline="", encoding="utf-8") as dst:
+                writer = csv.writer(dst, lineterminator=os.linesep)
+                writer.writerow(header)
+                for row in self._iter_clean_rows(header):
+                    if total != row_index:
+                        writer.writerow(row.values())
+                    total += 1
+            if row_index >= total:
+                raise IndexError(f"row index {row_index} is out of bounds for {total} rows")
+            os.replace(tmp_path, self.file_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return True
+
     def delete_row(self, row_index: int) -> None:
         """
         Delete a row by index.
@@ -314,10 +564,26 @@ class CSVManager:
         Raises:
             CSVError: If deletion or save fails.
         """
+        try:
+            if self._stream_delete(row_index):
+                logger.info(f"Deleted row {row_index} from '{self.file_path}'.")
+                return
+        except Exception as e:
+            logger.error(f"Failed to delete row {row_index}: {e}")
+            raise CSVError(f"Failed to delete row {row_index}: {e}") from e
+
         self._ensure_loaded()
         try:
-            self.df = self.df.drop(self.df.index[row_index]).reset_index(drop=True)
-            self._save_csv()
+            n = len(self.df)
+            position = row_index + n if row_index < 0 else row_index
+            if not 0 <= position < n:
+                raise IndexError(f"row index {row_index} is out of bounds for {n} rows")
+            # One positional copy; relabelling in place replaces drop() + reset_index().
+            keep = np.ones(n, dtype=bool)
+            keep[position] = False
+            self.df = self.df.iloc[keep]
+            self.df.index = pd.RangeIndex(n - 1)
+            self._autosave()
             logger.info(f"Deleted row {row_index} from '{self.file_path}'.")
         except Exception as e:
             logger.error(f"Failed to delete row {row_index}: {e}")
@@ -350,9 +616,8 @@ class CSVManager:
             else:
                 col_name = column
 
-            cond = self._build_condition_func(condition_type, condition_value)
-            mask = self.df[col_name].apply(cond)
-            result = self.df[mask].to_dict(orient="records")
+            mask = self._build_condition_mask(col_name, condition_type, condition_value)
+            result = self._records(self.df[mask])
             logger.info(f"Filtered rows on '{col_name}' {condition_type} '{condition_value}': {len(result)} found.")
             return result
         except Exception as e:
@@ -404,16 +669,49 @@ class CSVManager:
         logger.info(f"CSV '{self.file_path}' contains all required columns.")
         return True
 
-    def _build_condition_func(self, condition: str, value: Any) -> Callable[[Any], bool]:
+    def _prepared_column(self, col_name: str, kind: str) -> pd.Series:
         """
-        Internal: build a predicate for filtering.
+        Internal: return a derived form of a column, building it once per data state.
 
         Args:
+            col_name (str): Column name.
+            kind (str): "text" (values as str), "stripped" (str, trimmed) or
+                "numeric" (float, non-numeric cells as NaN).
+
+        Returns:
+            pd.Series: The derived column, aligned with self.df.
+        """
+        if self._column_cache_frame is not self.df:
+            self._column_cache.clear()
+            self._column_cache_frame = self.df
+        key = (col_name, kind)
+        prepared = self._column_cache.get(key)
+        if prepared is None:
+            if kind == "numeric":
+                prepared = pd.to_numeric(self.df[col_name], errors="coerce")
+            elif kind == "stripped":
+                prepared = self._prepared_column(col_name, "text").str.strip()
+            else:
+                prepared = self.df[col_name].astype(str)
+            self._column_cache[key] = prepared
+        return prepared
+
+    def _build_condition_mask(self, col_name: str, condition: str, value: Any) -> pd.Series:
+        """
+        Internal: evaluate a filter condition on a whole column at once.
+
+        Comparisons run as vectorized pandas operations instead of a Python
+        predicate per cell, on column conversions cached across repeated filters.
+        Missing cells never match; for greater_than and less_than, cells that are
+        not numeric do not match either.
+
+        Args:
+            col_name (str): Column to test.
             condition (str): Condition type.
             value (Any): Comparison value.
 
         Returns:
-            Callable[[Any], bool]: Predicate function.
+            pd.Series: Boolean mask aligned with series.
 
         Raises:
             CSVError: On unsupported condition.
@@ -421,16 +719,19 @@ class CSVManager:
         if condition == "equals":
             # compare trimmed strings
             val = "" if value is None else str(value).strip()
-            return lambda x: str(x).strip() == val
-        if condition == "greater_than":
-            return lambda x: float(x) > float(value) if pd.notna(x) else False
-        if condition == "less_than":
-            return lambda x: float(x) < float(value) if pd.notna(x) else False
-        if condition == "contains":
-            return lambda x: value in str(x) if pd.notna(x) else False
-        if condition == "startswith":
-            return lambda x: str(x).startswith(value) if pd.notna(x) else False
-        if condition == "endswith":
-            return lambda x: str(x).endswith(value) if pd.notna(x) else False
+            return self._prepared_column(col_name, "stripped").eq(val)
+        if condition in ("greater_than", "less_than"):
+            numbers = self._prepared_column(col_name, "numeric")
+            threshold = float(value)
+            return numbers.gt(threshold) if condition == "greater_than" else numbers.lt(threshold)
+        if condition in ("contains", "startswith", "endswith"):
+            text = self._prepared_column(col_name, "text")
+            if condition == "contains":
+                matched = text.str.contains(value, regex=False)
+            elif condition == "startswith":
+                matched = text.str.startswith(value)
+            else:
+                matched = text.str.endswith(value)
+            return self.df[col_name].notna() & matched
         logger.error(f"Unsupported condition '{condition}'.")
         raise CSVError(f"Unsupported condition '{condition}'.")
@@ -1,5 +1,7 @@
 # FILE: flexiai/toolsmith/tools_infrastructure/csv_infrastructure/operations/data_transformation_operations.py
 
+import os
+import csv
 import logging
 from typing import Any, Dict, List, Optional
 
@@ -56,14 +58,19 @@ def transpose_csv(
     try:
         check_file_exists(path, file_name)
         manager = CSVManager(file_path=src_path)
-        df = manager.df.copy()
-        transposed = df.transpose()
-
-        # After transpose, the old index becomes columns; reset index to have a header row
-        transposed.reset_index(inplace=True)
-        transposed.to_csv(dst_path, index=False)
-
-        rows, cols = transposed.shape
+        df = manager.df
+
+        # Write the transpose directly: each source column becomes a row headed by its
+        # name, under an 'index' header of the source row labels. This is the file
+        # transpose() + reset_index() + to_csv() produced, without the frame copies.
+        values = df.to_numpy(dtype=object, na_value="")
+        with open(dst_path, "w", newline="", encoding="utf-8") as fh:
+            writer = csv.writer(fh, lineterminator=os.linesep)
+            writer.writerow(["index", *df.index.tolist()])
+            for column_name, column_values in zip(df.columns.tolist(), values.T):
+                writer.writerow([column_name, *column_values])
+
+        rows, cols = len(df.columns), len(df) + 1
         message = f"CSV '{file_name}' transposed successfully to '{dest_file_name}'."
         logger.info(message)
         return {
@@ -135,10 +142,9 @@ def unpivot_csv(
     try:
         check_file_exists(path, file_name)
         manager = CSVManager(file_path=src_path)
-        df = manager.df.copy()
 
-        # Perform unpivot (melt)
-        melted = pd.melt(df, id_vars=id_vars, var_name=var_name, value_name=value_name)
+        # Perform unpivot (melt); melt builds a new frame, so no defensive copy is needed
+        melted = pd.melt(manager.df, id_vars=id_vars, var_name=var_name, value_name=value_name)
 
         melted.to_csv(dst_path, index=False)
         row_count = len(melted)
@@ -85,7 +85,8 @@ def delete_row(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = CSVManager(file_path=full_path)
+        # Not loaded up front: the row is removed in a single streamed rewrite.
+        manager = CSVManager(file_path=full_path, load_csv=False)
         manager.delete_row(row_index)
         message = f"Row at index {row_index} deleted successfully from '{file_name}'."
         logger.info(message)
@@ -130,7 +130,7 @@ def read_column(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = CSVManager(file_path=full_path)
+        manager = CSVManager(file_path=full_path, load_csv=False)
         values = manager.read_column(column)
         message = f"Read column '{column}' from '{file_name}'."
         logger.info(message)
@@ -42,7 +42,8 @@ def append_row(
 
     try:
         check_file_exists(path, file_name)
-        manager = CSVManager(file_path=full_path)
+        # Not loaded up front: appends that fit the existing header are streamed to disk.
+        manager = CSVManager(file_path=full_path, load_csv=False)
         manager.append_row(row)
         message = f"Appended one row to '{file_name}'."
         logger.info(message)
@@ -87,7 +88,8 @@ def append_rows(
 
     try:
         check_file_exists(path, file_name)
-        manager = CSVManager(file_path=full_path)
+        # Not loaded up front: appends that fit the existing header are streamed to disk.
+        manager = CSVManager(file_path=full_path, load_csv=False)
         manager.append_rows(rows)
         count = len(rows)
         message = f"Appended {count} rows to '{file_name}'."
@@ -6,6 +6,9 @@ from pydantic import BaseModel, Field
 
 logger = logging.getLogger(__name__)
 
+# Shape shared by every error response; copied per call instead of validating a model.
+_ERR_TEMPLATE: Dict[str, Any] = {"status": False, "message": "", "result": None}
+
 class OperationResponse(BaseModel):
     """
     Standard response model for CSV operations.
@@ -18,10 +21,13 @@ class OperationResponse(BaseModel):
         """
         Convert the response model to a plain dict.
 
+        The three fields are read directly instead of going through model_dump(),
+        which is far slower for this fixed shape; result is returned as is.
+
         Returns:
             Dict[str, Any]: The response as a dictionary.
         """
-        return self.model_dump()
+        return {"status": self.status, "message": self.message, "result": self.result}
 
 def handle_error_response(message: str) -> Dict[str, Any]:
     """
@@ -34,5 +40,6 @@ def handle_error_response(message: str) -> Dict[str, Any]:
         Dict[str, Any]: A dict with status=False, the error message, and result=None.
     """
     logger.error(message)
-    response = OperationResponse(status=False, message=message, result=None)
-    return response.to_dict()
+    response = _ERR_TEMPLATE.copy()
+    response["message"] = message
+    return response
@@ -8,6 +8,9 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Types the json encoder handles natively; returned as is.
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
 def serialize_datetimes(data: Any) -> Any:
     """
     Recursively serialize non-JSON-native types to JSON-compatible formats.
@@ -20,30 +23,35 @@ def serialize_datetimes(data: Any) -> Any:
     Returns:
         Any: Data with all values converted to JSON-serializable types.
     """
-    if isinstance(data, list):
+    kind = type(data)
+    if kind in _NATIVE_TYPES:
+        return data
+    if kind is list or isinstance(data, list):
         return [serialize_datetimes(item) for item in data]
-    if isinstance(data, dict):
+    if kind is dict or isinstance(data, dict):
         return {key: serialize_datetimes(value) for key, value in data.items()}
-    if isinstance(data, (datetime, date)):
+    # datetime subclasses date, so the exact checks come first and a single
+    # isinstance() covers any other subclass.
+    if kind is datetime or kind is date or isinstance(data, date):
         iso = data.isoformat()
-        logger.debug(f"Serialized {data!r} to '{iso}'")
+        logger.debug("Serialized %r to '%s'", data, iso)
         return iso
     if isinstance(data, Decimal):
         s = str(data)
-        logger.debug(f"Serialized Decimal {data!r} to '{s}'")
+        logger.debug("Serialized Decimal %r to '%s'", data, s)
         return s
     if isinstance(data, set):
         lst = list(data)
-        logger.debug(f"Serialized set {data!r} to list {lst!r}")
+        logger.debug("Serialized set %r to list %r", data, lst)
         return [serialize_datetimes(item) for item in lst]
     if isinstance(data, tuple):
         lst = list(data)
-        logger.debug(f"Serialized tuple {data!r} to list {lst!r}")
+        logger.debug("Serialized tuple %r to list %r", data, lst)
         return [serialize_datetimes(item) for item in lst]
     if isinstance(data, bytes):
         try:
             s = data.decode('utf-8')
-            logger.debug(f"Serialized bytes {data!r} to '{s}'")
+            logger.debug("Serialized bytes %r to '%s'", data, s)
             return s
         except UnicodeDecodeError as e:
             logger.error(f"Cannot decode bytes {data!r}: {e}")
@@ -61,9 +69,12 @@ def prepare_tool_output(output_message: dict) -> dict:
         dict: A dict containing a JSON string under the 'output' key.
     """
     try:
-        serialized = serialize_datetimes(output_message)
-        json_str = json.dumps(serialized)
-        logger.debug(f"Prepared tool output: {json_str}")
+        try:
+            # Fast path: JSON-native output needs no conversion pass.
+            json_str = json.dumps(output_message)
+        except TypeError:
+            json_str = json.dumps(serialize_datetimes(output_message))
+        logger.debug("Prepared tool output: %s", json_str)
         return {"output": json_str}
     except Exception as e:
         logger.error(f"Error preparing tool output: {e}")
@@ -0,0 +1,51 @@
+# FILE: flexiai/toolsmith/tools_infrastructure/dispatch_helpers.py
+
+"""
+dispatch_helpers module.
+
+Helpers shared by the table-driven CSV and spreadsheet entrypoints: building
+the keyword arguments a handler receives and reporting missing parameters.
+"""
+
+from typing import Any, Callable, Dict, Tuple
+
+
+def pick(*names: str, **renamed: str) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a kwargs builder that forwards the named entrypoint parameters.
+
+    Positional names are passed under the same keyword; each renamed entry maps an
+    entrypoint parameter to a differently named handler keyword (e.g. index -> row_index).
+    The (parameter, keyword) pairs are fixed here, once, at table construction.
+
+    Args:
+        *names (str): Parameters forwarded under their own name.
+        **renamed (str): Parameter -> handler keyword pairs.
+
+    Returns:
+        Callable[[Dict[str, Any]], Dict[str, Any]]: Maps the entrypoint's call
+        arguments to the handler's keyword arguments.
+    """
+    pairs = tuple((name, name) for name in names) + tuple(renamed.items())
+    return lambda params: {keyword: params[name] for name, keyword in pairs}
+
+
+def required_message(names: Tuple[str, ...], operation: str, noun: str = "operation") -> str:
+    """
+    Format the error for missing required parameters, listing all of them.
+
+    Args:
+        names (Tuple[str, ...]): Required parameter names.
+        operation (str): The requested operation.
+        noun (str, optional): Word placed after the quoted operation name; pass ""
+            to leave it out. Defaults to "operation".
+
+    Returns:
+        str: e.g. "Parameters 'a' and 'b' are required for 'op' operation."
+    """
+    quoted = [f"'{name}'" for name in names]
+    target = f"'{operation}' {noun}" if noun else f"'{operation}'"
+    if len(quoted) == 1:
+        return f"Parameter {quoted[0]} is required for {target}."
+    listed = " and ".join(quoted) if len(quoted) == 2 else ", ".join(quoted[:-1]) + f", and {quoted[-1]}"
+    return f"Parameters {listed} are required for {target}."
@@ -1,23 +1,395 @@
 # FILE: flexiai/toolsmith/tools_infrastructure/security_audit.py
 
 import os
+import time
+import queue
+import atexit
+import errno
 import platform
 import shutil
+import ctypes
 import socket
+import selectors
+import tempfile
 import subprocess
-import psutil
 import logging
 import json
 import functools
 import re
-import ipaddress
+import struct
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; the audit records fall back to json.
+    orjson = None
+
+try:
+    import pwd
+except ImportError:  # not available on Windows, where psutil is used instead.
+    pwd = None
 
 logger = logging.getLogger(__name__)
 
 
+def _detect_wsl() -> bool:
+    """
+    Return True when running under WSL (checked once, at import).
+    """
+    try:
+        ver = Path("/proc/version").read_text().lower()
+    except OSError:
+        return False
+    return "microsoft" in ver or "wsl" in ver
+
+
+# The platform cannot change while the process runs: detect it once.
+_SYSTEM = platform.system().lower()
+_IS_WINDOWS = _SYSTEM.startswith("win")
+_IS_LINUX = _SYSTEM.startswith("linux")
+_IS_WSL = _IS_LINUX and _detect_wsl()
+
+@functools.lru_cache(maxsize=None)
+def _uid_name(uid: int) -> str:
+    """
+    Resolve a uid to its user name (the uid as text if it has no passwd entry).
+    """
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def _scan_proc() -> List[Dict[str, Any]]:
+    """
+    List processes by reading /proc/<pid>/status directly (Linux only).
+
+    Returns the same {pid, user, name} records as psutil.process_iter, without
+    building a Process object per pid; processes that exit mid-scan are skipped.
+    """
+    procs: List[Dict[str, Any]] = []
+    with os.scandir("/proc") as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            name = uid = None
+            try:
+                with open(f"/proc/{entry.name}/status", encoding="utf-8", errors="replace") as fh:
+                    for line in fh:
+                        if line.startswith("Name:"):
+                            name = line[5:].strip()
+                        elif line.startswith("Uid:"):
+                            uid = int(line.split()[1])
+                            break
+            except OSError:
+                continue
+            user = None if uid is None else _uid_name(uid)
+            procs.append({"pid": int(entry.name), "user": user, "name": name})
+    return procs
+
+
+# MIB_TCP_STATE values, named as Linux netstat prints them.
+_TCP_STATES = {
+    1: "CLOSE", 2: "LISTEN", 3: "SYN_SENT", 4: "SYN_RECV", 5: "ESTABLISHED", 6: "FIN_WAIT1",
+    7: "FIN_WAIT2", 8: "CLOSE_WAIT", 9: "CLOSING", 10: "LAST_ACK", 11: "TIME_WAIT", 12: "DELETE_TCB",
+}
+_TCP_TABLE_OWNER_PID_ALL = 5
+_UDP_TABLE_OWNER_PID = 1
+_ERROR_INSUFFICIENT_BUFFER = 122
+
+
+class _TcpRowOwnerPid(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in (
+        "state", "local_addr", "local_port", "remote_addr", "remote_port", "owning_pid"
+    )]
+
+
+class _UdpRowOwnerPid(ctypes.Structure):
+    _fields_ = [(name, ctypes.c_uint32) for name in ("local_addr", "local_port", "owning_pid")]
+
+
+def _read_ip_table(fetch: Callable[[Any, Any], int], row_type: type) -> Optional[ctypes.Array]:
+    """
+    Call a GetExtended*Table function with a buffer that fits its result.
+
+    Returns:
+        The table rows, or None if the call fails.
+    """
+    size = ctypes.c_uint32(0)
+    buf = None
+    for _ in range(5):  # the table can grow between the size query and the read
+        ret = fetch(buf, ctypes.byref(size))
+        if ret == 0 and buf is not None:
+            count = ctypes.c_uint32.from_buffer(buf).value
+            return (row_type * count).from_buffer(buf, ctypes.sizeof(ctypes.c_uint32))
+        if ret not in (0, _ERROR_INSUFFICIENT_BUFFER):
+            return None
+        buf = ctypes.create_string_buffer(size.value)
+    return None
+
+
+def _endpoint(addr: int, port: int) -> str:
+    """
+    Format an IP Helper address/port pair (both in network byte order) as ip:port.
+    """
+    return f"{socket.inet_ntoa(struct.pack('<I', addr))}:{socket.ntohs(port & 0xFFFF)}"
+
+
+def _windows_connections() -> Optional[List[Dict[str, str]]]:
+    """
+    List IPv4 TCP and UDP sockets from the IP Helper API (Windows only).
+
+    Returns the same records as parsing `netstat -ano`, straight from the
+    kernel's tables without starting a process, or None if the API is unavailable.
+    """
+    try:
+        iphlpapi = ctypes.windll.iphlpapi
+        tcp = _read_ip_table(
+            lambda buf, size: iphlpapi.GetExtendedTcpTable(
+                buf, size, False, socket.AF_INET, _TCP_TABLE_OWNER_PID_ALL, 0
+            ),
+            _TcpRowOwnerPid,
+        )
+        udp = _read_ip_table(
+            lambda buf, size: iphlpapi.GetExtendedUdpTable(buf, size, False, socket.AF_INET, _UDP_TABLE_OWNER_PID, 0),
+            _UdpRowOwnerPid,
+        )
+    except (AttributeError, OSError):
+        return None
+    if tcp is None or udp is None:
+        return None
+
+    connections = [
+        {
+            "proto": "tcp",
+            "local": _endpoint(row.local_addr, row.local_port),
+            "remote": _endpoint(row.remote_addr, row.remote_port),
+            "state": _TCP_STATES.get(row.state, str(row.state)),
+        }
+        for row in tcp
+    ]
+    connections.extend(
+        {"proto": "udp", "local": _endpoint(row.local_addr, row.local_port), "remote": "*:*", "state": ""}
+        for row in udp
+    )
+    return connections
+
+
+# PATH lookups for the platform tools; PATH does not change while we run.
+_which = functools.lru_cache(maxsize=32)(shutil.which)
+
+# netstat/ss connection lines and `ip neigh` entries, parsed by _parse_recon.
+# Command output stays bytes; only the captured fields are decoded.
+_NET_RE = re.compile(rb"^(tcp|udp)\s+\S+\s+\S+\s+(\S+)\s+(\S+)\s+(\S+)")
+_ARP_RE = re.compile(rb"^(\S+)\s+.*lladdr\s+([\da-f:]+)\s+(\S+)", re.I)
+
+# Firewall rule arguments that can be written into an iptables-restore or netsh
+# script verbatim (no whitespace, including a trailing newline, or quotes to
+# split or escape). Always test with fullmatch.
+_BATCH_ARG_RE = re.compile(r'[^\s"]+')
+_NETSH_ADD_RULE = ["advfirewall", "firewall", "add", "rule"]
+
+# Upper bound on in-flight connects in port_scan (each holds one socket; also
+# keeps select() under the Windows FD_SETSIZE of 512).
+_PORT_SCAN_CONCURRENCY = 256
+_PORT_SCAN_TIMEOUT = 0.3
+# SO_LINGER {on, 0s}: close() resets an established probe connection instead
+# of leaving it in TIME_WAIT holding an ephemeral port.
+_ABORT_ON_CLOSE = struct.pack("ii", 1, 0)
+# connect_ex results meaning a non-blocking connect is under way.
+_CONNECT_IN_PROGRESS = frozenset({
+    errno.EINPROGRESS,
+    errno.EALREADY,
+    errno.EWOULDBLOCK,
+    getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK),
+})
+# Upper bound on concurrent ping subprocesses in network_scan.
+_PING_WORKERS = 256
+_PING_TIMEOUT = 1.0
+_ICMP_ECHO_REQUEST = 8
+_ICMP_ECHO_REPLY = 0
+_ICMP_PAYLOAD = b"flexiai-network-scan"
+
+
+def _open_icmp_socket() -> Optional[socket.socket]:
+    """
+    Open an ICMP socket: an unprivileged ping socket if the kernel allows it
+    (net.ipv4.ping_group_range), else a raw socket (root only), else None.
+    """
+    for sock_type in (socket.SOCK_DGRAM, socket.SOCK_RAW):
+        try:
+            return socket.socket(socket.AF_INET, sock_type, socket.IPPROTO_ICMP)
+        except OSError:
+            continue
+    return None
+
+
+def _icmp_checksum(data: bytes) -> int:
+    """
+    Internet checksum (RFC 1071) of an ICMP message.
+    """
+    if len(data) % 2:
+        data += b"\0"
+    total = sum(struct.unpack(f"!{len(data) // 2}H", data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+
+def _echo_request(ident: int, seq: int) -> bytes:
+    """
+    Build an ICMP echo request packet.
+    """
+    header = struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + _ICMP_PAYLOAD)
+    return struct.pack("!BBHHH", _ICMP_ECHO_REQUEST, 0, checksum, ident, seq) + _ICMP_PAYLOAD
+
+
+def _icmp_sweep(sock: socket.socket, hosts: List[str]) -> List[str]:
+    """
+    Send one echo request to every host over a single ICMP socket and return,
+    in host order, those that reply within _PING_TIMEOUT of the last request.
+
+    Replies are drained between sends so a large sweep cannot overflow the
+    socket's receive buffer.
+    """
+    ident = os.getpid() & 0xFFFF
+    wanted = set(hosts)
+    replied = set()
+
+    def drain(timeout: float) -> None:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if not selector.select(max(0.0, remaining)):
+                if remaining <= 0:
+                    return
+                continue
+            data, (source, *_) = sock.recvfrom(2048)
+            if data and data[0] >> 4 == 4:
+                # Raw sockets (and some ping sockets) include the IPv4 header.
+                data = data[(data[0] & 0x0F) * 4:]
+            if len(data) < 8 or data[0] != _ICMP_ECHO_REPLY or source not in wanted:
+                continue
+            # Ping sockets rewrite the identifier; only raw sockets see other processes' replies.
+            if sock.type == socket.SOCK_RAW and struct.unpack("!H", data[4:6])[0] != ident:
+                continue
+            replied.add(source)
+
+    with selectors.DefaultSelector() as selector:
+        selector.register(sock, selectors.EVENT_READ)
+        for seq, ip in enumerate(hosts):
+            try:
+                sock.sendto(_echo_request(ident, seq & 0xFFFF), (ip, 0))
+            except OSError:
+                continue  # unreachable / not routable: not alive
+            drain(0.0)
+        drain(_PING_TIMEOUT)
+
+    return [ip for ip in hosts if ip in replied]
+
+
+def _scan_ports(target: str, ports: range) -> List[int]:
+    """
+    Return the ports of target that accept a TCP connection within _PORT_SCAN_TIMEOUT.
+
+    Up to _PORT_SCAN_CONCURRENCY non-blocking connects are kept in flight on one
+    selector; a connect completes when its socket turns writable, and SO_ERROR
+    tells whether it succeeded. Sockets past their deadline count as closed.
+    """
+    address = socket.gethostbyname(target)
+    pending = iter(ports)
+    open_ports: List[int] = []
+    deadlines: Dict[socket.socket, float] = {}
+
+    with selectors.DefaultSelector() as selector:
+        def finish(sock: socket.socket) -> None:
+            selector.unregister(sock)
+            sock.close()
+            del deadlines[sock]
+
+        def launch() -> None:
+            while len(deadlines) < _PORT_SCAN_CONCURRENCY:
+                port = next(pending, None)
+                if port is None:
+                    return
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                err = sock.connect_ex((address, port))
+                if err in _CONNECT_IN_PROGRESS:
+                    selector.register(sock, selectors.EVENT_WRITE, port)
+                    deadlines[sock] = time.monotonic() + _PORT_SCAN_TIMEOUT
+                    continue
+                if err == 0:
+                    open_ports.append(port)
+                    sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _ABORT_ON_CLOSE)
+                sock.close()
+
+        try:
+            launch()
+            while deadlines:
+                # Sockets are registered in deadline order, so the first is the earliest.
+                wait = max(0.0, next(iter(deadlines.values())) - time.monotonic())
+                for key, _ in selector.select(wait):
+                    sock = key.fileobj
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        open_ports.append(key.data)
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, _ABORT_ON_CLOSE)
+                    finish(sock)
+                now = time.monotonic()
+                for sock in [sock for sock, deadline in deadlines.items() if deadline <= now]:
+                    finish(sock)
+                launch()
+        finally:
+            for sock in list(deadlines):
+                finish(sock)
+
+    return sorted(open_ports)
+
+
+@functools.lru_cache(maxsize=1)
+def _audit_file_handler() -> QueueHandler:
+    """
+    Return the handler that feeds logs/security_audit.log, created once.
+
+    Records are only enqueued by the calling thread; a QueueListener thread
+    formats them and does the file writes and rotation, and is stopped (after
+    flushing the queue) at interpreter exit.
+    """
+    log_dir = Path("logs")
+    log_dir.mkdir(parents=True, exist_ok=True)
+    file_handler = RotatingFileHandler(
+        log_dir / "security_audit.log",
+        maxBytes=5 * 1024 * 1024,
+        backupCount=3,
+        encoding="utf-8",
+    )
+    file_handler.setLevel(logging.INFO)
+    file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    records: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(records, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
+    handler = QueueHandler(records)
+    handler.setLevel(logging.INFO)
+    return handler
+
+
+def _dumps_record(record: Dict[str, Any]) -> str:
+    """
+    Serialize an audit record to compact JSON, with orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+
+
 def _audit_log(func):
     """
     Decorator to wrap SecurityAudit methods to log a structured JSON record
@@ -26,20 +398,22 @@ def _audit_log(func):
     @functools.wraps(func)
     def wrapper(self, *args, **kwargs):
         start = datetime.now(timezone.utc)
+        start_ns = time.perf_counter_ns()
         resp = func(self, *args, **kwargs)
-        end = datetime.now(timezone.utc)
-        duration_ms = int((end - start).total_seconds() * 1000)
-
-        record: Dict[str, Any] = {
-            "timestamp": start.isoformat(),
-            "operation": func.__name__,
-            "parameters": kwargs or {},
-            "status": resp.get("status"),
-            "message": resp.get("message"),
-            "duration_ms": duration_ms,
-            "result": resp.get("result"),
-        }
-        self.logger.info(json.dumps(record, ensure_ascii=False))
+        duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
+
+        # Only build and serialize the record when INFO records are actually emitted.
+        if self.logger.isEnabledFor(logging.INFO):
+            record: Dict[str, Any] = {
+                "timestamp": start.isoformat(),
+                "operation": func.__name__,
+                "parameters": kwargs or {},
+                "status": resp.get("status"),
+                "message": resp.get("message"),
+                "duration_ms": duration_ms,
+                "result": resp.get("result"),
+            }
+            self.logger.info(_dumps_record(record))
         return resp
     return wrapper
 
@@ -60,39 +434,50 @@ class SecurityAudit:
     def __init__(self) -> None:
         """
         Initialize the SecurityAudit instance, detect the platform,
-        and attach a rotating handler for logs/security_audit.log.
+        and attach the queued handler for logs/security_audit.log.
         """
         self.logger = logger
 
         try:
-            from logging.handlers import RotatingFileHandler
-            log_dir = Path("logs")
-            log_dir.mkdir(parents=True, exist_ok=True)
-            exists = any(
-                isinstance(h, RotatingFileHandler) and "security_audit.log" in getattr(h, "baseFilename", "")
-                for h in self.logger.handlers
-            )
-            if not exists:
-                handler = RotatingFileHandler(
-                    log_dir / "security_audit.log",
-                    maxBytes=5 * 1024 * 1024,
-                    backupCount=3,
-                    encoding="utf-8",
-                )
-                handler.setLevel(logging.INFO)
-                handler.setFormatter(logging.Formatter("%(message)s"))
+            handler = _audit_file_handler()
+            if handler not in self.logger.handlers:
                 self.logger.addHandler(handler)
         except Exception:
             logger.warning("Could not set up security_audit.log handler", exc_info=True)
 
-        sys_name = platform.system().lower()
-        self.is_windows = sys_name.startswith("win")
-        self.is_linux = sys_name.startswith("linux")
+        self.is_windows = _IS_WINDOWS
+        self.is_linux = _IS_LINUX
         # treat WSL as linux for our purposes
-        self.is_wsl = False
-        if self.is_linux and Path("/proc/version").exists():
-            ver = Path("/proc/version").read_text().lower()
-            self.is_wsl = "microsoft" in ver or "wsl" in ver
+        self.is_wsl = _IS_WSL
+        # Whether `ip -j` (JSON output) works here; probed on first reconnaissance.
+        self._ip_json: Optional[bool] = None
+
+        # Resolve the platform's commands once; the operations just use these.
+        if self.is_windows:
+            self._net_cmd: Optional[List[str]] = ["cmd.exe", "/c", "netstat", "-ano"]
+            self._arp_cmd = ["cmd.exe", "/c", "arp", "-a"]
+            self._has_ip = False
+            self._ping_cmd = ["ping", "-n", "1", "-w", "1000"]
+            self._kill_cmd = ["taskkill", "/F", "/PID"]
+            self._firewall_cmd = ["netsh"] + _NETSH_ADD_RULE
+            self._block_ip_rule = lambda ip: [f"name=Block_{ip}", "dir=in", "action=block", f"remoteip={ip}"]
+            self._block_port_rule = lambda port: [
+                f"name=BlockPort_{port}", "dir=in", "action=block", "protocol=TCP", f"localport={port}"
+            ]
+        else:
+            if _which("netstat"):
+                self._net_cmd = ["netstat", "-tunap"]
+            elif _which("ss"):
+                self._net_cmd = ["ss", "-tunap"]
+            else:
+                self._net_cmd = None
+            self._has_ip = _which("ip") is not None
+            self._arp_cmd = ["ip", "neigh"] if self._has_ip else ["arp", "-n"]
+            self._ping_cmd = ["ping", "-c", "1", "-W", "1"]
+            self._kill_cmd = ["kill", "-9"]
+            self._firewall_cmd = ["iptables"]
+            self._block_ip_rule = lambda ip: ["-A", "INPUT", "-s", ip, "-j", "DROP"]
+            self._block_port_rule = lambda port: ["-A", "INPUT", "-p", "tcp", "--dport", str(port), "-j", "DROP"]
 
         self.logger.debug(
             f"Initialized SecurityAudit (windows={self.is_windows}, wsl={self.is_wsl}, linux={self.is_linux})"
@@ -103,30 +488,106 @@ class SecurityAudit:
         Execute a shell command, optionally via Windows cmd.exe /c.
         """
         full_cmd = (["cmd.exe", "/c"] + cmd) if (use_cmd_exe and self.is_windows) else cmd
-        return subprocess.run(full_cmd, check=True, capture_output=True, text=True)
+        return subprocess.run(full_cmd, check=True, capture_output=True)
 
-    def _safe_run(self, cmd: List[str], use_cmd_exe: bool = False) -> str:
+    def _safe_run(self, cmd: List[str], use_cmd_exe: bool = False) -> bytes:
         """
-        Like _run_shell but returns stdout or empty string on error.
+        Like _run_shell but returns stdout (undecoded) or empty bytes on error.
         """
         try:
             return self._run_shell(cmd, use_cmd_exe).stdout
         except (subprocess.CalledProcessError, FileNotFoundError):
-            return ""
+            return b""
+
+    def _iter_shell(self, cmd: List[str], use_cmd_exe: bool = False) -> Iterator[bytes]:
+        """
+        Like _safe_run but yields stdout line by line as the command produces it,
+        so parsing overlaps with the command; yields nothing if it cannot start.
+        """
+        full_cmd = (["cmd.exe", "/c"] + cmd) if (use_cmd_exe and self.is_windows) else cmd
+        try:
+            proc = subprocess.Popen(
+                full_cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+            )
+        except OSError:
+            return
+        with proc:
+            yield from proc.stdout
+
+    def _add_firewall_rules(self, rules: List[List[str]]) -> None:
+        """
+        Add firewall rules, in one transaction when there are several.
+
+        Each rule is the argument list after `iptables` (Linux) or after
+        `netsh advfirewall firewall add rule` (Windows). Several rules are applied
+        by a single `iptables-restore --noflush` (atomic, one table update) or one
+        `netsh -f` script instead of a process per rule. A lone rule, arguments
+        that cannot be scripted safely, or a failed iptables-restore fall back to
+        one command per rule.
+        """
+        if len(rules) > 1 and all(_BATCH_ARG_RE.fullmatch(arg) for rule in rules for arg in rule):
+            if self.is_windows:
+                self._run_netsh_script(rules)
+                return
+            payload = "*filter\n" + "".join(" ".join(rule) + "\n" for rule in rules) + "COMMIT\n"
+            try:
+                subprocess.run(
+                    ["iptables-restore", "--noflush"], input=payload, check=True, capture_output=True, text=True
+                )
+                return
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                self.logger.debug("iptables-restore batch failed; adding rules one by one", exc_info=True)
+
+        for rule in rules:
+            self._safe_run(self._firewall_cmd + rule)
 
-    def _parse_recon(self, raw: str) -> Dict[str, Any]:
+    def _run_netsh_script(self, rules: List[List[str]]) -> None:
         """
-        Parse netstat/ss + arp raw output into structured JSON.
+        Add several Windows firewall rules through one `netsh -f` script.
         """
-        parts = raw.split("\n\n", 1)
-        net_raw = parts[0]
-        arp_raw = parts[1] if len(parts) > 1 else ""
+        with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as fh:
+            fh.writelines(" ".join(_NETSH_ADD_RULE + rule) + "\n" for rule in rules)
+        try:
+            self._safe_run(["netsh", "-f", fh.name])
+        finally:
+            os.remove(fh.name)
+
+    def _ip_json_neighbors(self) -> Optional[List[Dict[str, str]]]:
+        """
+        Read the neighbor table from `ip -j neigh` (iproute2 JSON output).
 
+        Returns None when this iproute2 has no JSON mode (remembered for later
+        calls), so the caller parses the text output instead.
+        """
+        if self._ip_json is False:
+            return None
+        raw = self._safe_run(["ip", "-j", "neigh"])
+        try:
+            entries = orjson.loads(raw) if orjson is not None else json.loads(raw)
+        except ValueError:
+            entries = None
+        self._ip_json = isinstance(entries, list)
+        if not self._ip_json:
+            return None
+        # Same records as the text path: entries with a link-layer address only.
+        return [
+            {"ip": entry["dst"], "mac": entry["lladdr"], "state": (entry.get("state") or [""])[0].upper()}
+            for entry in entries
+            if isinstance(entry, dict) and "dst" in entry and "lladdr" in entry
+        ]
+
+    def _parse_recon(self, net_lines: Iterable[bytes], arp_lines: Iterable[bytes]) -> Dict[str, Any]:
+        """
+        Parse netstat/ss and arp output lines (bytes) into structured JSON.
+        """
         connections: List[Dict[str, str]] = []
-        for line in net_raw.splitlines():
-            m = re.match(r"^(tcp|udp)\s+\S+\s+\S+\s+(\S+)\s+(\S+)\s+(\S+)", line)
+        for line in net_lines:
+            # Cheap prefix test first: headers and other lines skip the regex.
+            if not line.startswith((b"tcp", b"udp")):
+                continue
+            m = _NET_RE.match(line)
             if m:
-                proto, local, remote, state = m.groups()
+                proto, local, remote, state = (group.decode("utf-8", "replace") for group in m.groups())
                 connections.append({
                     "proto": proto,
                     "local": local,
@@ -135,10 +596,12 @@ class SecurityAudit:
                 })
 
         neighbors: List[Dict[str, str]] = []
-        for line in arp_raw.splitlines():
-            m = re.match(r"^(\S+)\s+.*lladdr\s+([\da-f:]+)\s+(\S+)", line, re.I)
+        for line in arp_lines:
+            if b"lladdr" not in line.lower():
+                continue
+            m = _ARP_RE.match(line)
             if m:
-                ip, mac, state = m.groups()
+                ip, mac, state = (group.decode("utf-8", "replace") for group in m.groups())
                 neighbors.append({
                     "ip": ip,
                     "mac": mac,
@@ -159,29 +622,26 @@ class SecurityAudit:
                 "result": { "connections": [...], "neighbors": [...] }
             }
         """
-        if self.is_windows:
-            net = self._safe_run(["netstat", "-ano"], use_cmd_exe=True)
-            arp = self._safe_run(["arp", "-a"], use_cmd_exe=True)
+        # Structured sources first (IP Helper tables, `ip -j`); text parsing otherwise.
+        connections = _windows_connections() if self.is_windows else None
+        if connections is not None or not self._net_cmd:
+            net = iter(())
         else:
-            if shutil.which("netstat"):
-                net = self._safe_run(["netstat", "-tunap"])
-            elif shutil.which("ss"):
-                net = self._safe_run(["ss", "-tunap"])
-            else:
-                net = ""
-            arp = (
-                self._safe_run(["ip", "neigh"]) if shutil.which("ip")
-                else self._safe_run(["arp", "-n"])
-            )
-
-        combined = f"{net}\n\n{arp}"
-        structured = self._parse_recon(combined)
+            net = self._iter_shell(self._net_cmd)
+        neighbors = self._ip_json_neighbors() if self._has_ip else None
+        arp = iter(()) if neighbors is not None else self._iter_shell(self._arp_cmd)
+
+        structured = self._parse_recon(net, arp)
+        if connections is not None:
+            structured["connections"] = connections
+        if neighbors is not None:
+            structured["neighbors"] = neighbors
         return {"status": True, "message": "Recon complete", "result": structured}
 
     @_audit_log
     def detect_processes(self) -> Dict[str, Any]:
         """
-        Enumerate running processes via psutil.
+        Enumerate running processes (from /proc on Linux, via psutil elsewhere).
 
         Returns:
             {
@@ -191,10 +651,15 @@ class SecurityAudit:
             }
         """
         try:
-            procs = [
-                {"pid": p.info["pid"], "user": p.info["username"], "name": p.info["name"]}
-                for p in psutil.process_iter(["pid", "name", "username"])
-            ]
+            if self.is_linux and pwd is not None:
+                procs = _scan_proc()
+            else:
+                # Imported on first use: psutil is only needed off Linux and is slow to load.
+                import psutil
+                procs = [
+                    {"pid": p.info["pid"], "user": p.info["username"], "name": p.info["name"]}
+                    for p in psutil.process_iter(["pid", "name", "username"])
+                ]
             return {"status": True, "message": "Process audit complete", "result": {"processes": procs}}
         except Exception as e:
             self.logger.error("Process detection error", exc_info=True)
@@ -222,35 +687,9 @@ class SecurityAudit:
         if start_port < 1 or end_port < start_port:
             return {"status": False, "message": "Invalid port range", "result": None}
 
-        open_ports: List[int] = []
         try:
-            if self.is_windows:
-                # Windows via PowerShell if available
-                if shutil.which("powershell"):
-                    cmd = (
-                        f"1..{end_port} | ForEach-Object {{ "
-                        f"if (Test-NetConnection -ComputerName {target} -Port $_ -Quiet) {{ Write-Output $_ }} }}"
-                    )
-                    out = self._safe_run(["powershell", "-Command", cmd], use_cmd_exe=True)
-                    open_ports = [int(p) for p in out.split() if p.isdigit()]
-                else:
-                    # fallback to netstat parsing
-                    net = self._safe_run(["netstat", "-an"], use_cmd_exe=True)
-                    for line in net.splitlines():
-                        parts = line.split()
-                        # look for lines ending with LISTENING or LISTEN
-                        if parts and ("LISTEN" in parts[-1].upper()):
-                            # local address is at index 1
-                            addr = parts[1]
-                            port_str = addr.rsplit(":", 1)[-1]
-                            if port_str.isdigit():
-                                open_ports.append(int(port_str))
-            else:
-                for port in range(start_port, end_port + 1):
-                    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-                        sock.settimeout(0.3)
-                        if sock.connect_ex((target, port)) == 0:
-                            open_ports.append(port)
+            # Pure-socket scan on every platform (no PowerShell start-up on Windows).
+            open_ports = _scan_ports(target, range(start_port, end_port + 1))
 
             summary = {
                 "target": target,
@@ -279,18 +718,34 @@ class SecurityAudit:
                 }
             }
         """
+        import ipaddress  # only network_scan needs it; keeps module import light
+
         try:
             net = ipaddress.ip_network(network, strict=False)
         except ValueError as e:
             return {"status": False, "message": f"Invalid network '{network}': {e}", "result": None}
 
+        hosts = [str(host) for host in net.hosts()]
         alive: List[str] = []
-        for host in net.hosts():
-            ip = str(host)
-            cmd = ["ping", "-n", "1", "-w", "1000", ip] if self.is_windows else ["ping", "-c", "1", "-W", "1", ip]
-            out = self._safe_run(cmd)
-            if out and ("ttl=" in out.lower() or "bytes=" in out.lower()):
-                alive.append(ip)
+
+        # IPv4 off Windows: one ICMP socket for the whole sweep, no ping processes.
+        if hosts and net.version == 4 and not self.is_windows:
+            sock = _open_icmp_socket()
+            if sock is not None:
+                with sock:
+                    alive = _icmp_sweep(sock, hosts)
+                result = {"network": network, "alive_hosts": alive, "total_alive": len(alive)}
+                return {"status": True, "message": "Network scan complete", "result": result}
+
+        def is_alive(ip: str) -> bool:
+            out = self._safe_run(self._ping_cmd + [ip]).lower()
+            return b"ttl=" in out or b"bytes=" in out
+
+        # Each ping is an independent, mostly idle subprocess: run them concurrently
+        # so a sweep takes about one timeout instead of one per host.
+        if hosts:
+            with ThreadPoolExecutor(max_workers=min(_PING_WORKERS, len(hosts))) as pool:
+                alive = [ip for ip, up in zip(hosts, pool.map(is_alive, hosts)) if up]
 
         result = {
             "network": network,
@@ -327,36 +782,17 @@ class SecurityAudit:
         summary = {"blocked_ips": [], "killed_pids": [], "blocked_ports": [], "errors": []}
 
         try:
-            for ip in bad_ips:
-                cmd = (
-                    ["netsh", "advfirewall", "firewall", "add", "rule",
-                     f"name=Block_{ip}", "dir=in", "action=block", f"remoteip={ip}"]
-                    if self.is_windows
-                    else ["iptables", "-A", "INPUT", "-s", ip, "-j", "DROP"]
-                )
-                self._safe_run(cmd)
-                summary["blocked_ips"].append(ip)
+            # IP and port blocks are collected and applied in one batch.
+            rules = [self._block_ip_rule(ip) for ip in bad_ips] + [self._block_port_rule(p) for p in bad_ports]
+            if rules:
+                self._add_firewall_rules(rules)
+            summary["blocked_ips"].extend(bad_ips)
+            summary["blocked_ports"].extend(bad_ports)
 
             for pid in bad_pids:
-                cmd = (
-                    ["taskkill", "/PID", str(pid), "/F"]
-                    if self.is_windows
-                    else ["kill", "-9", str(pid)]
-                )
-                self._safe_run(cmd)
+                self._safe_run(self._kill_cmd + [str(pid)])
                 summary["killed_pids"].append(pid)
 
-            for port in bad_ports:
-                cmd = (
-                    ["netsh", "advfirewall", "firewall", "add", "rule",
-                     f"name=BlockPort_{port}", "dir=in", "action=block",
-                     "protocol=TCP", f"localport={port}"]
-                    if self.is_windows
-                    else ["iptables", "-A", "INPUT", "-p", "tcp", "--dport", str(port), "-j", "DROP"]
-                )
-                self._safe_run(cmd)
-                summary["blocked_ports"].append(port)
-
             return {"status": True, "message": "Defense complete", "result": summary}
         except Exception as e:
             self.logger.error("Defense actions error", exc_info=True)
@@ -397,6 +833,38 @@ class SecurityAudit:
             return {"status": False, "message": str(e), "result": {"error": str(e)}}
 
 
+# Parameters each dispatcher operation accepts, in call order, and their defaults.
+_OPS_PARAMS: Dict[str, Tuple[str, ...]] = {
+    "reconnaissance": (),
+    "detect_processes": (),
+    "port_scan": ("target", "start_port", "end_port"),
+    "network_scan": ("network",),
+    "defense_actions": ("bad_ips", "bad_pids", "bad_ports"),
+    "update_system": (),
+}
+_ALLOWED = {operation: frozenset(params) for operation, params in _OPS_PARAMS.items()}
+_OP_METHODS = {operation: getattr(SecurityAudit, operation) for operation in _OPS_PARAMS}
+# Immutable empty defaults; defense_actions turns them into fresh lists.
+_DEFAULTS: Dict[str, Any] = {
+    "start_port": 1,
+    "end_port": 1024,
+    "bad_ips": (),
+    "bad_pids": (),
+    "bad_ports": (),
+}
+
+
+@functools.lru_cache(maxsize=1)
+def _get_audit() -> SecurityAudit:
+    """
+    Return the shared SecurityAudit instance, created on first use.
+
+    The instance holds no per-call state, so the log handler setup and platform
+    flags are done once rather than on every dispatch.
+    """
+    return SecurityAudit()
+
+
 def security_audit_dispatcher(operation: str, **kwargs: Any) -> Dict[str, Any]:
     """
     Dispatch a SecurityAudit operation by name, enforcing its required and
@@ -404,52 +872,36 @@ def security_audit_dispatcher(operation: str, **kwargs: Any) -> Dict[str, Any]:
     """
     logger.info(f"[security_audit_dispatcher] operation={operation!r}, parameters={kwargs!r}")
 
-    sa = SecurityAudit()
-
-    ops_params = {
-        "reconnaissance": [],
-        "detect_processes": [],
-        "port_scan": ["target", "start_port", "end_port"],
-        "network_scan": ["network"],
-        "defense_actions": ["bad_ips", "bad_pids", "bad_ports"],
-        "update_system": []
-    }
-    defaults = {
-        "start_port": 1,
-        "end_port": 1024,
-        "bad_ips": [],
-        "bad_pids": [],
-        "bad_ports": []
-    }
-
-    if operation not in ops_params:
+    method = _OP_METHODS.get(operation)
+    if method is None:
         msg = f"Unsupported operation '{operation}'."
         logger.error(msg)
         return {"status": False, "message": msg, "result": None}
 
-    allowed = ops_params[operation]
+    sa = _get_audit()
+    params = _OPS_PARAMS[operation]
 
     if operation == "port_scan" and "target" not in kwargs:
         return {"status": False, "message": "port_scan requires 'target'", "result": None}
     if operation == "network_scan" and "network" not in kwargs:
         return {"status": False, "message": "network_scan requires 'network' (CIDR)", "result": None}
 
-    unexpected = set(kwargs) - set(allowed)
+    unexpected = kwargs.keys() - _ALLOWED[operation]
     if unexpected:
         msg = f"Unexpected parameter(s) for '{operation}': {', '.join(sorted(unexpected))}"
         logger.error(msg)
         return {"status": False, "message": msg, "result": None}
 
     call_args: Dict[str, Any] = {}
-    for param in allowed:
+    for param in params:
         if param in kwargs:
             call_args[param] = kwargs[param]
-        elif param in defaults:
-            call_args[param] = defaults[param]
+        elif param in _DEFAULTS:
+            call_args[param] = _DEFAULTS[param]
 
     try:
         logger.info(f"[security_audit_dispatcher] invoking {operation} with {call_args}")
-        resp = getattr(sa, operation)(**call_args)
+        resp = method(sa, **call_args)
         logger.info(f"[security_audit_dispatcher] {operation} completed: status={resp.get('status')}")
         return resp
     except Exception as e:
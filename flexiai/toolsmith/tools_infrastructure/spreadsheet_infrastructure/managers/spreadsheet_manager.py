@@ -14,16 +14,32 @@ Defines SpreadsheetManager, responsible for comprehensive spreadsheet operations
 - Data validation (set, remove)
 - Formatting (cell styling, conditional formatting)
 - Chart operations (create, update, remove)
+
+openpyxl picks lxml as its XML backend automatically when it is installed, which
+makes both the read-only and regular load/save paths considerably faster; lxml is
+therefore a required dependency and a warning is logged at import if it is missing.
 """
 
 import os
+import re
+import atexit
 import logging
+import threading
+import time
+import zipfile
+import posixpath
+import functools
+import contextlib
+import xml.etree.ElementTree as ET
 import openpyxl
+import numpy as np
 import pandas as pd
 
-from typing import List, Dict, Any, Optional, Tuple, Union
+from itertools import islice
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Sequence, Tuple, Union
 from openpyxl import load_workbook, Workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from openpyxl.xml import LXML
 from openpyxl.styles import Font, PatternFill, Color
 from openpyxl.utils import get_column_letter, column_index_from_string
 from openpyxl.utils.cell import coordinate_from_string, range_boundaries
@@ -33,27 +49,458 @@ from openpyxl.chart.label import DataLabelList
 from openpyxl.chart import BarChart, LineChart, PieChart, Reference, Series, ScatterChart, AreaChart, BubbleChart
 
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.exceptions.spreadsheet_exceptions import SpreadsheetError
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import get_full_path, check_file_exists
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import (
+    get_full_path,
+    LOAD_READ_KWARGS
+)
 
 
 logger = logging.getLogger(__name__)
 
+if not LXML:
+    logger.warning("lxml is not available; openpyxl falls back to the slower stdlib XML parser.")
+
+
+# Cell/range references are parsed by regex; callers such as create_pivot_table
+# and the chart methods tend to repeat the same references, so memoize the parse.
+_range_boundaries = functools.lru_cache(maxsize=128)(range_boundaries)
+_coordinate_from_string = functools.lru_cache(maxsize=128)(coordinate_from_string)
+
+
+# Column letter <-> 1-based index tables over the range openpyxl accepts (A..ZZZ),
+# so column resolution is a dict lookup instead of a parse that raises on misses.
+_COL_IDX_TO_LETTER: Tuple[str, ...] = tuple(get_column_letter(i) for i in range(1, 18279))
+_COL_LETTER_TO_IDX: Dict[str, int] = {letter: i for i, letter in enumerate(_COL_IDX_TO_LETTER, start=1)}
+
+
+def _equals_condition(target: Any) -> Callable[[Any], bool]:
+    return lambda x: x == target
+
+
+def _greater_than_condition(target: Any) -> Callable[[Any], bool]:
+    threshold = float(target)
+    return lambda x: x is not None and float(x) > threshold
+
+
+def _less_than_condition(target: Any) -> Callable[[Any], bool]:
+    threshold = float(target)
+    return lambda x: x is not None and float(x) < threshold
+
+
+def _contains_condition(target: Any) -> Callable[[Any], bool]:
+    return lambda x: x is not None and target in str(x)
+
+
+def _startswith_condition(target: Any) -> Callable[[Any], bool]:
+    return lambda x: x is not None and str(x).startswith(target)
+
+
+def _endswith_condition(target: Any) -> Callable[[Any], bool]:
+    return lambda x: x is not None and str(x).endswith(target)
+
+
+def _matches_condition(target: Any) -> Callable[[Any], bool]:
+    search = re.compile(target).search
+    return lambda x: x is not None and search(str(x)) is not None
+
+
+def _numeric_mask(compare: Callable[[pd.Series, float], pd.Series]) -> Callable[[pd.Series, Any], Optional[pd.Series]]:
+    def build(values: pd.Series, target: Any) -> Optional[pd.Series]:
+        threshold = float(target)
+        numbers = pd.to_numeric(values, errors="coerce")
+        if (numbers.isna() & values.notna()).any():
+            # Let the per-row predicate handle (and report) non-numeric cells.
+            return None
+        return compare(numbers, threshold)
+    return build
+
+
+def _text_mask(method: str) -> Callable[[pd.Series, Any], pd.Series]:
+    def build(values: pd.Series, target: Any) -> pd.Series:
+        text = getattr(values.astype(str).str, method)
+        matched = text(target, regex=False) if method == "contains" else text(target)
+        return values.notna() & matched
+    return build
+
+
+def _regex_mask(values: pd.Series, target: Any) -> pd.Series:
+    return values.notna() & values.astype(str).str.contains(re.compile(target), regex=True)
+
+
+# Vectorized counterparts of _CONDITION_BUILDERS, used by filter_rows when the
+# whole sheet is scanned anyway. Each builder maps (column values, condition
+# value) to a boolean mask, or None when the row-wise predicate must decide.
+_CONDITION_MASKS: Dict[str, Callable[[pd.Series, Any], Optional[pd.Series]]] = {
+    "equals": lambda values, target: values == target,
+    "greater_than": _numeric_mask(lambda numbers, threshold: numbers > threshold),
+    "less_than": _numeric_mask(lambda numbers, threshold: numbers < threshold),
+    "contains": _text_mask("contains"),
+    "startswith": _text_mask("startswith"),
+    "endswith": _text_mask("endswith"),
+    "matches": _regex_mask,
+}
+
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+
+def _read_sheet_dimensions(file_path: str) -> Optional[Dict[str, Dict[str, int]]]:
+    """
+    Read each sheet's used range straight from the xlsx archive.
+
+    Only xl/workbook.xml, its relationships and the head of every worksheet
+    part are parsed: the <dimension> element precedes <sheetData>, so no
+    cell (and no shared string) is ever read. Some writers leave a stale
+    single-cell dimension (usually "A1") on a filled sheet, so for those the
+    row and cell references of the sheet are scanned instead.
+
+    Args:
+        file_path (str): Path to the workbook file.
+
+    Returns:
+        Optional[Dict[str, Dict[str, int]]]: {sheet_name: {'rows': int, 'columns': int}},
+        in workbook order, or None if any sheet lacks a <dimension> element or the
+        package layout is not the standard one.
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        try:
+            workbook_xml = ET.fromstring(archive.read("xl/workbook.xml"))
+            rels_xml = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+        except KeyError:
+            return None
+        targets = {
+            rel.get("Id"): rel.get("Target", "")
+            for rel in rels_xml.iter(f"{_PKG_REL_NS}Relationship")
+        }
+
+        summary = {}
+        for sheet in workbook_xml.iter(f"{_MAIN_NS}sheet"):
+            target = targets.get(sheet.get(f"{_REL_NS}id"))
+            if not target:
+                return None
+            part = target.lstrip("/") if target.startswith("/") else posixpath.normpath(f"xl/{target}")
+            ref = None
+            try:
+                with archive.open(part) as stream:
+                    events = ET.iterparse(stream, events=("start", "end"))
+                    for event, element in events:
+                        if event != "start":
+                            continue
+                        if element.tag == f"{_MAIN_NS}dimension":
+                            ref = element.get("ref")
+                            break
+                        if element.tag == f"{_MAIN_NS}sheetData":
+                            break
+                    if ref and ":" not in ref:
+                        max_row, max_col = _scan_sheet_extent(events)
+            except KeyError:
+                return None
+            if not ref:
+                return None
+            if ":" in ref:
+                _, _, max_col, max_row = _range_boundaries(ref)
+            summary[sheet.get("name")] = {"rows": max_row, "columns": max_col}
+        return summary
+
+
+def _scan_sheet_extent(events: Iterator[Tuple[str, Any]]) -> Tuple[int, int]:
+    """
+    Find the last row and column of a worksheet from its <row> and <c> references.
+
+    Args:
+        events (Iterator[Tuple[str, Any]]): iterparse ("start", "end") events of the
+            worksheet part, positioned anywhere before <sheetData>.
+
+    Returns:
+        Tuple[int, int]: (rows, columns), at least (1, 1) as openpyxl reports
+        for an empty sheet.
+    """
+    max_row = max_col = 1
+    row_idx = col_idx = 0
+    for event, element in events:
+        if event == "end":
+            if element.tag == f"{_MAIN_NS}row":
+                element.clear()
+            continue
+        if element.tag == f"{_MAIN_NS}row":
+            row_idx = int(element.get("r") or row_idx + 1)
+            col_idx = 0
+            max_row = max(max_row, row_idx)
+        elif element.tag == f"{_MAIN_NS}c":
+            cell_ref = element.get("r")
+            col_idx = _COL_LETTER_TO_IDX[cell_ref.rstrip("0123456789")] if cell_ref else col_idx + 1
+            max_col = max(max_col, col_idx)
+    return max_row, max_col
+
+
+# Workbooks staged by begin_transaction(), keyed by absolute file path. While a
+# transaction is open every SpreadsheetManager for that file shares the staged
+# workbook and only marks it dirty; the file is written once on commit, when a
+# timer finds the transaction idle for TRANSACTION_IDLE_SECONDS, or at exit.
+_transactions: Dict[str, Dict[str, Any]] = {}
+_transactions_lock = threading.Lock()
+
+TRANSACTION_IDLE_SECONDS = 300.0
+
+# One re-entrant lock per workbook path, with the number of threads using it.
+# Mutating SpreadsheetManager methods and transaction commit/abort hold it, so
+# threads never edit (or save) the same workbook at once; callers can hold it
+# across a whole load -> mutate -> save. The entry is dropped with its last user.
+_file_locks: Dict[str, List[Any]] = {}
+_file_locks_lock = threading.Lock()
+
+
+def _transaction_key(file_path: str) -> str:
+    return os.path.abspath(file_path)
+
+
+@contextlib.contextmanager
+def workbook_lock(file_path: str, blocking: bool = True) -> Iterator[bool]:
+    """
+    Hold the lock serializing writes to a workbook file.
+
+    Args:
+        file_path (str): Path to the workbook file.
+        blocking (bool, optional): Wait for the lock. With False the block runs
+            either way and the yielded flag tells whether the lock was taken.
+
+    Yields:
+        bool: True if the lock is held, which is always the case when blocking.
+    """
+    key = _transaction_key(file_path)
+    with _file_locks_lock:
+        entry = _file_locks.get(key)
+        if entry is None:
+            entry = _file_locks[key] = [threading.RLock(), 0]
+        entry[1] += 1
+    acquired = entry[0].acquire(blocking)
+    try:
+        yield acquired
+    finally:
+        if acquired:
+            entry[0].release()
+        with _file_locks_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                del _file_locks[key]
+
+
+def _writes_workbook(method: Callable) -> Callable:
+    """Run a mutating SpreadsheetManager method under its workbook's lock."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with workbook_lock(self.file_path):
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _arm_idle_timer(key: str, state: Dict[str, Any], delay: float) -> None:
+    timer = threading.Timer(delay, _flush_if_idle, (key, state))
+    timer.daemon = True
+    state["timer"] = timer
+    timer.start()
+
+
+def _flush_if_idle(key: str, state: Dict[str, Any]) -> None:
+    """
+    Commit a transaction nobody has touched for TRANSACTION_IDLE_SECONDS.
+
+    Runs on the transaction's timer. A transaction used since the timer was set,
+    or whose workbook is locked by a writer, gets the timer re-armed; one whose
+    save fails stays open, so its edits can still be committed or aborted.
+    """
+    with _transactions_lock:
+        if _transactions.get(key) is not state:
+            return
+        remaining = state["last_used"] + TRANSACTION_IDLE_SECONDS - time.monotonic()
+    if remaining > 0:
+        _arm_idle_timer(key, state, remaining)
+        return
+    # Not waiting keeps the timer from blocking behind a long-running writer.
+    with workbook_lock(key, blocking=False) as acquired:
+        if not acquired:
+            _arm_idle_timer(key, state, TRANSACTION_IDLE_SECONDS)
+            return
+        with _transactions_lock:
+            if _transactions.get(key) is not state:
+                return
+        try:
+            commit_transaction(key)
+            logger.warning(f"Idle transaction for workbook '{key}' was committed automatically.")
+        except SpreadsheetError as e:
+            logger.error(f"Failed to flush idle transaction for workbook '{key}': {e}")
+            _arm_idle_timer(key, state, TRANSACTION_IDLE_SECONDS)
+
+
+@atexit.register
+def _commit_open_transactions() -> None:
+    """Save transactions still open at interpreter exit instead of losing their edits."""
+    with _transactions_lock:
+        keys = list(_transactions)
+    for key in keys:
+        try:
+            if commit_transaction(key):
+                logger.warning(f"Open transaction for workbook '{key}' was committed at exit.")
+        except SpreadsheetError as e:
+            logger.error(f"Failed to commit open transaction for workbook '{key}' at exit: {e}")
+
+
+def _staged_transaction(file_path: str) -> Optional[Dict[str, Any]]:
+    with _transactions_lock:
+        state = _transactions.get(_transaction_key(file_path))
+        if state is not None:
+            state["last_used"] = time.monotonic()
+        return state
+
+
+def has_open_transaction(file_path: str) -> bool:
+    """
+    Tell whether a workbook currently has staged, uncommitted writes routed to it.
+
+    Args:
+        file_path (str): Path to the workbook file.
+
+    Returns:
+        bool: True if a transaction is open for the file.
+    """
+    # A lookup, not a use: asking must not keep the transaction from going idle.
+    with _transactions_lock:
+        return _transaction_key(file_path) in _transactions
+
+
+def begin_transaction(file_path: str) -> None:
+    """
+    Load a workbook once and stage all following writes to it in memory.
+
+    Args:
+        file_path (str): Path to the workbook file.
+
+    Raises:
+        SpreadsheetError: If a transaction is already open or loading fails.
+    """
+    key = _transaction_key(file_path)
+    with workbook_lock(file_path), _transactions_lock:
+        if key in _transactions:
+            raise SpreadsheetError(f"A transaction is already open for '{file_path}'.")
+        try:
+            workbook = openpyxl.load_workbook(file_path)
+        except Exception as e:
+            logger.error(f"Failed to begin transaction on '{file_path}': {e}")
+            raise SpreadsheetError(f"Failed to begin transaction on '{file_path}': {e}") from e
+        state = _transactions[key] = {"workbook": workbook, "dirty": False, "last_used": time.monotonic()}
+        _arm_idle_timer(key, state, TRANSACTION_IDLE_SECONDS)
+    logger.info(f"Transaction started for workbook '{file_path}'.")
+
+
+def commit_transaction(file_path: str) -> bool:
+    """
+    Close the open transaction on a workbook, saving it if anything changed.
+
+    The transaction is only closed once the save succeeded; if saving fails it
+    stays open, so the commit can be retried or the edits discarded with
+    abort_transaction().
+
+    Args:
+        file_path (str): Path to the workbook file.
+
+    Returns:
+        bool: True if the workbook was written, False if there was nothing to save.
+
+    Raises:
+        SpreadsheetError: If no transaction is open or saving fails.
+    """
+    key = _transaction_key(file_path)
+    with workbook_lock(file_path):
+        with _transactions_lock:
+            state = _transactions.get(key)
+        if state is None:
+            raise SpreadsheetError(f"No open transaction for '{file_path}'.")
+        if state["dirty"]:
+            try:
+                state["workbook"].save(file_path)
+            except Exception as e:
+                logger.error(f"Failed to commit transaction on '{file_path}': {e}")
+                raise SpreadsheetError(f"Failed to commit transaction on '{file_path}': {e}") from e
+        with _transactions_lock:
+            _transactions.pop(key, None)
+    state["timer"].cancel()
+    if not state["dirty"]:
+        logger.info(f"Transaction for workbook '{file_path}' committed with no changes.")
+        return False
+    logger.info(f"Transaction for workbook '{file_path}' committed.")
+    return True
+
+
+def abort_transaction(file_path: str) -> bool:
+    """
+    Close the open transaction on a workbook, discarding its staged edits.
+
+    Args:
+        file_path (str): Path to the workbook file.
+
+    Returns:
+        bool: True if unsaved changes were discarded, False if there were none.
+
+    Raises:
+        SpreadsheetError: If no transaction is open.
+    """
+    with workbook_lock(file_path):
+        with _transactions_lock:
+            state = _transactions.pop(_transaction_key(file_path), None)
+    if state is None:
+        raise SpreadsheetError(f"No open transaction for '{file_path}'.")
+    state["timer"].cancel()
+    state["workbook"].close()
+    logger.info(f"Transaction for workbook '{file_path}' aborted.")
+    return state["dirty"]
+
+
+# Predicate factories for filter_rows, keyed by condition type. Each factory
+# converts the condition value once and returns a specialised predicate.
+_CONDITION_BUILDERS: Dict[str, Callable[[Any], Callable[[Any], bool]]] = {
+    "equals": _equals_condition,
+    "greater_than": _greater_than_condition,
+    "less_than": _less_than_condition,
+    "contains": _contains_condition,
+    "startswith": _startswith_condition,
+    "endswith": _endswith_condition,
+    "matches": _matches_condition,
+}
+
 
 class SpreadsheetManager:
     """
     Manages spreadsheet operations using openpyxl.
     """
 
-    def __init__(self, file_path: str, load_workbook: bool = True):
+    def __init__(self, file_path: str, load_workbook: bool = True, read_only: bool = False):
         """
         Initialize the SpreadsheetManager.
 
         Args:
             file_path (str): Path to the workbook file.
             load_workbook (bool): Whether to load the workbook on init. If False, workbook is not loaded.
+            read_only (bool): If True, open the workbook in openpyxl's read-only (streaming) mode.
+                Only retrieval methods may be used, and close() must be called when done.
         """
         self.file_path = file_path
+        self.read_only = read_only
         self.workbook = None
+        # Read-only handle for the retrieval methods while no workbook is loaded;
+        # see _ensure_ro_workbook_loaded().
+        self._ro_workbook = None
+        # (sheet_name, identifier, has_headers) -> 0-based column index,
+        # sheet_name -> {header: index} and sheet_name -> last used row; see
+        # _resolve_column_identifier(), _header_index() and _row_count(). All
+        # are cleared whenever the workbook may change.
+        self._column_index_cache: Dict[Tuple[str, str, bool], int] = {}
+        self._header_index_cache: Dict[str, Dict[Any, int]] = {}
+        self._row_count_cache: Dict[str, int] = {}
+        # Nesting depth of batch() blocks and whether a save was deferred by one.
+        self._batch_depth = 0
+        self._dirty = False
         logger.debug(f"Initialized SpreadsheetManager with path '{self.file_path}'.")
         if load_workbook:
             self._load_workbook()
@@ -86,9 +533,19 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If loading fails or file not found.
         """
+        self._clear_sheet_caches()
+        staged = _staged_transaction(self.file_path)
+        if staged is not None:
+            # Reads and writes inside a transaction see the staged workbook.
+            self.workbook = staged["workbook"]
+            logger.debug(f"Using staged workbook for '{self.file_path}'.")
+            return
         try:
-            self.workbook = openpyxl.load_workbook(self.file_path)
-            logger.info(f"Workbook '{self.file_path}' loaded successfully.")
+            if self.read_only:
+                self.workbook = openpyxl.load_workbook(self.file_path, **LOAD_READ_KWARGS)
+            else:
+                self.workbook = openpyxl.load_workbook(self.file_path)
+            logger.info(f"Workbook '{self.file_path}' loaded successfully (read_only={self.read_only}).")
         except FileNotFoundError:
             logger.error(f"Workbook '{self.file_path}' not found.")
             raise SpreadsheetError(f"Workbook '{self.file_path}' not found.")
@@ -103,6 +560,138 @@ class SpreadsheetManager:
         if self.workbook is None:
             self._load_workbook()
 
+    def _ensure_ro_workbook_loaded(self) -> Workbook:
+        """
+        Return a workbook for pure reads.
+
+        A loaded workbook (or the staged one of an open transaction) is used as is,
+        since it may hold changes not yet on disk. Otherwise the file is opened in
+        openpyxl's read-only mode, which streams cells instead of building the
+        whole workbook in memory; that handle is kept until close() or a save.
+
+        Returns:
+            Workbook: The workbook to read from.
+
+        Raises:
+            SpreadsheetError: If loading fails or file not found.
+        """
+        if self.workbook is not None:
+            return self.workbook
+        if _staged_transaction(self.file_path) is not None:
+            self._load_workbook()
+            return self.workbook
+        if self._ro_workbook is None:
+            try:
+                self._ro_workbook = openpyxl.load_workbook(self.file_path, **LOAD_READ_KWARGS)
+                logger.debug(f"Workbook '{self.file_path}' opened read-only for retrieval.")
+            except FileNotFoundError:
+                logger.error(f"Workbook '{self.file_path}' not found.")
+                raise SpreadsheetError(f"Workbook '{self.file_path}' not found.")
+            except Exception as e:
+                logger.error(f"Failed to load workbook '{self.file_path}': {e}")
+                raise SpreadsheetError(f"Failed to load workbook '{self.file_path}': {e}") from e
+        return self._ro_workbook
+
+    def _clear_sheet_caches(self) -> None:
+        """
+        Forget resolved column indexes, header maps and row counts.
+        """
+        self._column_index_cache.clear()
+        self._header_index_cache.clear()
+        self._row_count_cache.clear()
+
+    def _close_ro_workbook(self) -> None:
+        """
+        Release the read-only retrieval handle, if open.
+        """
+        if self._ro_workbook is not None:
+            self._ro_workbook.close()
+            self._ro_workbook = None
+
+    def close(self) -> None:
+        """
+        Release the loaded workbook.
+
+        Read-only workbooks keep the underlying archive open until closed,
+        so callers using read_only=True must always call this.
+        """
+        self._close_ro_workbook()
+        self._clear_sheet_caches()
+        if self.workbook is not None:
+            staged = _staged_transaction(self.file_path)
+            if staged is None or staged["workbook"] is not self.workbook:
+                self.workbook.close()
+            self.workbook = None
+
+    def _save(self) -> None:
+        """
+        Persist the workbook, or mark it dirty if it belongs to an open transaction
+        or a batch() block.
+        """
+        # Every mutation ends here, so resolved headers may be stale from now on.
+        self._clear_sheet_caches()
+        staged = _staged_transaction(self.file_path)
+        if staged is not None and staged["workbook"] is self.workbook:
+            staged["dirty"] = True
+            return
+        if self._batch_depth:
+            self._dirty = True
+            return
+        self.workbook.save(self.file_path)
+        self._dirty = False
+        # The read-only handle now shows the old file contents.
+        self._close_ro_workbook()
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator['SpreadsheetManager']:
+        """
+        Defer saving across several mutating calls on this manager.
+
+        Each mutator normally rewrites the whole file. Inside the block they only
+        mark the workbook dirty, and it is written once when the outermost block
+        exits cleanly. If the block raises, the unsaved changes are dropped and
+        the workbook is reloaded from disk on next use. The workbook's write
+        lock is held for the whole block, so no other writer can save the file
+        between the batched edits and the final save. Inside an open
+        transaction the staged workbook is already deferred, so this is a no-op.
+
+        Yields:
+            SpreadsheetManager: This manager.
+
+        Raises:
+            SpreadsheetError: If loading or the final save fails.
+        """
+        with workbook_lock(self.file_path):
+            self._ensure_workbook_loaded()
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._batch_depth -= 1
+                if not self._batch_depth and self._dirty:
+                    self._dirty = False
+                    self.workbook.close()
+                    self.workbook = None
+                    self._clear_sheet_caches()
+                raise
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                try:
+                    self._save()
+                except Exception as e:
+                    logger.error(f"Failed to save batched changes to '{self.file_path}': {e}")
+                    raise SpreadsheetError(f"Failed to save batched changes to '{self.file_path}': {e}") from e
+                logger.info(f"Batched changes saved to '{self.file_path}'.")
+
+    def __enter__(self) -> 'SpreadsheetManager':
+        """Allow use as a context manager that closes the workbook on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """Close the workbook when leaving the context."""
+        self.close()
+
+    @_writes_workbook
     def create_workbook(self) -> None:
         """
         Create a new workbook file. Fails if file exists.
@@ -117,22 +706,27 @@ class SpreadsheetManager:
             wb = Workbook()
             wb.save(self.file_path)
             self.workbook = wb  # Keep the workbook in memory
+            self._clear_sheet_caches()
             logger.info(f"Workbook '{self.file_path}' created successfully.")
         except Exception as e:
             logger.error(f"Failed to create workbook '{self.file_path}': {e}")
             raise SpreadsheetError(f"Failed to create workbook '{self.file_path}': {e}") from e
 
+    @_writes_workbook
     def delete_workbook(self) -> None:
         """
         Delete the workbook file from disk.
 
+        The workbook never needs to be in memory for this: construct the manager
+        with load_workbook=False so the file is not parsed just to be unlinked.
+        Any handles this manager does hold are released first.
+
         Raises:
             SpreadsheetError: If deletion fails.
         """
         try:
-            # If a workbook is loaded, close it
-            if self.workbook:
-                self.workbook.close()
+            # Release loaded/read-only handles (a staged workbook is left to its transaction)
+            self.close()
 
             os.remove(self.file_path)
             logger.info(f"Workbook '{self.file_path}' deleted successfully.")
@@ -144,6 +738,7 @@ class SpreadsheetManager:
     # 3. Sheet Management
     # ------------------------------------------------------------------------------
 
+    @_writes_workbook
     def create_sheet(self, sheet_name: str) -> None:
         """
         Create a new sheet in the workbook.
@@ -159,12 +754,13 @@ class SpreadsheetManager:
             if sheet_name in self.workbook.sheetnames:
                 raise SpreadsheetError(f"Sheet '{sheet_name}' already exists.")
             self.workbook.create_sheet(title=sheet_name)
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Sheet '{sheet_name}' created successfully.")
         except Exception as e:
             logger.error(f"Failed to create sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to create sheet '{sheet_name}': {e}") from e
 
+    @_writes_workbook
     def rename_sheet(self, old_name: str, new_name: str) -> None:
         """
         Rename an existing sheet.
@@ -184,12 +780,13 @@ class SpreadsheetManager:
                 raise SpreadsheetError(f"Sheet '{new_name}' already exists.")
             sheet = self.workbook[old_name]
             sheet.title = new_name
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Sheet renamed from '{old_name}' to '{new_name}' successfully.")
         except Exception as e:
             logger.error(f"Failed to rename sheet '{old_name}' to '{new_name}': {e}")
             raise SpreadsheetError(f"Failed to rename sheet '{old_name}' to '{new_name}': {e}") from e
 
+    @_writes_workbook
     def delete_sheet(self, sheet_name: str) -> None:
         """
         Delete a sheet from the workbook.
@@ -205,7 +802,7 @@ class SpreadsheetManager:
             if sheet_name not in self.workbook.sheetnames:
                 raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
             del self.workbook[sheet_name]
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Sheet '{sheet_name}' deleted successfully.")
         except Exception as e:
             logger.error(f"Failed to delete sheet '{sheet_name}': {e}")
@@ -215,6 +812,7 @@ class SpreadsheetManager:
     # 4. Data Entry Operations
     # ------------------------------------------------------------------------------
 
+    @_writes_workbook
     def add_row(self, sheet_name: str, data: List[Any]) -> None:
         """
         Add a single row to a sheet.
@@ -230,19 +828,23 @@ class SpreadsheetManager:
             self._ensure_workbook_loaded()
             sheet = self.workbook[sheet_name]
             sheet.append(data)
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Row added to sheet '{sheet_name}': {data}")
         except Exception as e:
             logger.error(f"Failed to add row to sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to add row to sheet '{sheet_name}': {e}") from e
 
-    def add_rows(self, sheet_name: str, rows: List[List[Any]]) -> None:
+    @_writes_workbook
+    def add_rows(self, sheet_name: str, rows: Iterable[Sequence[Any]]) -> int:
         """
         Add multiple rows to a sheet.
 
         Args:
             sheet_name (str): Target sheet name.
-            rows (List[List[Any]]): List of rows to append.
+            rows (Iterable[Sequence[Any]]): Rows to append; consumed once, so a generator works.
+
+        Returns:
+            int: Number of rows appended.
 
         Raises:
             SpreadsheetError: If sheet not found or append fails.
@@ -250,14 +852,101 @@ class SpreadsheetManager:
         try:
             self._ensure_workbook_loaded()
             sheet = self.workbook[sheet_name]
+            count = 0
             for row in rows:
                 sheet.append(row)
-            self.workbook.save(self.file_path)
-            logger.info(f"{len(rows)} rows added to sheet '{sheet_name}'.")
+                count += 1
+            self._save()
+            logger.info(f"{count} rows added to sheet '{sheet_name}'.")
+            return count
+        except Exception as e:
+            logger.error(f"Failed to add rows to sheet '{sheet_name}': {e}")
+            raise SpreadsheetError(f"Failed to add rows to sheet '{sheet_name}': {e}") from e
+
+    @_writes_workbook
+    def add_rows_bulk(self, sheet_name: str, rows: Iterable[Sequence[Any]]) -> int:
+        """
+        Add a large batch of rows to a sheet, streaming them when the workbook is empty.
+
+        openpyxl's write-only mode serialises each row straight to the worksheet XML
+        instead of building a Cell object per value. A write-only workbook cannot be
+        edited in place and only carries over the sheet names, so the streaming path
+        is only taken for greenfield workbooks (see _is_plain_sheet); otherwise this
+        falls back to add_rows so existing content, formatting and sheet state are
+        preserved. The streamed file is written next to the original and swapped in
+        with os.replace, so a failure mid-write leaves the original untouched.
+
+        Rows are consumed lazily on both paths, so passing a generator keeps
+        memory flat regardless of the batch size.
+
+        Args:
+            sheet_name (str): Target sheet name.
+            rows (Iterable[Sequence[Any]]): Rows to append; consumed once.
+
+        Returns:
+            int: Number of rows appended.
+
+        Raises:
+            SpreadsheetError: If sheet not found or writing fails.
+        """
+        if self._batch_depth or _staged_transaction(self.file_path) is not None:
+            # Rows must land in the deferred workbook, not be streamed to disk.
+            return self.add_rows(sheet_name, rows)
+
+        try:
+            source = openpyxl.load_workbook(self.file_path, **LOAD_READ_KWARGS)
+            try:
+                if sheet_name not in source.sheetnames:
+                    raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
+                sheet_names = list(source.sheetnames)
+                greenfield = not source.defined_names and all(
+                    self._is_sheet_empty(source[name]) for name in sheet_names
+                )
+            finally:
+                source.close()
+            if greenfield:
+                # Empty sheets can still hold widths, panes, validations and the like,
+                # which only a full load exposes; the sheets are empty, so it is cheap.
+                source = openpyxl.load_workbook(self.file_path)
+                try:
+                    greenfield = all(self._is_plain_sheet(sheet) for sheet in source.worksheets)
+                finally:
+                    source.close()
+        except SpreadsheetError:
+            raise
+        except Exception as e:
+            logger.error(f"Failed to inspect workbook '{self.file_path}': {e}")
+            raise SpreadsheetError(f"Failed to inspect workbook '{self.file_path}': {e}") from e
+
+        if not greenfield:
+            return self.add_rows(sheet_name, rows)
+
+        tmp_path = f"{self.file_path}.{os.getpid()}.tmp"
+        try:
+            wb = Workbook(write_only=True)
+            count = 0
+            for name in sheet_names:
+                sheet = wb.create_sheet(name)
+                if name == sheet_name:
+                    for row in rows:
+                        sheet.append(row)
+                        count += 1
+            self._close_ro_workbook()
+            self._clear_sheet_caches()
+            wb.save(tmp_path)
+            os.replace(tmp_path, self.file_path)
+            # The in-memory workbook (if any) no longer reflects the file on disk.
+            self.workbook = None
+            logger.info(f"{count} rows streamed to sheet '{sheet_name}'.")
+            return count
         except Exception as e:
             logger.error(f"Failed to add rows to sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to add rows to sheet '{sheet_name}': {e}") from e
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
 
+    @_writes_workbook
     def write_headers(self, sheet_name: str, headers: List[str]) -> None:
         """
         Write header row to a sheet.
@@ -273,12 +962,13 @@ class SpreadsheetManager:
             self._ensure_workbook_loaded()
             sheet = self.workbook[sheet_name]
             sheet.append(headers)
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Headers written to sheet '{sheet_name}': {headers}")
         except Exception as e:
             logger.error(f"Failed to write headers to sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to write headers to sheet '{sheet_name}': {e}") from e
 
+    @_writes_workbook
     def delete_row(self, sheet_name: str, row_id: str) -> None:
         """
         Delete a specific row by its 1-based index.
@@ -297,7 +987,7 @@ class SpreadsheetManager:
             if row_number < 1 or row_number > sheet.max_row:
                 raise SpreadsheetError(f"Row number '{row_number}' is out of range in sheet '{sheet_name}'.")
             sheet.delete_rows(row_number)
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Row '{row_number}' deleted from sheet '{sheet_name}'.")
         except ValueError:
             logger.error(f"Invalid row_id '{row_id}'. Must be an integer.")
@@ -306,6 +996,7 @@ class SpreadsheetManager:
             logger.error(f"Failed to delete row '{row_id}' from sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to delete row '{row_id}' from sheet '{sheet_name}': {e}") from e
 
+    @_writes_workbook
     def update_column(
         self,
         sheet_name: str,
@@ -339,13 +1030,14 @@ class SpreadsheetManager:
         # If skip_header, start from row=2, else row=1
         start_row = 2 if skip_header else 1
 
+        # Write straight through sheet.cell(value=...); there is no readback of
+        # the column, so no row is scanned beyond the ones being written.
+        column = col_idx + 1
         rows_updated = 0
-        for value in new_data:
-            cell = sheet.cell(row=start_row + rows_updated, column=col_idx + 1)  
-            cell.value = value
-            rows_updated += 1
+        for rows_updated, value in enumerate(new_data, start=1):
+            sheet.cell(row=start_row + rows_updated - 1, column=column, value=value)
 
-        self.workbook.save(self.file_path)
+        self._save()
         logger.info(
             f"Column '{column_identifier}' (resolved to index {col_idx}) updated successfully. "
             f"Rows updated: '{rows_updated}', on sheet: '{sheet_name}' with data: '{new_data}'."
@@ -381,15 +1073,15 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If out of range or resolution fails.
         """
-        self._ensure_workbook_loaded()
-        if sheet_name not in self.workbook.sheetnames:
+        workbook = self._ensure_ro_workbook_loaded()
+        if sheet_name not in workbook.sheetnames:
             raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
         
-        sheet = self.workbook[sheet_name]
+        sheet = workbook[sheet_name]
 
         # If skip_header, row_number=1 => actual row=2
         actual_row = row_number + 1 if (skip_header and row_number == 1) else row_number
-        if actual_row < 1 or actual_row > sheet.max_row:
+        if actual_row < 1 or actual_row > self._row_count(sheet_name, sheet):
             raise SpreadsheetError(f"Row '{actual_row}' out of range in sheet '{sheet_name}'.")
 
         col_idx = self._resolve_column_identifier(sheet_name, column_identifier, has_headers)
@@ -408,8 +1100,9 @@ class SpreadsheetManager:
         sheet_name: str,
         column_identifier: Union[str, int],
         skip_header: bool = False,
-        has_headers: bool = True
-    ) -> List[Any]:
+        has_headers: bool = True,
+        as_array: bool = False
+    ) -> Union[List[Any], np.ndarray]:
         """
         Retrieve all values from a column.
 
@@ -418,35 +1111,42 @@ class SpreadsheetManager:
             column_identifier (Union[str,int]): Letter, index, or header name.
             skip_header (bool): If True, skip first row.
             has_headers (bool): If True, treat first row as headers.
+            as_array (bool): If True and every value is numeric, return a float64
+                numpy array instead of a list. Mixed or text columns still return a list.
 
         Returns:
-            List[Any]: Column values.
+            Union[List[Any], np.ndarray]: Column values.
 
         Raises:
             SpreadsheetError: If sheet not found or resolution fails.
         """
-        self._ensure_workbook_loaded()
-        if sheet_name not in self.workbook.sheetnames:
+        workbook = self._ensure_ro_workbook_loaded()
+        if sheet_name not in workbook.sheetnames:
             raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
 
-        sheet = self.workbook[sheet_name]
+        sheet = workbook[sheet_name]
 
         # Resolve column to 0-based index
         col_idx = self._resolve_column_identifier(sheet_name, column_identifier, has_headers)
 
         # If skip_header => start from row=2, else from row=1
         start_row = 2 if skip_header else 1
-        end_row = sheet.max_row
 
-        result = []
-        for row_num in range(start_row, end_row + 1):
-            cell_value = sheet.cell(row=row_num, column=col_idx + 1).value
-            result.append(cell_value)
+        # Stream the single column; per-row sheet.cell() lookups rescan the
+        # sheet XML when the workbook is opened read-only.
+        result = [
+            row[0] if row else None
+            for row in sheet.iter_rows(
+                min_row=start_row, min_col=col_idx + 1, max_col=col_idx + 1, values_only=True
+            )
+        ]
 
         logger.info(
             f"retrieve_column -> Column '{column_identifier}' (index {col_idx}) from '{sheet_name}', "
             f"skip_header={skip_header}, total rows returned={len(result)}."
         )
+        if as_array:
+            return self._to_numeric_array(result)
         return result
 
 
@@ -457,18 +1157,26 @@ class SpreadsheetManager:
         condition_type: str,
         condition_value: str,
         skip_header: bool = True,
-        has_headers: bool = True
+        has_headers: bool = True,
+        max_results: Optional[int] = 1000
     ) -> List[List[Any]]:
         """
         Filter rows by a condition on a column.
 
+        Rows are streamed from the sheet and the scan stops as soon as
+        'max_results' matches have been collected. Without a limit the whole
+        sheet is read anyway, so the condition is evaluated as a single pandas
+        mask over the column instead of row by row.
+
         Args:
             sheet_name (str): Target sheet name.
             column_identifier (Union[str,int]): Letter, index, or header name.
-            condition_type (str): 'equals','greater_than', etc.
+            condition_type (str): 'equals','greater_than','less_than','contains',
+                'startswith','endswith', or 'matches' (regular expression search).
             condition_value (str): Value to compare.
             skip_header (bool): If True, skip first row.
             has_headers (bool): If True, treat headers row.
+            max_results (Optional[int]): Maximum number of rows to return; None for no limit.
 
         Returns:
             List[List[Any]]: Matching rows.
@@ -476,24 +1184,26 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If sheet not found or invalid condition.
         """
-        self._ensure_workbook_loaded()
-        if sheet_name not in self.workbook.sheetnames:
+        workbook = self._ensure_ro_workbook_loaded()
+        if sheet_name not in workbook.sheetnames:
             raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
 
-        sheet = self.workbook[sheet_name]
+        sheet = workbook[sheet_name]
         col_idx = self._resolve_column_identifier(sheet_name, column_identifier, has_headers)
 
         condition_func = self._build_condition_func(condition_type, condition_value)
-        filtered_rows = []
 
         # If skip_header => start from row=2, else from row=1
         start_row = 2 if skip_header else 1
 
-        for row in sheet.iter_rows(min_row=start_row, values_only=True):
-            # row is a tuple of cell values
-            cell_value = row[col_idx] if col_idx < len(row) else None
-            if condition_func(cell_value):
-                filtered_rows.append(list(row))
+        filtered_rows = None
+        if max_results is None:
+            filtered_rows = self._filter_rows_vectorized(
+                sheet, start_row, col_idx, condition_type, condition_value
+            )
+        if filtered_rows is None:
+            matches = self._iter_matching_rows(sheet, start_row, col_idx, condition_func)
+            filtered_rows = list(islice(matches, max_results))
 
         logger.info(
             f"filter_rows -> Filtered by '{condition_type}'='{condition_value}' "
@@ -503,6 +1213,66 @@ class SpreadsheetManager:
         return filtered_rows
 
 
+    @staticmethod
+    def _iter_matching_rows(
+        sheet: Worksheet,
+        start_row: int,
+        col_idx: int,
+        condition_func
+    ) -> Iterator[List[Any]]:
+        """
+        Lazily yield rows whose value in a column satisfies a condition.
+
+        Args:
+            sheet (Worksheet): Worksheet to scan (regular or read-only).
+            start_row (int): 1-based row to start from.
+            col_idx (int): 0-based index of the tested column.
+            condition_func (Callable): Predicate applied to the cell value.
+
+        Yields:
+            List[Any]: Values of each matching row.
+        """
+        for row in sheet.iter_rows(min_row=start_row, values_only=True):
+            # row is a tuple of cell values
+            cell_value = row[col_idx] if col_idx < len(row) else None
+            if condition_func(cell_value):
+                yield list(row)
+
+
+    @staticmethod
+    def _filter_rows_vectorized(
+        sheet: Worksheet,
+        start_row: int,
+        col_idx: int,
+        condition_type: str,
+        condition_value: str
+    ) -> Optional[List[List[Any]]]:
+        """
+        Collect every row whose value in a column satisfies a condition, using a pandas mask.
+
+        Args:
+            sheet (Worksheet): Worksheet to scan (regular or read-only).
+            start_row (int): 1-based row to start from.
+            col_idx (int): 0-based index of the tested column.
+            condition_type (str): Key of _CONDITION_MASKS.
+            condition_value (str): Value to compare against.
+
+        Returns:
+            Optional[List[List[Any]]]: Matching rows, or None if the column holds
+            values only the row-wise predicate can judge.
+        """
+        rows = list(sheet.iter_rows(min_row=start_row, values_only=True))
+        # Read-only rows may be ragged; missing trailing cells read as None.
+        values = pd.Series(
+            [row[col_idx] if col_idx < len(row) else None for row in rows],
+            dtype=object
+        )
+        mask = _CONDITION_MASKS[condition_type](values, condition_value)
+        if mask is None:
+            return None
+        return [list(rows[i]) for i in np.flatnonzero(mask.to_numpy(dtype=bool))]
+
+
     def retrieve_rows(
         self,
         sheet_name: str,
@@ -525,11 +1295,11 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If sheet not found.
         """
-        self._ensure_workbook_loaded()
-        if sheet_name not in self.workbook.sheetnames:
+        workbook = self._ensure_ro_workbook_loaded()
+        if sheet_name not in workbook.sheetnames:
             raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
 
-        sheet = self.workbook[sheet_name]
+        sheet = workbook[sheet_name]
 
         # If skip_header and start_row=1, effectively start at row=2
         actual_start = start_row + 1 if (skip_header and start_row <= 1) else start_row
@@ -570,22 +1340,22 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If sheet not found or out of range.
         """
-        self._ensure_workbook_loaded()
-        if sheet_name not in self.workbook.sheetnames:
+        workbook = self._ensure_ro_workbook_loaded()
+        if sheet_name not in workbook.sheetnames:
             raise SpreadsheetError(f"Sheet '{sheet_name}' does not exist.")
 
-        sheet = self.workbook[sheet_name]
+        sheet = workbook[sheet_name]
 
         # If row 1 is a header and skip_header=True, then retrieving row_id=1 means row #2
         actual_row = row_id + 1 if (skip_header and row_id == 1) else row_id
 
-        if actual_row < 1 or actual_row > sheet.max_row:
+        if actual_row < 1 or actual_row > self._row_count(sheet_name, sheet):
             raise SpreadsheetError(
                 f"Row number '{actual_row}' is out of range in sheet '{sheet_name}'."
             )
 
-        # gather that row
-        row_data = [cell.value for cell in sheet[actual_row]]
+        # gather that row as plain values, without building Cell objects
+        row_data = list(next(sheet.iter_rows(min_row=actual_row, max_row=actual_row, values_only=True), ()))
 
         logger.info(
             f"retrieve_row -> Row {row_id} (actual={actual_row}), skip_header={skip_header}, "
@@ -602,6 +1372,13 @@ class SpreadsheetManager:
         """
         Generate row/column counts for each sheet.
 
+        When the file on disk is current (no loaded or staged workbook), the
+        counts come from each sheet's <dimension> element read straight from the
+        archive, which is what read-only openpyxl reports too, without parsing
+        shared strings or styles; a single-cell dimension is checked against the
+        sheet's row and cell references. Workbooks whose sheets lack that element
+        are opened with openpyxl as before.
+
         Returns:
             Dict[str, Any]: {sheet_name: {'rows': int, 'columns': int}, ...}
 
@@ -609,12 +1386,19 @@ class SpreadsheetManager:
             SpreadsheetError: If generation fails.
         """
         try:
-            self._ensure_workbook_loaded()
+            # A read-only workbook came straight from disk, so the file is current.
+            on_disk = self.workbook is None or self.read_only
+            if on_disk and _staged_transaction(self.file_path) is None:
+                summary = _read_sheet_dimensions(self.file_path)
+                if summary is not None:
+                    logger.info(f"Spreadsheet summary generated successfully for '{self.file_path}'.")
+                    return summary
+            workbook = self._ensure_ro_workbook_loaded()
             summary = {}
-            for sheet_name in self.workbook.sheetnames:
-                sheet_obj = self.workbook[sheet_name]
+            for sheet_name in workbook.sheetnames:
+                sheet_obj = workbook[sheet_name]
                 summary[sheet_name] = {
-                    "rows": sheet_obj.max_row,
+                    "rows": self._sheet_max_row(sheet_obj),
                     "columns": sheet_obj.max_column
                 }
             logger.info(f"Spreadsheet summary generated successfully for '{self.file_path}'.")
@@ -643,23 +1427,30 @@ class SpreadsheetManager:
             SpreadsheetError: If any sheet or header is missing.
         """
         try:
-            self._ensure_workbook_loaded()
-
-            # Check for required sheets
-            for sheet_name in required_sheets:
-                if sheet_name not in self.workbook.sheetnames:
-                    error_msg = f"Sheet '{sheet_name}' does not exist."
-                    logger.error(error_msg)
-                    raise SpreadsheetError(error_msg)
+            workbook = self._ensure_ro_workbook_loaded()
+            available_sheets = set(workbook.sheetnames)
+
+            # Check for required sheets, reporting every missing one at once
+            missing_sheets = [name for name in required_sheets if name not in available_sheets]
+            if missing_sheets:
+                if len(missing_sheets) == 1:
+                    error_msg = f"Sheet '{missing_sheets[0]}' does not exist."
+                else:
+                    error_msg = f"Sheets {missing_sheets} do not exist."
+                logger.error(error_msg)
+                raise SpreadsheetError(error_msg)
 
-            # Check for required headers in each sheet
+            # Check for required headers in each sheet; only row 1 is parsed
             for sheet_name, headers in required_headers.items():
-                if sheet_name not in self.workbook.sheetnames:
+                if sheet_name not in available_sheets:
                     error_msg = f"Sheet '{sheet_name}' does not exist for header validation."
                     logger.error(error_msg)
                     raise SpreadsheetError(error_msg)
-                sheet_obj = self.workbook[sheet_name]
+                sheet_obj = workbook[sheet_name]
                 actual_headers = list(next(sheet_obj.iter_rows(min_row=1, max_row=1, values_only=True), []))
+                # Row 1 is padded to the sheet width; blank trailing cells are not headers.
+                while actual_headers and actual_headers[-1] is None:
+                    actual_headers.pop()
                 if actual_headers != headers:
                     error_msg = f"Headers mismatch in sheet '{sheet_name}'. Expected {headers}, got {actual_headers}."
                     logger.error(error_msg)
@@ -674,54 +1465,7 @@ class SpreadsheetManager:
             raise SpreadsheetError(f"Failed to validate spreadsheet structure: {e}") from e
 
 
-    def retrieve_multiple_sheets_summary(
-        self,
-        files_list: List[Dict[str, str]],
-        default_path: str,
-        default_file_name: str
-    ) -> Dict[str, Any]:
-        """
-        Generate summaries for multiple spreadsheet files.
-
-        Args:
-            files_list (List[Dict[str,str]]): [{'path':..., 'file_name':...}, ...]
-            default_path (str): Fallback directory.
-            default_file_name (str): Fallback file name.
-
-        Returns:
-            Dict[str,Any]: {file_name: {'status': bool, 'message': str, 'result': summary_or_None}, ...}
-        """
-        summaries = {}
-        for file in files_list:
-            path = file.get('path', default_path)
-            file_name = file.get('file_name', default_file_name)
-            full_path = get_full_path(path, file_name)
-            try:
-                check_file_exists(path, file_name)
-                manager = SpreadsheetManager(file_path=full_path)
-                summary = manager.generate_spreadsheet_summary()
-                message = f"Summary generated successfully for '{file_name}'."
-                summaries[file_name] = {
-                    "status": True,
-                    "message": message,
-                    "result": summary
-                }
-            except SpreadsheetError as e:
-                summaries[file_name] = {
-                    "status": False,
-                    "message": str(e),
-                    "result": None
-                }
-            except Exception as e:
-                summaries[file_name] = {
-                    "status": False,
-                    "message": f"Unexpected error: {str(e)}",
-                    "result": None
-                }
-        logger.info("Retrieved multiple sheets summaries.")
-        return summaries
-
-
+    @_writes_workbook
     def create_pivot_table(
         self,
         sheet_name: str,
@@ -755,31 +1499,30 @@ class SpreadsheetManager:
             raise SpreadsheetError("Both 'source_data' and 'destination' parameters are required for creating a pivot table.")
 
         # Step 1: Parse and validate source_data
+        self._ensure_workbook_loaded()
         try:
             source_sheet_name, source_range = source_data.split('!')
             source_sheet = self.workbook[source_sheet_name]
             
             # Validate source range
-            min_col, min_row, max_col, max_row = range_boundaries(source_range)
+            min_col, min_row, max_col, max_row = _range_boundaries(source_range)
             logger.debug(f"Extracting data from '{source_range}' (Columns {min_col}-{max_col}, Rows {min_row}-{max_row})")
             
-            # Extract data using openpyxl
-            source_data_rows = []
-            for row in source_sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True):
-                source_data_rows.append(list(row))
-            
-            if not source_data_rows:
+            # Extract data using openpyxl; the value tuples go straight into the
+            # DataFrame without an intermediate list-of-lists copy.
+            source_rows = source_sheet.iter_rows(min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+            headers = next(source_rows, None)
+            if headers is None:
                 error_msg = f"No data found in the source data range '{source_data}'."
                 logger.error(error_msg)
                 raise SpreadsheetError(error_msg)
 
-            headers = source_data_rows[0]
             if not headers:
                 error_msg = f"No headers found in the source data range '{source_data}'."
                 logger.error(error_msg)
                 raise SpreadsheetError(error_msg)
 
-            df = pd.DataFrame(source_data_rows[1:], columns=headers)
+            df = pd.DataFrame.from_records(source_rows, columns=list(headers))
             if df.empty:
                 error_msg = f"No data found in the source data range '{source_data}' after excluding headers."
                 logger.error(error_msg)
@@ -887,6 +1630,19 @@ class SpreadsheetManager:
                     aggfunc_dict[field] = aggfunc
                     values_fields.append(field)
 
+            # Cells arrive as Python objects, so value columns are object dtype.
+            # Cast the fully numeric ones so the aggregation runs on float/int
+            # arrays; columns with any non-numeric cell keep their values.
+            numeric_columns = {}
+            for field in dict.fromkeys(values_fields):
+                numbers = pd.to_numeric(df[field], errors="coerce")
+                if not (numbers.isna() & df[field].notna()).any():
+                    numeric_columns[field] = numbers
+            if numeric_columns:
+                df = df.copy(deep=False)
+                for field, numbers in numeric_columns.items():
+                    df[field] = numbers
+
             pivot_table = pd.pivot_table(
                 df,
                 index=rows if rows else None,
@@ -958,7 +1714,7 @@ class SpreadsheetManager:
             logger.debug(f"Pivot table data written successfully to '{destination}'.")
 
             # Save the workbook
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Pivot table '{report_name}' created successfully at '{destination}' in sheet '{dest_sheet_name}'.")
 
             return {
@@ -980,6 +1736,7 @@ class SpreadsheetManager:
     # 7. Formula Operations
     # ------------------------------------------------------------------------------
 
+    @_writes_workbook
     def insert_formula(self, sheet_name: str, cell: str, formula: str) -> None:
         """
         Insert a formula into a cell.
@@ -1002,7 +1759,7 @@ class SpreadsheetManager:
                 raise SpreadsheetError(error_msg)
             
             try:
-                column, row = coordinate_from_string(cell)
+                column, row = _coordinate_from_string(cell)
             except ValueError:
                 error_msg = f"Invalid cell reference: '{cell}'."
                 logger.error(error_msg)
@@ -1016,7 +1773,7 @@ class SpreadsheetManager:
             
             sheet = self.workbook[sheet_name]
             sheet[cell] = formula
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Inserted formula '{formula}' into cell '{cell}' in sheet '{sheet_name}'.")
         except SpreadsheetError:
             # Re-raise SpreadsheetError without modification
@@ -1027,6 +1784,7 @@ class SpreadsheetManager:
 
 
 
+    @_writes_workbook
     def apply_formula_to_column(self, sheet_name: str, column: str, formula_template: str, start_row: Optional[int] = 1) -> int:
         """
         Apply a formula template down a column.
@@ -1053,10 +1811,8 @@ class SpreadsheetManager:
                 raise SpreadsheetError(error_msg)
             
             # Validate column name
-            from openpyxl.utils import column_index_from_string
-            try:
-                column_index = column_index_from_string(column)
-            except ValueError:
+            column_index = _COL_LETTER_TO_IDX.get(column.upper()) if isinstance(column, str) else None
+            if column_index is None:
                 error_msg = f"Invalid column name: '{column}'."
                 logger.error(error_msg)
                 raise SpreadsheetError(error_msg)
@@ -1092,7 +1848,7 @@ class SpreadsheetManager:
                     raise SpreadsheetError(error_msg) from ke
                 sheet[cell_ref] = formula
                 rows_updated += 1
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Applied formula template '{formula_template}' to column '{column}' starting at row {start_row}. Rows updated: {rows_updated}.")
             return rows_updated
         except SpreadsheetError:
@@ -1118,24 +1874,23 @@ class SpreadsheetManager:
             SpreadsheetError: If cell contains a formula or failure.
         """
         try:
-            self._ensure_workbook_loaded()
+            workbook = self._ensure_ro_workbook_loaded()
             
             # Validate sheet existence
-            if sheet_name not in self.workbook.sheetnames:
+            if sheet_name not in workbook.sheetnames:
                 error_msg = f"Sheet '{sheet_name}' does not exist in the workbook."
                 logger.error(error_msg)
                 raise SpreadsheetError(error_msg)
             
             # Validate cell reference
-            from openpyxl.utils import coordinate_from_string
             try:
-                column, row = coordinate_from_string(cell)
+                column, row = _coordinate_from_string(cell)
             except ValueError:
                 error_msg = f"Invalid cell reference: '{cell}'."
                 logger.error(error_msg)
                 raise SpreadsheetError(error_msg)
             
-            sheet = self.workbook[sheet_name]
+            sheet = workbook[sheet_name]
             value = sheet[cell].value
             if isinstance(value, str) and value.startswith('='):
                 error_msg = "Cannot evaluate formula using openpyxl. Must use Excel or another tool."
@@ -1151,6 +1906,7 @@ class SpreadsheetManager:
             raise SpreadsheetError(f"Failed to retrieve value from cell '{cell}' in sheet '{sheet_name}': {e}") from e
 
 
+    @_writes_workbook
     def remove_formula(self, sheet_name: str, cell: str) -> None:
         """
         Remove a formula from a cell.
@@ -1172,9 +1928,8 @@ class SpreadsheetManager:
                 raise SpreadsheetError(error_msg)
             
             # Validate cell reference
-            from openpyxl.utils import coordinate_from_string
             try:
-                column, row = coordinate_from_string(cell)
+                column, row = _coordinate_from_string(cell)
             except ValueError:
                 error_msg = f"Invalid cell reference: '{cell}'."
                 logger.error(error_msg)
@@ -1188,7 +1943,7 @@ class SpreadsheetManager:
                 raise SpreadsheetError(error_msg)
             
             sheet[cell].value = None
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Removed formula from cell '{cell}' in sheet '{sheet_name}'.")
         except SpreadsheetError:
             # Re-raise SpreadsheetError without modification
@@ -1198,6 +1953,7 @@ class SpreadsheetManager:
             raise SpreadsheetError(f"Failed to remove formula from cell '{cell}' in sheet '{sheet_name}': {e}") from e
 
 
+    @_writes_workbook
     def define_named_range(self, sheet_name: str, range_name: str, cell_range: str) -> None:
         """
         Define or overwrite a named range.
@@ -1222,14 +1978,13 @@ class SpreadsheetManager:
             sheet = self.workbook[sheet_name]
 
             # Validate and parse cell_range
-            from openpyxl.utils import coordinate_from_string
             try:
                 if ':' in cell_range:
                     start_cell, end_cell = cell_range.split(':')
-                    coordinate_from_string(start_cell)  # Validates start_cell
-                    coordinate_from_string(end_cell)    # Validates end_cell
+                    _coordinate_from_string(start_cell)  # Validates start_cell
+                    _coordinate_from_string(end_cell)    # Validates end_cell
                 else:
-                    coordinate_from_string(cell_range)  # Validates single cell
+                    _coordinate_from_string(cell_range)  # Validates single cell
             except ValueError:
                 error_msg = f"Invalid cell range: '{cell_range}'."
                 logger.error(error_msg)
@@ -1244,7 +1999,7 @@ class SpreadsheetManager:
             # Define the new named range
             dn = DefinedName(name=range_name, attr_text=f"'{sheet_name}'!{cell_range}")
             self.workbook.defined_names.append(dn)
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Named range '{range_name}' defined as '{cell_range}' in sheet '{sheet_name}'.")
         except SpreadsheetError:
             # Re-raise SpreadsheetError without modification
@@ -1258,6 +2013,7 @@ class SpreadsheetManager:
     # 8. Data Transformation Operations
     # ------------------------------------------------------------------------------
 
+    @_writes_workbook
     def transpose_data(self, source_range: str, destination_range: str) -> None:
         """
         Transpose one range into another.
@@ -1274,11 +2030,11 @@ class SpreadsheetManager:
             
             # Parse and validate source range
             source_sheet, source_cells = self._parse_range(source_range)
-            min_col, min_row, max_col, max_row = openpyxl.utils.range_boundaries(source_cells)
+            min_col, min_row, max_col, max_row = _range_boundaries(source_cells)
             
             # Parse and validate destination range
             dest_sheet, dest_cells = self._parse_range(destination_range)
-            dest_col_letter, dest_row = coordinate_from_string(dest_cells)
+            dest_col_letter, dest_row = _coordinate_from_string(dest_cells)
             dest_col_index = column_index_from_string(dest_col_letter)
             
             # Extract source data
@@ -1294,7 +2050,7 @@ class SpreadsheetManager:
                 for jdx, value in enumerate(row, start=dest_col_index):
                     dest_sheet.cell(row=idx, column=jdx).value = value
             
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Data transposed from '{source_range}' to '{destination_range}'.")
         except Exception as e:
             logger.error(f"Failed to transpose data from '{source_range}' to '{destination_range}': {e}")
@@ -1315,8 +2071,7 @@ class SpreadsheetManager:
             SpreadsheetError: On failure.
         """
         try:
-            self._ensure_workbook_loaded()
-            sheet = self.workbook[sheet_name]
+            sheet = self._ensure_ro_workbook_loaded()[sheet_name]
             headers = [cell for cell in next(sheet.iter_rows(min_row=1, max_row=1, values_only=True))]
             unpivoted_data = []
 
@@ -1329,7 +2084,6 @@ class SpreadsheetManager:
                         "Value": cell_value
                     })
 
-            self.workbook.save(self.file_path)
             logger.info(f"Data in sheet '{sheet_name}' unpivoted successfully.")
             return unpivoted_data
         except Exception as e:
@@ -1340,6 +2094,7 @@ class SpreadsheetManager:
     # 9. Data Validation Operations (set_data_validation, remove_data_validation)
     # ------------------------------------------------------------------------------
 
+    @_writes_workbook
     def set_data_validation(self, sheet_name: str, validation_rules: Dict[str, Any]) -> None:
         """
         Sets data validation rules for a specific range in a sheet.
@@ -1387,10 +2142,10 @@ class SpreadsheetManager:
 
             if ':' in target_range:
                 start_cell, end_cell = target_range.split(':')
-                coordinate_from_string(start_cell)  # Validates start_cell
-                coordinate_from_string(end_cell)    # Validates end_cell
+                _coordinate_from_string(start_cell)  # Validates start_cell
+                _coordinate_from_string(end_cell)    # Validates end_cell
             else:
-                coordinate_from_string(target_range)  # Validates single cell
+                _coordinate_from_string(target_range)  # Validates single cell
 
             # Create DataValidation object
             dv = DataValidation(
@@ -1409,13 +2164,14 @@ class SpreadsheetManager:
             dv.add(target_range)
             sheet.add_data_validation(dv)
 
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Data validation set for range '{target_range}' in sheet '{sheet_name}': {validation_rules}")
         except Exception as e:
             logger.error(f"Failed to set data validation for range '{validation_rules.get('range')}' in sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to set data validation for range '{validation_rules.get('range')}' in sheet '{sheet_name}': {e}") from e
 
 
+    @_writes_workbook
     def remove_data_validation(self, sheet_name: str, range_to_remove: Optional[str] = None) -> None:
         """
         Removes data validation rules from a specific range or the entire sheet.
@@ -1446,7 +2202,7 @@ class SpreadsheetManager:
                 sheet.data_validations.dataValidation = []
                 logger.info(f"All data validations removed from sheet '{sheet_name}'.")
 
-            self.workbook.save(self.file_path)
+            self._save()
         except Exception as e:
             logger.error(f"Failed to remove data validation from sheet '{sheet_name}': {e}")
             raise SpreadsheetError(f"Failed to remove data validation from sheet '{sheet_name}': {e}") from e
@@ -1455,6 +2211,7 @@ class SpreadsheetManager:
     # 10. Formatting Operations (set_cell_format, apply_conditional_formatting)
     # ------------------------------------------------------------------------------
     
+    @_writes_workbook
     def set_cell_format(
         self,
         sheet_name: str,
@@ -1510,7 +2267,7 @@ class SpreadsheetManager:
             logger.info(
                 f"set_cell_format -> Applied style rules to {cell} in sheet '{sheet_name}': {style_rules}"
             )
-            self.workbook.save(self.file_path)
+            self._save()
 
         except Exception as e:
             logger.error(f"Failed to set cell format for {cell} in sheet '{sheet_name}': {e}")
@@ -1519,6 +2276,7 @@ class SpreadsheetManager:
             ) from e
 
 
+    @_writes_workbook
     def apply_conditional_formatting(
         self, 
         sheet_name: str, 
@@ -1568,7 +2326,7 @@ class SpreadsheetManager:
             )
 
             # Save to ensure any changes are persisted
-            self.workbook.save(self.file_path)
+            self._save()
 
         except Exception as e:
             logger.error(f"Failed to apply conditional formatting to sheet '{sheet_name}': {e}")
@@ -1581,6 +2339,7 @@ class SpreadsheetManager:
     # 11. Chart and Graphics Operations (create_chart, update_chart, remove_chart)
     # ------------------------------------------------------------------------------
     
+    @_writes_workbook
     def create_chart(
         self,
         sheet_name: str,
@@ -1636,7 +2395,7 @@ class SpreadsheetManager:
 
             # 2. Parse data_range for numeric data
             try:
-                min_col, min_row, max_col, max_row = range_boundaries(data_range)
+                min_col, min_row, max_col, max_row = _range_boundaries(data_range)
             except ValueError:
                 error_msg = f"Invalid data_range format: '{data_range}'. Expected something like 'B2:D10'."
                 logger.error(error_msg)
@@ -1655,7 +2414,7 @@ class SpreadsheetManager:
             cats_ref = None
             if categories_range:
                 try:
-                    c_min_col, c_min_row, c_max_col, c_max_row = range_boundaries(categories_range)
+                    c_min_col, c_min_row, c_max_col, c_max_row = _range_boundaries(categories_range)
                     cats_ref = Reference(
                         sheet,
                         min_col=c_min_col,
@@ -1759,7 +2518,7 @@ class SpreadsheetManager:
             sheet.add_chart(chart, destination_cell)
 
             # 11. Save the workbook
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Created {chart_type} chart at '{destination_cell}' on sheet '{sheet_name}' successfully.")
 
             return {
@@ -1780,6 +2539,7 @@ class SpreadsheetManager:
             raise SpreadsheetError(error_msg)
 
 
+    @_writes_workbook
     def update_chart(
         self,
         sheet_name: str,
@@ -1837,7 +2597,7 @@ class SpreadsheetManager:
             # 3. If new_data_range is provided, update references
             if new_data_range:
                 try:
-                    min_col, min_row, max_col, max_row = range_boundaries(new_data_range)
+                    min_col, min_row, max_col, max_row = _range_boundaries(new_data_range)
                     data_ref = Reference(
                         sheet,
                         min_col=min_col,
@@ -1868,7 +2628,7 @@ class SpreadsheetManager:
             # 4. If new_categories_range is provided, update the category references
             if new_categories_range:
                 try:
-                    c_min_col, c_min_row, c_max_col, c_max_row = range_boundaries(new_categories_range)
+                    c_min_col, c_min_row, c_max_col, c_max_row = _range_boundaries(new_categories_range)
                     cats_ref = Reference(
                         sheet,
                         min_col=c_min_col,
@@ -1884,7 +2644,7 @@ class SpreadsheetManager:
                     s.categories = cats_ref
 
             # 5. Save changes
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Chart '{chart_title}' updated successfully on sheet '{sheet_name}'.")
 
             return {
@@ -1904,6 +2664,7 @@ class SpreadsheetManager:
             raise SpreadsheetError(error_msg)
 
 
+    @_writes_workbook
     def remove_chart(
         self,
         sheet_name: str,
@@ -1941,7 +2702,7 @@ class SpreadsheetManager:
             # Remove this chart from the sheet
             sheet._charts.remove(target_chart)
 
-            self.workbook.save(self.file_path)
+            self._save()
             logger.info(f"Chart '{chart_title}' removed successfully from sheet '{sheet_name}'.")
 
             return {
@@ -2009,10 +2770,10 @@ class SpreadsheetManager:
             # Validate individual cell coordinates
             if ':' in cells_part:
                 start_cell, end_cell = cells_part.split(':')
-                coordinate_from_string(start_cell)  # Validates start_cell
-                coordinate_from_string(end_cell)    # Validates end_cell
+                _coordinate_from_string(start_cell)  # Validates start_cell
+                _coordinate_from_string(end_cell)    # Validates end_cell
             else:
-                coordinate_from_string(cells_part)  # Validates single cell
+                _coordinate_from_string(cells_part)  # Validates single cell
 
             return sheet, cells_part
         except KeyError:
@@ -2036,6 +2797,9 @@ class SpreadsheetManager:
     ) -> int:
         """
         Resolves 'identifier' to a 0-based column index.
+
+        Results for string identifiers are memoized per manager until the next
+        save or reload, so resolving the same header in a loop reads row 1 once.
         
         Args:
             sheet_name (str): Name of the target sheet.
@@ -2055,20 +2819,39 @@ class SpreadsheetManager:
         if isinstance(identifier, int):
             # Convert 1-based to 0-based
             return identifier - 1
-        
-        # 2) If it “looks like” a letter-based reference, try the built-in method:
-        #    e.g. "A", "B", "AA" ...
-        try:
-            # If this fails, it’ll raise ValueError
-            col_idx = column_index_from_string(identifier)  
+
+        cache_key = (sheet_name, identifier, has_headers)
+        cached = self._column_index_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        col_idx = self._resolve_column_name(sheet_name, identifier, has_headers)
+        self._column_index_cache[cache_key] = col_idx
+        return col_idx
+
+    def _resolve_column_name(self, sheet_name: str, identifier: str, has_headers: bool) -> int:
+        """
+        Resolve a column letter or header name to a 0-based column index, uncached.
+
+        Args:
+            sheet_name (str): Name of the target sheet.
+            identifier (str): Column letter or header name.
+            has_headers (bool): Whether to treat row #1 as headers.
+
+        Returns:
+            int: 0-based column index.
+
+        Raises:
+            SpreadsheetError: If the sheet or the column cannot be resolved.
+        """
+        # 2) If it “looks like” a letter-based reference, e.g. "A", "B", "AA" ...
+        col_idx = _COL_LETTER_TO_IDX.get(identifier.upper())
+        if col_idx is not None:
             return col_idx - 1
-        except ValueError:
-            pass  # Means 'identifier' was not a valid letter like "A" or "BD"
         
         # 3) Otherwise, assume it’s a "header name"
         #    We'll search row 1 (or whichever is your “header row”)
         #    to find the matching header text.
-        sheet = self.workbook[sheet_name]
+        sheet = self._ensure_ro_workbook_loaded()[sheet_name]
         
         if not has_headers:
             # If user says "no headers", we can’t interpret "Price" properly
@@ -2076,16 +2859,37 @@ class SpreadsheetManager:
                 f"Requested header '{identifier}' but 'has_headers' is false."
             )
         
-        # read row #1 in that sheet
-        headers = list(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), []))
-        if identifier not in headers:
+        header_index = self._header_index(sheet_name, sheet)
+        col_idx = header_index.get(identifier)
+        if col_idx is None:
             raise SpreadsheetError(
                 f"Header '{identifier}' not found in sheet '{sheet_name}'. "
-                f"Available headers: {headers}"
+                f"Available headers: {list(header_index)}"
             )
-        # find which position it’s at
-        col_idx = headers.index(identifier)  # zero-based
-        return col_idx
+        return col_idx  # zero-based
+
+    def _header_index(self, sheet_name: str, sheet: Worksheet) -> Dict[Any, int]:
+        """
+        Map each header in row 1 of a sheet to its 0-based column index.
+
+        Row 1 is read once per sheet and kept until the workbook changes. When a
+        header repeats, its first column wins, as with list.index().
+
+        Args:
+            sheet_name (str): Name of the sheet, used as the cache key.
+            sheet (Worksheet): The sheet itself (regular or read-only).
+
+        Returns:
+            Dict[Any, int]: {header value: 0-based column index}; blank cells are skipped.
+        """
+        index = self._header_index_cache.get(sheet_name)
+        if index is None:
+            index = {}
+            for i, header in enumerate(next(sheet.iter_rows(min_row=1, max_row=1, values_only=True), ())):
+                if header is not None:
+                    index.setdefault(header, i)
+            self._header_index_cache[sheet_name] = index
+        return index
 
 
     def _build_condition_func(self, condition_type: str, condition_value: str):
@@ -2093,6 +2897,9 @@ class SpreadsheetManager:
         Builds a condition function based on the condition type and value
         (e.g., 'equals', 'greater_than', etc.).
 
+        The predicate is specialised once per call from _CONDITION_BUILDERS, so
+        the per-row loop never branches on the condition type.
+
         Args:
             condition_type (str): Type of condition.
             condition_value (str): Value to compare against.
@@ -2103,21 +2910,15 @@ class SpreadsheetManager:
         Raises:
             SpreadsheetError: If the condition type is unsupported or invalid.
         """
+        builder = _CONDITION_BUILDERS.get(condition_type)
+        if builder is None:
+            raise SpreadsheetError(f"Unsupported condition type '{condition_type}'.")
         try:
-            if condition_type == "equals":
-                return lambda x: x == condition_value
-            elif condition_type == "greater_than":
-                return lambda x: float(x) > float(condition_value) if x is not None else False
-            elif condition_type == "less_than":
-                return lambda x: float(x) < float(condition_value) if x is not None else False
-            elif condition_type == "contains":
-                return lambda x: condition_value in str(x) if x is not None else False
-            elif condition_type == "startswith":
-                return lambda x: str(x).startswith(condition_value) if x is not None else False
-            elif condition_type == "endswith":
-                return lambda x: str(x).endswith(condition_value) if x is not None else False
-            else:
-                raise SpreadsheetError(f"Unsupported condition type '{condition_type}'.")
+            return builder(condition_value)
+        except re.error as e:
+            raise SpreadsheetError(
+                f"Invalid regular expression '{condition_value}' for 'matches': {e}"
+            ) from e
         except ValueError:
             raise SpreadsheetError(
                 f"Invalid condition value '{condition_value}' for '{condition_type}'. Must be a number if using > or <."
@@ -2125,3 +2926,100 @@ class SpreadsheetManager:
         except Exception as e:
             logger.error(f"Error building condition function: {e}")
             raise SpreadsheetError(f"Error building condition function: {e}") from e
+
+
+    @staticmethod
+    def _is_sheet_empty(sheet: Worksheet) -> bool:
+        """
+        Check whether a worksheet holds no cell values.
+
+        Args:
+            sheet (Worksheet): Worksheet to inspect (regular or read-only).
+
+        Returns:
+            bool: True if every cell in the sheet is empty.
+        """
+        for row in sheet.iter_rows(values_only=True):
+            if any(value is not None for value in row):
+                return False
+        return True
+
+    @staticmethod
+    def _is_plain_sheet(sheet: Worksheet) -> bool:
+        """
+        Check whether a worksheet carries nothing a write-only rewrite would drop.
+
+        Args:
+            sheet (Worksheet): Fully loaded worksheet.
+
+        Returns:
+            bool: True if the sheet is visible and has no cells (styled or not),
+            dimensions, freeze panes, merges, auto filter, data validations,
+            conditional formatting, charts or images.
+        """
+        return (
+            sheet.sheet_state == "visible"
+            and not sheet._cells
+            and not sheet.column_dimensions
+            and not sheet.row_dimensions
+            and sheet.freeze_panes is None
+            and not sheet.merged_cells.ranges
+            and not sheet.auto_filter.ref
+            and not sheet.data_validations.dataValidation
+            and not len(sheet.conditional_formatting)
+            and not sheet._charts
+            and not sheet._images
+        )
+
+
+    def _row_count(self, sheet_name: str, sheet: Worksheet) -> int:
+        """
+        Return the last used row of a sheet, memoized until the workbook changes.
+
+        Args:
+            sheet_name (str): Name of the sheet, used as the cache key.
+            sheet (Worksheet): The sheet itself (regular or read-only).
+
+        Returns:
+            int: 1-based index of the last row.
+        """
+        count = self._row_count_cache.get(sheet_name)
+        if count is None:
+            count = self._row_count_cache[sheet_name] = self._sheet_max_row(sheet)
+        return count
+
+
+    @staticmethod
+    def _sheet_max_row(sheet: Worksheet) -> int:
+        """
+        Return the last used row of a worksheet.
+
+        Read-only worksheets take their size from the <dimension> element,
+        which some writers omit; in that case the size is computed by a scan.
+
+        Args:
+            sheet (Worksheet): Worksheet to inspect (regular or read-only).
+
+        Returns:
+            int: 1-based index of the last row.
+        """
+        if sheet.max_row is None:
+            sheet.calculate_dimension(force=True)
+        return sheet.max_row
+
+
+    @staticmethod
+    def _to_numeric_array(values: List[Any]) -> Union[List[Any], np.ndarray]:
+        """
+        Pack a column of numbers into a float64 array.
+
+        Args:
+            values (List[Any]): Column values.
+
+        Returns:
+            Union[List[Any], np.ndarray]: The array, or the original list if any
+            value is not an int or float (booleans, text and blanks included).
+        """
+        if not values or not all(type(v) in (int, float) for v in values):
+            return values
+        return np.fromiter(values, dtype=np.float64, count=len(values))
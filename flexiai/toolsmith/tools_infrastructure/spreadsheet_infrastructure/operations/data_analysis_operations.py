@@ -7,17 +7,29 @@ Provides high‑level functions for generating summaries, validating structure,
 and creating pivot tables in spreadsheet workbooks via the SpreadsheetManager.
 """
 
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import SpreadsheetManager
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import (
+    SpreadsheetManager,
+    has_open_transaction
+)
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.error_handler import handle_error_response
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import check_file_exists, get_full_path
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import check_file_exists, get_full_path, prefetch_files
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.memo import disk_memoize, file_fingerprint
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.exceptions.spreadsheet_exceptions import SpreadsheetError
 
 logger = logging.getLogger(__name__)
 
 
+def _in_transaction(path: str, file_name: str, **kw) -> bool:
+    # Inside a transaction the staged workbook, not the file on disk, is the truth.
+    return has_open_transaction(get_full_path(path, file_name))
+
+
+@disk_memoize(key=lambda path, file_name, **kw: file_fingerprint(path, file_name), bypass=_in_transaction)
 def generate_spreadsheet_summary(
     path: str = "flexiai/toolsmith/data/spreadsheets",
     file_name: str = "example_spreadsheet.xlsx"
@@ -40,8 +52,8 @@ def generate_spreadsheet_summary(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        summary = manager.generate_spreadsheet_summary()
+        with SpreadsheetManager(file_path=full_path, load_workbook=False) as manager:
+            summary = manager.generate_spreadsheet_summary()
         return {
             "status": True,
             "message": f"Spreadsheet summary generated successfully for '{file_name}'.",
@@ -55,6 +67,45 @@ def generate_spreadsheet_summary(
         return handle_error_response(f"Failed to generate summary: {e}")
 
 
+def _summarize_one(path: str, file_name: str) -> Dict[str, Any]:
+    """
+    Generate the summary entry for a single workbook.
+
+    Args:
+        path (str): Directory containing the workbook.
+        file_name (str): Workbook file name.
+
+    Returns:
+        Dict[str, Any]: {'status': bool, 'message': str, 'summary': Optional[Dict[str, Any]]}
+    """
+    full_path = get_full_path(path, file_name)
+    try:
+        check_file_exists(path, file_name)
+        # An unloaded manager reads sheet sizes from each sheet's <dimension>
+        # element, so no cell data is parsed for the summary.
+        with SpreadsheetManager(file_path=full_path, load_workbook=False) as manager:
+            summary = manager.generate_spreadsheet_summary()
+        return {
+            "status": True,
+            "message": f"Summary generated successfully for '{file_name}'.",
+            "summary": summary
+        }
+    except SpreadsheetError as e:
+        logger.error(f"SpreadsheetError for {file_name}: {e}")
+        return {
+            "status": False,
+            "message": str(e),
+            "summary": None
+        }
+    except Exception as e:
+        logger.exception(f"Unexpected error for {file_name}: {e}")
+        return {
+            "status": False,
+            "message": f"Failed to generate summary for '{file_name}': {e}",
+            "summary": None
+        }
+
+
 def retrieve_multiple_sheets_summary(
     files_list: List[Dict[str, str]],
     default_path: str,
@@ -63,6 +114,10 @@ def retrieve_multiple_sheets_summary(
     """
     Generate summaries for multiple workbooks.
 
+    Workbooks are summarized on a thread pool when more than two files are
+    requested; smaller requests run inline. The work is archive reads and XML
+    parsing, so threads overlap it without the start-up cost of processes.
+
     Args:
         files_list (List[Dict[str, str]]): Each dict with optional 'path' and 'file_name'.
         default_path (str): Fallback directory if 'path' missing.
@@ -77,38 +132,34 @@ def retrieve_multiple_sheets_summary(
             }, ...
         }
     """
-    summaries: Dict[str, Any] = {}
-    for file in files_list:
-        path = file.get('path', default_path)
-        file_name = file.get('file_name', default_file_name)
-        full_path = get_full_path(path, file_name)
-        try:
-            check_file_exists(path, file_name)
-            manager = SpreadsheetManager(file_path=full_path)
-            summary = manager.generate_spreadsheet_summary()
-            summaries[file_name] = {
-                "status": True,
-                "message": f"Summary generated successfully for '{file_name}'.",
-                "summary": summary
-            }
-        except SpreadsheetError as e:
-            logger.error(f"SpreadsheetError for {file_name}: {e}")
-            summaries[file_name] = {
-                "status": False,
-                "message": str(e),
-                "summary": None
-            }
-        except Exception as e:
-            logger.exception(f"Unexpected error for {file_name}: {e}")
-            summaries[file_name] = {
-                "status": False,
-                "message": f"Failed to generate summary for '{file_name}': {e}",
-                "summary": None
-            }
+    targets = [
+        (file.get('path', default_path), file.get('file_name', default_file_name))
+        for file in files_list
+    ]
+    paths = [path for path, _ in targets]
+    file_names = [file_name for _, file_name in targets]
+
+    # Queue reads for every workbook at once before the per-file parsing starts.
+    prefetch_files(get_full_path(path, file_name) for path, file_name in targets)
+
+    if len(targets) <= 2:
+        results = list(map(_summarize_one, paths, file_names))
+    else:
+        max_workers = min(len(targets), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_summarize_one, paths, file_names))
+
+    summaries: Dict[str, Any] = dict(zip(file_names, results))
     logger.info("Retrieved multiple sheets summaries.")
     return summaries
 
 
+@disk_memoize(
+    key=lambda path, file_name, required_sheets, required_headers: (
+        file_fingerprint(path, file_name), required_sheets, required_headers
+    ),
+    bypass=_in_transaction
+)
 def validate_spreadsheet_structure(
     required_sheets: List[str],
     required_headers: Dict[str, List[str]],
@@ -135,11 +186,11 @@ def validate_spreadsheet_structure(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        valid = manager.validate_spreadsheet_structure(
-            required_sheets=required_sheets,
-            required_headers=required_headers
-        )
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            valid = manager.validate_spreadsheet_structure(
+                required_sheets=required_sheets,
+                required_headers=required_headers
+            )
         message = "Spreadsheet structure is valid." if valid else "Spreadsheet structure is invalid."
         return {
             "status": valid,
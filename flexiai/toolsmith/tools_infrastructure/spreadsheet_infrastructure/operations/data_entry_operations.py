@@ -8,7 +8,7 @@ and updating columns in spreadsheet workbooks via the SpreadsheetManager.
 """
 
 import logging
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
 
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import SpreadsheetManager
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.error_handler import handle_error_response
@@ -77,7 +77,7 @@ def add_rows(
     path: str = "flexiai/toolsmith/data/spreadsheets",
     file_name: str = "example_spreadsheet.xlsx",
     sheet_name: str = "",
-    rows: List[List[Any]] = None
+    rows: Iterable[Sequence[Any]] = None
 ) -> Dict[str, Any]:
     """
     Add multiple rows of data to a sheet.
@@ -86,7 +86,7 @@ def add_rows(
         path (str, optional): Directory path to the workbook.
         file_name (str, optional): Name of the workbook file.
         sheet_name (str): Name of the sheet to which rows will be added.
-        rows (List[List[Any]]): List of rows, each a list of values.
+        rows (Iterable[Sequence[Any]]): Rows to add, each a sequence of values.
 
     Returns:
         Dict[str, Any]:
@@ -103,8 +103,7 @@ def add_rows(
     try:
         check_file_exists(path, file_name)
         manager = SpreadsheetManager(file_path=full_path)
-        manager.add_rows(sheet_name, rows)
-        count = len(rows or [])
+        count = manager.add_rows(sheet_name, rows)
         message = f"{count} rows added successfully to sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -126,20 +125,79 @@ def add_rows(
         return handle_error_response(f"Failed to add rows: {e}")
 
 
+def add_rows_bulk(
+    path: str = "flexiai/toolsmith/data/spreadsheets",
+    file_name: str = "example_spreadsheet.xlsx",
+    sheet_name: str = "",
+    rows: Iterable[Sequence[Any]] = None
+) -> Dict[str, Any]:
+    """
+    Add a large batch of rows to a sheet.
+
+    Rows are streamed through openpyxl's write-only mode when the workbook
+    is still empty; otherwise this behaves exactly like add_rows.
+
+    Args:
+        path (str, optional): Directory path to the workbook.
+        file_name (str, optional): Name of the workbook file.
+        sheet_name (str): Name of the sheet to which rows will be added.
+        rows (Iterable[Sequence[Any]]): Rows to add, each a sequence of values.
+
+    Returns:
+        Dict[str, Any]:
+            {
+                'status': bool,
+                'message': str,
+                'result': {
+                    'sheet_name': str,
+                    'rows_added': int
+                }
+            }
+    """
+    full_path = get_full_path(path, file_name)
+    try:
+        check_file_exists(path, file_name)
+        manager = SpreadsheetManager(file_path=full_path, load_workbook=False)
+        count = manager.add_rows_bulk(sheet_name, rows)
+        message = f"{count} rows added successfully to sheet '{sheet_name}'."
+        logger.info(message)
+        return {
+            "status": True,
+            "message": message,
+            "result": {
+                "sheet_name": sheet_name,
+                "rows_added": count
+            }
+        }
+    except SpreadsheetError as e:
+        logger.error(f"SpreadsheetError in add_rows_bulk: {e}")
+        return handle_error_response(str(e))
+    except KeyError as e:
+        logger.error(f"KeyError in add_rows_bulk: missing {e}")
+        return handle_error_response(f"Missing required parameter: {e}")
+    except Exception as e:
+        logger.exception(f"Unexpected error in add_rows_bulk: {e}")
+        return handle_error_response(f"Failed to add rows: {e}")
+
+
 def write_headers(
     path: str = "flexiai/toolsmith/data/spreadsheets",
     file_name: str = "example_spreadsheet.xlsx",
     sheet_name: str = "",
-    headers: List[str] = None
+    headers: List[str] = None,
+    rows: Optional[Iterable[Sequence[Any]]] = None
 ) -> Dict[str, Any]:
     """
-    Write a header row to a sheet.
+    Write a header row to a sheet, optionally followed by data rows.
+
+    Headers and rows are written in one batch, so the workbook is saved once.
 
     Args:
         path (str, optional): Directory path to the workbook.
         file_name (str, optional): Name of the workbook file.
         sheet_name (str): Name of the sheet where headers will be written.
         headers (List[str]): List of header labels.
+        rows (Iterable[Sequence[Any]], optional): Rows to append after the headers.
 
     Returns:
         Dict[str, Any]:
@@ -147,7 +205,8 @@ def write_headers(
                 'status': bool,
                 'message': str,
                 'result': {
-                    'headers': List[str]
+                    'headers': List[str],
+                    'rows_added': int
                 }
             }
     """
@@ -155,14 +214,21 @@ def write_headers(
     try:
         check_file_exists(path, file_name)
         manager = SpreadsheetManager(file_path=full_path)
-        manager.write_headers(sheet_name, headers)
+        count = 0
+        with manager.batch():
+            manager.write_headers(sheet_name, headers)
+            if rows:
+                count = manager.add_rows(sheet_name, rows)
         message = f"Headers written successfully to sheet '{sheet_name}'."
+        if count:
+            message = f"Headers and {count} rows written successfully to sheet '{sheet_name}'."
         logger.info(message)
         return {
             "status": True,
             "message": message,
             "result": {
-                "headers": headers
+                "headers": headers,
+                "rows_added": count
             }
         }
     except SpreadsheetError as e:
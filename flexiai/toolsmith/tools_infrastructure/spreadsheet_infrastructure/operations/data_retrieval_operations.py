@@ -8,7 +8,9 @@ and filtering rows in spreadsheet workbooks via the SpreadsheetManager.
 """
 
 import logging
-from typing import Dict, Any, Union, List
+from typing import Dict, Any, Union, List, Optional
+
+from openpyxl.utils.cell import coordinate_from_string
 
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import SpreadsheetManager
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.error_handler import handle_error_response
@@ -47,8 +49,9 @@ def retrieve_cell(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        value = manager.retrieve_cell(sheet_name, cell)
+        column_letter, row_number = coordinate_from_string(cell)
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            value = manager.retrieve_cell(sheet_name, column_letter, row_number, has_headers=False)
         message = f"Value retrieved from cell '{cell}' in sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -101,8 +104,8 @@ def retrieve_row(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        row_data = manager.retrieve_row(sheet_name, row_id, skip_header=skip_header)
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            row_data = manager.retrieve_row(sheet_name, row_id, skip_header=skip_header)
         message = f"Data retrieved from row '{row_id}' in sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -129,6 +132,7 @@ def retrieve_column(
     column_identifier: Union[str, int],
     skip_header: bool = False,
     has_headers: bool = True,
+    as_array: bool = False,
     path: str = "flexiai/toolsmith/data/spreadsheets",
     file_name: str = "example_spreadsheet.xlsx"
 ) -> Dict[str, Any]:
@@ -140,6 +144,8 @@ def retrieve_column(
         column_identifier (Union[str,int]): Column letter, 1-based index, or header name.
         skip_header (bool, optional): If True, skip the first row. Defaults to False.
         has_headers (bool, optional): If True, allows header-based identification. Defaults to True.
+        as_array (bool, optional): If True, numeric columns are returned as a float64 numpy array.
+            Defaults to False.
         path (str, optional): Directory containing the workbook.
         file_name (str, optional): Workbook file name.
 
@@ -150,20 +156,21 @@ def retrieve_column(
                 'message': str,
                 'result': {
                     'column_identifier': Union[str,int],
-                    'column_data': List[Any]
+                    'column_data': Union[List[Any], numpy.ndarray]
                 }
             }
     """
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        column_data = manager.retrieve_column(
-            sheet_name,
-            column_identifier,
-            skip_header=skip_header,
-            has_headers=has_headers
-        )
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            column_data = manager.retrieve_column(
+                sheet_name,
+                column_identifier,
+                skip_header=skip_header,
+                has_headers=has_headers,
+                as_array=as_array
+            )
         message = f"Data retrieved from column '{column_identifier}' in sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -192,6 +199,7 @@ def filter_rows(
     condition_value: str,
     skip_header: bool = True,
     has_headers: bool = True,
+    max_results: Optional[int] = 1000,
     path: str = "flexiai/toolsmith/data/spreadsheets",
     file_name: str = "example_spreadsheet.xlsx"
 ) -> Dict[str, Any]:
@@ -201,10 +209,12 @@ def filter_rows(
     Args:
         sheet_name (str): Name of the sheet.
         column_identifier (Union[str,int]): Column letter, 1-based index, or header name.
-        condition_type (str): Condition type ('equals', 'greater_than', etc.).
+        condition_type (str): Condition type ('equals', 'greater_than', 'less_than', 'contains',
+            'startswith', 'endswith', or 'matches' for a regular expression search).
         condition_value (str): Value to compare against.
         skip_header (bool, optional): If True, skip the first row. Defaults to True.
         has_headers (bool, optional): If True, allows header-based identification. Defaults to True.
+        max_results (Optional[int], optional): Stop after this many matches; None for no limit. Defaults to 1000.
         path (str, optional): Directory containing the workbook.
         file_name (str, optional): Workbook file name.
 
@@ -214,29 +224,41 @@ def filter_rows(
                 'status': bool,
                 'message': str,
                 'result': {
-                    'filtered_rows': List[List[Any]]
+                    'filtered_rows': List[List[Any]],
+                    'truncated': bool  # True if more than max_results rows matched
                 }
             }
     """
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        filtered = manager.filter_rows(
-            sheet_name,
-            column_identifier,
-            condition_type,
-            condition_value,
-            skip_header=skip_header,
-            has_headers=has_headers
-        )
-        message = f"Rows filtered in sheet '{sheet_name}' by '{condition_type}'."
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            filtered = manager.filter_rows(
+                sheet_name,
+                column_identifier,
+                condition_type,
+                condition_value,
+                skip_header=skip_header,
+                has_headers=has_headers,
+                # One extra match tells a full page apart from a truncated one.
+                max_results=None if max_results is None else max_results + 1
+            )
+        truncated = max_results is not None and len(filtered) > max_results
+        if truncated:
+            filtered = filtered[:max_results]
+            message = (
+                f"Rows filtered in sheet '{sheet_name}' by '{condition_type}'; "
+                f"showing the first {max_results} matches (max_results), more rows match."
+            )
+        else:
+            message = f"Rows filtered in sheet '{sheet_name}' by '{condition_type}'."
         logger.info(message)
         return {
             "status": True,
             "message": message,
             "result": {
-                "filtered_rows": filtered
+                "filtered_rows": filtered,
+                "truncated": truncated
             }
         }
     except SpreadsheetError as e:
@@ -282,13 +304,13 @@ def retrieve_rows(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        rows_data = manager.retrieve_rows(
-            sheet_name=sheet_name,
-            start_row=start_row,
-            max_rows=max_rows,
-            skip_header=skip_header
-        )
+        with SpreadsheetManager(file_path=full_path, read_only=True) as manager:
+            rows_data = manager.retrieve_rows(
+                sheet_name=sheet_name,
+                start_row=start_row,
+                max_rows=max_rows,
+                skip_header=skip_header
+            )
         message = f"Rows retrieved from sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -94,8 +94,8 @@ def unpivot_data(
     full_path = get_full_path(path, file_name)
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        long_format = manager.unpivot_data(sheet_name)
+        with SpreadsheetManager(file_path=full_path, load_workbook=False) as manager:
+            long_format = manager.unpivot_data(sheet_name)
         message = f"Data unpivoted successfully in sheet '{sheet_name}'."
         logger.info(message)
         return {
@@ -4,16 +4,22 @@
 file_operations module.
 
 Provides high‑level functions for creating and deleting spreadsheet workbooks
-via the SpreadsheetManager.
+via the SpreadsheetManager, and for batching several writes into a single save
+with workbook transactions.
 """
 
 import os
 import logging
 from typing import Dict, Any
 
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import SpreadsheetManager
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import (
+    SpreadsheetManager,
+    begin_transaction,
+    commit_transaction,
+    abort_transaction
+)
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.error_handler import handle_error_response
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import get_full_path
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import check_file_exists, get_full_path
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.exceptions.spreadsheet_exceptions import SpreadsheetError
 
 logger = logging.getLogger(__name__)
@@ -95,7 +101,7 @@ def delete_workbook(
     try:
         full_path = get_full_path(path, file_name)
 
-        manager = SpreadsheetManager(file_path=full_path)
+        manager = SpreadsheetManager(file_path=full_path, load_workbook=False)
         manager.delete_workbook()
 
         message = f"Workbook '{file_name}' deleted successfully from '{path}'."
@@ -111,3 +117,131 @@ def delete_workbook(
     except Exception as e:
         logger.exception(f"Unexpected error in delete_workbook: {e}")
         return handle_error_response(f"Failed to delete workbook '{file_name}': {e}")
+
+
+def transaction_begin(
+    path: str = "flexiai/toolsmith/data/spreadsheets",
+    file_name: str = "example_spreadsheet.xlsx"
+) -> Dict[str, Any]:
+    """
+    Start a transaction on a workbook.
+
+    Until transaction_commit (or transaction_abort) is called, every operation on
+    this workbook works on a single in-memory copy and writes are not saved to
+    disk. A transaction left idle for TRANSACTION_IDLE_SECONDS, or still open
+    when the interpreter exits, is committed automatically.
+
+    Args:
+        path (str, optional): Directory containing the workbook.
+        file_name (str, optional): Name of the workbook file.
+
+    Returns:
+        Dict[str, Any]:
+            {
+                "status": bool,
+                "message": str,
+                "result": {
+                    "file_path": str
+                }
+            }
+    """
+    full_path = get_full_path(path, file_name)
+    try:
+        check_file_exists(path, file_name)
+        begin_transaction(full_path)
+
+        message = f"Transaction started for workbook '{file_name}'."
+        logger.info(message)
+        return {
+            "status": True,
+            "message": message,
+            "result": {"file_path": full_path}
+        }
+    except SpreadsheetError as e:
+        logger.error(f"SpreadsheetError in transaction_begin: {e}")
+        return handle_error_response(str(e))
+    except Exception as e:
+        logger.exception(f"Unexpected error in transaction_begin: {e}")
+        return handle_error_response(f"Failed to start transaction on '{file_name}': {e}")
+
+
+def transaction_commit(
+    path: str = "flexiai/toolsmith/data/spreadsheets",
+    file_name: str = "example_spreadsheet.xlsx"
+) -> Dict[str, Any]:
+    """
+    Commit the open transaction on a workbook, saving it once if it was modified.
+
+    Args:
+        path (str, optional): Directory containing the workbook.
+        file_name (str, optional): Name of the workbook file.
+
+    Returns:
+        Dict[str, Any]:
+            {
+                "status": bool,
+                "message": str,
+                "result": {
+                    "file_path": str,
+                    "saved": bool
+                }
+            }
+    """
+    full_path = get_full_path(path, file_name)
+    try:
+        saved = commit_transaction(full_path)
+
+        message = f"Transaction committed for workbook '{file_name}'."
+        logger.info(message)
+        return {
+            "status": True,
+            "message": message,
+            "result": {"file_path": full_path, "saved": saved}
+        }
+    except SpreadsheetError as e:
+        logger.error(f"SpreadsheetError in transaction_commit: {e}")
+        return handle_error_response(str(e))
+    except Exception as e:
+        logger.exception(f"Unexpected error in transaction_commit: {e}")
+        return handle_error_response(f"Failed to commit transaction on '{file_name}': {e}")
+
+
+def transaction_abort(
+    path: str = "flexiai/toolsmith/data/spreadsheets",
+    file_name: str = "example_spreadsheet.xlsx"
+) -> Dict[str, Any]:
+    """
+    Abort the open transaction on a workbook, discarding its staged writes.
+
+    Args:
+        path (str, optional): Directory containing the workbook.
+        file_name (str, optional): Name of the workbook file.
+
+    Returns:
+        Dict[str, Any]:
+            {
+                "status": bool,
+                "message": str,
+                "result": {
+                    "file_path": str,
+                    "discarded": bool
+                }
+            }
+    """
+    full_path = get_full_path(path, file_name)
+    try:
+        discarded = abort_transaction(full_path)
+
+        message = f"Transaction aborted for workbook '{file_name}'."
+        logger.info(message)
+        return {
+            "status": True,
+            "message": message,
+            "result": {"file_path": full_path, "discarded": discarded}
+        }
+    except SpreadsheetError as e:
+        logger.error(f"SpreadsheetError in transaction_abort: {e}")
+        return handle_error_response(str(e))
+    except Exception as e:
+        logger.exception(f"Unexpected error in transaction_abort: {e}")
+        return handle_error_response(f"Failed to abort transaction on '{file_name}': {e}")
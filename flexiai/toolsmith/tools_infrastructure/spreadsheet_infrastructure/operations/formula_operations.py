@@ -199,8 +199,8 @@ def evaluate_formula(
 
     try:
         check_file_exists(path, file_name)
-        manager = SpreadsheetManager(file_path=full_path)
-        value = manager.evaluate_formula(sheet_name, cell)
+        with SpreadsheetManager(file_path=full_path, load_workbook=False) as manager:
+            value = manager.evaluate_formula(sheet_name, cell)
 
         message = f"Evaluated formula in '{cell}' on sheet '{sheet_name}'. Value: {value}"
         logger.info(message)
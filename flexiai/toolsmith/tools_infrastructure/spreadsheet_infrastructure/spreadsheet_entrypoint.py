@@ -1,10 +1,16 @@
 # FILE: flexiai/toolsmith/tools_infrastructure/spreadsheet_infrastructure/spreadsheet_entrypoint.py
 
+import asyncio
+import functools
+import inspect
 import logging
-from typing import Dict, Any, List, Optional
+import sys
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, List, Optional, Tuple
 
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.error_handler import handle_error_response
-from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import check_file_exists
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import check_file_exists, get_full_path
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import workbook_lock
+from flexiai.toolsmith.tools_infrastructure.dispatch_helpers import pick, required_message
 
 # ------------------------------------------------------------------------------
 # Import the actual implementations from the 'operations' folder.
@@ -13,7 +19,10 @@ from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.fil
 # 1) FileManagement operations
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.operations.file_operations import (
     create_workbook,
-    delete_workbook
+    delete_workbook,
+    transaction_begin,
+    transaction_commit,
+    transaction_abort
 )
 
 # 2) SheetManagement operations
@@ -27,6 +36,7 @@ from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.operation
 from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.operations.data_entry_operations import (
     add_row,
     add_rows,
+    add_rows_bulk,
     write_headers,
     delete_row,
     update_column
@@ -86,6 +96,41 @@ from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.operation
 
 logger = logging.getLogger(__name__)
 
+# Row count from which add_rows is routed to the bulk (write-only) writer.
+BULK_THRESHOLD = 1000
+
+_UNSUPPORTED_TEMPLATE = "Unsupported %s operation: %s"
+
+
+def _response(status: bool, message: str, result: Any = None) -> Dict[str, Any]:
+    """
+    Build a standardized dispatcher response.
+
+    Args:
+        status (bool): Whether the operation succeeded.
+        message (str): Human-readable outcome.
+        result (Any, optional): JSON-native payload (lists, dicts, str, int, float, bool or None).
+
+    Returns:
+        Dict[str, Any]: {'status': bool, 'message': str, 'result': Any}
+    """
+    return {"status": status, "message": message, "result": result}
+
+
+def _unsupported(kind: str, operation: str) -> Dict[str, Any]:
+    """
+    Log and build the response for an operation a dispatcher does not support.
+
+    Args:
+        kind (str): Dispatcher family, e.g. "file" or "data retrieval".
+        operation (str): The operation name that was requested.
+
+    Returns:
+        Dict[str, Any]: Failed standardized response.
+    """
+    logger.warning(_UNSUPPORTED_TEMPLATE, kind, operation)
+    return _response(False, _UNSUPPORTED_TEMPLATE % (kind, operation))
+
 
 # ------------------------------------------------------------------------------
 # 1. FileManagement dispatcher (file_operations)
@@ -99,7 +144,8 @@ def file_operations(
     Performs file-level workbook operations such as creating or deleting .xlsx files.
 
     Args:
-        operation (str): The file-level operation to perform ("create_workbook" or "delete_workbook").
+        operation (str): The file-level operation to perform ("create_workbook", "delete_workbook",
+            "transaction_begin", "transaction_commit" or "transaction_abort").
         path (str, optional): Directory to save or find the workbook. Defaults to 'flexiai.toolsmith/data/spreadsheets'.
         file_name (str, optional): Name of the workbook file. Defaults to 'example_spreadsheet.xlsx'.
 
@@ -110,14 +156,14 @@ def file_operations(
         return create_workbook(path=path, file_name=file_name)
     elif operation == "delete_workbook":
         return delete_workbook(path=path, file_name=file_name)
+    elif operation == "transaction_begin":
+        return transaction_begin(path=path, file_name=file_name)
+    elif operation == "transaction_commit":
+        return transaction_commit(path=path, file_name=file_name)
+    elif operation == "transaction_abort":
+        return transaction_abort(path=path, file_name=file_name)
     else:
-        message = f"Unsupported file operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+        return _unsupported("file", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -156,11 +202,7 @@ def sheet_operations(
             return handle_error_response("Parameter 'sheet_name' is required for 'delete_sheet' operation.")
         return delete_sheet(sheet_name=sheet_name, path=path, file_name=file_name)
     else:
-        return {
-            "status": False,
-            "message": f"Unsupported sheet operation: {operation}",
-            "result": None
-        }
+        return _unsupported("sheet", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -190,7 +232,8 @@ def data_entry_operations(
         file_name (str): Name of the workbook file.
         sheet_name (str): Target sheet for the operation.
         data (List[str]): Row data for add_row.
-        rows (List[List[str]]): Multiple rows for add_rows.
+        rows (List[List[str]]): Multiple rows for add_rows, or rows written after the
+            headers in the same save for write_headers.
         headers (List[str]): Headers for write_headers.
         row_id (str): Row identifier for delete_row.
         column_name (str): Column to update for update_column (could be letter/index/header).
@@ -214,7 +257,10 @@ def data_entry_operations(
     elif operation == "add_rows":
         if not sheet_name or not rows:
             return handle_error_response("Parameters 'sheet_name' and 'rows' are required for 'add_rows' operation.")
-        return add_rows(
+        # Large batches go through the bulk writer, which streams rows into
+        # empty workbooks instead of materialising a Cell per value.
+        writer = add_rows_bulk if len(rows) >= BULK_THRESHOLD else add_rows
+        return writer(
             path=path,
             file_name=file_name,
             sheet_name=sheet_name,
@@ -228,7 +274,8 @@ def data_entry_operations(
             path=path,
             file_name=file_name,
             sheet_name=sheet_name,
-            headers=headers
+            headers=headers,
+            rows=rows
         )
 
     elif operation == "delete_row":
@@ -259,11 +306,7 @@ def data_entry_operations(
         )
 
     else:
-        return {
-            "status": False,
-            "message": f"Unsupported data entry operation: {operation}",
-            "result": None
-        }
+        return _unsupported("data entry", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -281,14 +324,28 @@ def data_retrieval_operations(
     condition_value: Optional[str] = None,
     start_row: int = 1,
     max_rows: int = 20,
-    include_headers: bool = False,   # Original param (some folks prefer 'skip_header')
-    skip_header: bool = True,        # Possibly we want both? Or unify them.
-    has_headers: bool = True         # <-- new param if you want to interpret column_name as a header
+    include_headers: bool = False,
+    skip_header: Optional[bool] = None,
+    has_headers: bool = True,        # <-- new param if you want to interpret column_name as a header
+    max_results: Optional[int] = 1000,
+    as_array: bool = False
 ) -> Dict[str, Any]:
     """
     Performs data-retrieval operations such as retrieving cells, rows, columns,
     filtering, and paginated retrieval.
+
+    Header handling has a single source of truth: if 'skip_header' is given it
+    wins, otherwise the header row is skipped unless 'include_headers' is True.
+    The resulting flag is used by retrieve_row, filter_rows, retrieve_rows and
+    retrieve_column with 'as_array'. A plain retrieve_column list keeps the header
+    row unless 'skip_header' is passed explicitly.
+
+    filter_rows stops scanning once 'max_results' matches are found (None for no limit)
+    and sets 'truncated' in its result when more rows matched than were returned.
+    retrieve_column returns a numpy array for numeric columns when 'as_array' is True.
     """
+    effective_skip_header = skip_header if skip_header is not None else (not include_headers)
+
     if operation == "retrieve_cell":
         if not sheet_name or not cell:
             return handle_error_response("Parameters 'sheet_name' and 'cell' are required for 'retrieve_cell' operation.")
@@ -302,12 +359,14 @@ def data_retrieval_operations(
     elif operation == "retrieve_row":
         if not sheet_name or not row_id:
             return handle_error_response("Parameters 'sheet_name' and 'row_id' are required for 'retrieve_row' operation.")
-        # If row_id is provided as a string, you might convert to int if needed:
-        row_num = int(row_id)
+        try:
+            row_num = int(row_id)
+        except (TypeError, ValueError):
+            return handle_error_response(f"Invalid row_id '{row_id}'. Must be an integer.")
         return retrieve_row(
             sheet_name=sheet_name,
             row_id=row_num,
-            skip_header=skip_header,
+            skip_header=effective_skip_header,
             path=path,
             file_name=file_name
         )
@@ -319,8 +378,10 @@ def data_retrieval_operations(
         return retrieve_column(
             sheet_name=sheet_name,
             column_identifier=column_name,
-            skip_header=False,   # or skip_header if you want to allow skipping first row
+            # Lists keep the header unless asked otherwise; a numeric array cannot hold it.
+            skip_header=effective_skip_header if as_array else bool(skip_header),
             has_headers=has_headers,
+            as_array=as_array,
             path=path,
             file_name=file_name
         )
@@ -335,8 +396,9 @@ def data_retrieval_operations(
             column_identifier=column_name,  # We rename for manager
             condition_type=condition_type,
             condition_value=condition_value,
-            skip_header=skip_header,        # Could be True or False
+            skip_header=effective_skip_header,
             has_headers=has_headers,        # If you want to interpret col as a header name
+            max_results=max_results,
             path=path,
             file_name=file_name
         )
@@ -344,26 +406,16 @@ def data_retrieval_operations(
     elif operation == "retrieve_rows":
         if not sheet_name:
             return handle_error_response("Parameter 'sheet_name' is required for 'retrieve_rows' operation.")
-        # We might unify 'include_headers' & 'skip_header' into a single policy. 
-        # For now, we show how you can pass them as needed:
         return retrieve_rows(
             sheet_name=sheet_name,
             start_row=start_row,
             max_rows=max_rows,
-            # For example, some people prefer skip_header = not include_headers
-            # or we pass them both. We'll assume retrieve_rows manager uses skip_header:
-            skip_header=not include_headers,  
+            skip_header=effective_skip_header,
             path=path,
             file_name=file_name
         )
     else:
-        message = f"Unsupported data retrieval operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+        return _unsupported("data retrieval", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -429,7 +481,7 @@ def data_analysis_operations(
             default_file_name=file_name
         )
     else:
-        return handle_error_response(f"Unsupported data analysis operation: {operation}")
+        return _unsupported("data analysis", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -548,13 +600,7 @@ def formula_operations(
         )
     
     else:
-        message = f"Unsupported formula operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+        return _unsupported("formula", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -605,13 +651,7 @@ def formatting_operations(
             formatting_rules=formatting_rules
         )
     else:
-        message = f"Unsupported formatting operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+        return _unsupported("formatting", operation)
 
 
 # ------------------------------------------------------------------------------
@@ -668,18 +708,24 @@ def data_validation_operations(
             range_to_remove=range_to_remove  # Pass the new parameter
         )
     else:
-        message = f"Unsupported data validation operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+        return _unsupported("data validation", operation)
 
 
 # ------------------------------------------------------------------------------
 # 9. DataTransformation dispatcher (data_transformation_operations)
 # ------------------------------------------------------------------------------
+# operation -> (handler, required parameters, kwargs builder). path and file_name
+# are always passed to the handler.
+_TRANSFORMATION_OPS: Dict[str, Tuple[Callable[..., Dict[str, Any]], Tuple[str, ...], Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "transpose_data": (
+        transpose_data,
+        ("source_range", "destination_range"),
+        pick("source_range", "destination_range"),
+    ),
+    "unpivot_data": (unpivot_data, ("sheet_name",), pick("sheet_name")),
+}
+
+
 def data_transformation_operations(
     operation: str,
     path: str = "flexiai.toolsmith/data/spreadsheets",
@@ -688,7 +734,9 @@ def data_transformation_operations(
     source_range: Optional[str] = None,
     destination_range: Optional[str] = None
 ) -> Dict[str, Any]:
-    logger.info(f"Starting data transformation operation: '{operation}' on file '{file_name}' at path '{path}'.")
+    # Snapshot of the call arguments, consumed by the _TRANSFORMATION_OPS kwargs builders.
+    params = dict(locals())
+    logger.info("Starting data transformation operation: '%s' on file '%s' at path '%s'.", operation, file_name, path)
 
     # Validate file existence
     try:
@@ -698,50 +746,50 @@ def data_transformation_operations(
         logger.error(error_message)
         return handle_error_response(error_message)
 
-    if operation == "transpose_data":
-        if not source_range or not destination_range:
-            error_message = "Parameters 'source_range' and 'destination_range' are required for 'transpose_data' operation."
-            logger.error(error_message)
-            return handle_error_response(error_message)
-        
-        logger.debug(f"Transposing data from '{source_range}' to '{destination_range}'.")
-        result = transpose_data(
-            source_range=source_range,
-            destination_range=destination_range,
-            path=path,
-            file_name=file_name
-        )
-        logger.info(f"Transpose operation completed with status: {result.get('status')}.")
-        return result
-
-    elif operation == "unpivot_data":
-        if not sheet_name:
-            error_message = "Parameter 'sheet_name' is required for 'unpivot_data' operation."
-            logger.error(error_message)
-            return handle_error_response(error_message)
-        
-        logger.debug(f"Unpivoting data in sheet '{sheet_name}'.")
-        result = unpivot_data(
-            sheet_name=sheet_name,
-            path=path,
-            file_name=file_name
-        )
-        logger.info(f"Unpivot operation completed with status: {result.get('status')}.")
-        return result
+    entry = _TRANSFORMATION_OPS.get(operation)
+    if entry is None:
+        return _unsupported("data transformation", operation)
 
-    else:
-        error_message = f"Unsupported data transformation operation: {operation}"
+    handler, required, build_kwargs = entry
+    if not all(params[name] for name in required):
+        error_message = required_message(required, operation)
         logger.error(error_message)
-        return {
-            "status": False,
-            "message": error_message,
-            "result": None
-        }
+        return handle_error_response(error_message)
+
+    kwargs = build_kwargs(params)
+    logger.debug("Running '%s' with %s.", operation, kwargs)
+    result = handler(path=path, file_name=file_name, **kwargs)
+    logger.info("Data transformation '%s' completed with status: %s.", operation, result.get("status"))
+    return result
 
 
 # ------------------------------------------------------------------------------
 # 10. Chart and Graphics dispatcher (chart_operations)
 # ------------------------------------------------------------------------------
+# operation -> (handler, required parameters, kwargs builder). path and file_name
+# are always passed to the handler.
+_CHART_OPS: Dict[str, Tuple[Callable[..., Dict[str, Any]], Tuple[str, ...], Callable[[Dict[str, Any]], Dict[str, Any]]]] = {
+    "create_chart": (
+        create_chart,
+        ("sheet_name", "chart_type", "data_range"),
+        pick(
+            "sheet_name", "chart_type", "data_range", "categories_range", "destination_cell",
+            "title", "x_title", "y_title", "legend_position", "style", "show_data_labels",
+            "overlap", "grouping", "series_names",
+        ),
+    ),
+    "update_chart": (
+        update_chart,
+        ("sheet_name", "chart_title"),
+        pick(
+            "sheet_name", "chart_title", "new_data_range", "new_categories_range",
+            "new_title", "new_x_title", "new_y_title",
+        ),
+    ),
+    "remove_chart": (remove_chart, ("sheet_name", "chart_title"), pick("sheet_name", "chart_title")),
+}
+
+
 def chart_operations(
     operation: str,
     path: str = "flexiai.toolsmith/data/spreadsheets",
@@ -805,74 +853,79 @@ def chart_operations(
     Returns:
         Dict[str, Any]: Standardized response dict with status, message, and result.
     """
-    # 1) create_chart
-    if operation == "create_chart":
-        # Validate required parameters
-        if not sheet_name or not chart_type or not data_range:
-            return handle_error_response(
-                "Parameters 'sheet_name', 'chart_type', and 'data_range' are required for 'create_chart' operation."
-            )
+    # Tool input arrives as fresh strings; interning lets the table lookup match the
+    # (compiler-interned) literal keys by identity.
+    operation = sys.intern(operation) if isinstance(operation, str) else operation
+    # Snapshot of the call arguments, consumed by the _CHART_OPS kwargs builders.
+    params = dict(locals())
+    entry = _CHART_OPS.get(operation)
+    if entry is None:
+        return _unsupported("chart", operation)
 
-        return create_chart(
-            sheet_name=sheet_name,
-            chart_type=chart_type,
-            data_range=data_range,
-            categories_range=categories_range,
-            destination_cell=destination_cell,
-            title=title,
-            x_title=x_title,
-            y_title=y_title,
-            legend_position=legend_position,
-            style=style,
-            show_data_labels=show_data_labels,
-            overlap=overlap,
-            grouping=grouping,
-            series_names=series_names,
-            path=path,
-            file_name=file_name
-        )
+    handler, required, build_kwargs = entry
+    if not all(params[name] for name in required):
+        return handle_error_response(required_message(required, operation))
 
-    # 2) update_chart
-    elif operation == "update_chart":
-        # Validate required parameters
-        if not sheet_name or not chart_title:
-            return handle_error_response(
-                "Parameters 'sheet_name' and 'chart_title' are required for 'update_chart' operation."
-            )
-        
-        return update_chart(
-            sheet_name=sheet_name,
-            chart_title=chart_title,
-            new_data_range=new_data_range,
-            new_categories_range=new_categories_range,
-            new_title=new_title,
-            new_x_title=new_x_title,
-            new_y_title=new_y_title,
-            path=path,
-            file_name=file_name
-        )
+    return handler(path=path, file_name=file_name, **build_kwargs(params))
 
-    # 3) remove_chart
-    elif operation == "remove_chart":
-        # Validate required parameters
-        if not sheet_name or not chart_title:
-            return handle_error_response(
-                "Parameters 'sheet_name' and 'chart_title' are required for 'remove_chart' operation."
-            )
-        
-        return remove_chart(
-            sheet_name=sheet_name,
-            chart_title=chart_title,
-            path=path,
-            file_name=file_name
-        )
 
-    else:
-        message = f"Unsupported chart operation: {operation}"
-        logger.warning(message)
-        return {
-            "status": False,
-            "message": message,
-            "result": None
-        }
+# ------------------------------------------------------------------------------
+# 11. Async dispatchers (*_operations_async)
+# ------------------------------------------------------------------------------
+def _to_async(
+    dispatcher: Callable[..., Dict[str, Any]],
+    read_operations: FrozenSet[str] = frozenset()
+) -> Callable[..., Awaitable[Dict[str, Any]]]:
+    """
+    Wrap a blocking dispatcher so it runs in a worker thread.
+
+    Independent tool calls awaited together (e.g. with asyncio.gather) then
+    overlap their workbook I/O instead of running one after another. Every
+    operation not listed in read_operations loads, mutates and saves the
+    workbook, so those calls hold the workbook's lock (workbook_lock) for their
+    whole run: concurrent writes to one file are serialized instead of losing
+    each other's updates, while reads and writes to other files still overlap.
+
+    Args:
+        dispatcher (Callable[..., Dict[str, Any]]): Synchronous dispatcher.
+        read_operations (FrozenSet[str], optional): Operations that only read.
 
+    Returns:
+        Callable[..., Awaitable[Dict[str, Any]]]: Coroutine function with the same arguments.
+    """
+    signature = inspect.signature(dispatcher)
+
+    def run(*args, **kwargs) -> Dict[str, Any]:
+        bound = signature.bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = bound.arguments
+        if arguments["operation"] in read_operations:
+            return dispatcher(*args, **kwargs)
+        with workbook_lock(get_full_path(arguments["path"], arguments["file_name"])):
+            return dispatcher(*args, **kwargs)
+
+    @functools.wraps(dispatcher)
+    async def wrapper(*args, **kwargs) -> Dict[str, Any]:
+        return await asyncio.to_thread(run, *args, **kwargs)
+
+    wrapper.__name__ = f"{dispatcher.__name__}_async"
+    wrapper.__qualname__ = wrapper.__name__
+    return wrapper
+
+
+file_operations_async = _to_async(file_operations)
+sheet_operations_async = _to_async(sheet_operations)
+data_entry_operations_async = _to_async(data_entry_operations)
+data_retrieval_operations_async = _to_async(
+    data_retrieval_operations,
+    frozenset({"retrieve_cell", "retrieve_row", "retrieve_column", "filter_rows", "retrieve_rows"})
+)
+data_analysis_operations_async = _to_async(
+    data_analysis_operations,
+    frozenset({"generate_spreadsheet_summary", "validate_spreadsheet_structure", "retrieve_multiple_sheets_summary"})
+)
+formula_operations_async = _to_async(formula_operations, frozenset({"evaluate_formula"}))
+formatting_operations_async = _to_async(formatting_operations)
+data_validation_operations_async = _to_async(data_validation_operations)
+data_transformation_operations_async = _to_async(data_transformation_operations, frozenset({"unpivot_data"}))
+chart_operations_async = _to_async(chart_operations)
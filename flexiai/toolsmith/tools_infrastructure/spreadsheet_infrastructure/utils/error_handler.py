@@ -11,6 +11,8 @@ import logging
 from typing import Any, Optional, Dict
 from pydantic import BaseModel, Field
 
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.mixed_helpers import SafeOutput
+
 logger = logging.getLogger(__name__)
 
 
@@ -31,16 +33,23 @@ class OperationResponse(BaseModel):
         """
         Convert the OperationResponse model into a plain dictionary.
 
+        The three fields are read directly instead of going through model_dump(),
+        which is far slower for this fixed shape; result is returned as is.
+
         Returns:
             Dict[str, Any]: The response as a dictionary.
         """
-        return self.model_dump()
+        return {"status": self.status, "message": self.message, "result": self.result}
 
 
 def handle_error_response(message: str) -> Dict[str, Any]:
     """
     Generate a standardized error response dictionary.
 
+    The dict is built directly rather than through OperationResponse: this runs on
+    every failed operation and the fields need no validation. It is returned as a
+    SafeOutput, since its values are always JSON-native.
+
     Args:
         message (str): Error message to include in the response.
 
@@ -48,9 +57,4 @@ def handle_error_response(message: str) -> Dict[str, Any]:
         Dict[str, Any]: A dict with status=False, the error message, and result=None.
     """
     logger.error(message)
-    response = OperationResponse(
-        status=False,
-        message=message,
-        result=None
-    )
-    return response.to_dict()
+    return SafeOutput(status=False, message=message, result=None)
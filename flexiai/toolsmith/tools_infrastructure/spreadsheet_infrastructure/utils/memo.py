@@ -0,0 +1,277 @@
+# FILE: flexiai/toolsmith/tools_infrastructure/spreadsheet_infrastructure/utils/memo.py
+
+"""
+memo module.
+
+Provides a disk-backed memoization decorator for spreadsheet operations whose
+result depends only on the workbook contents, plus a helper to fingerprint a
+workbook file by path, modification time, size and archive directory.
+
+The cache is opt-in: it is only used when the FLEXIAI_MEMO_CACHE environment
+variable is set to 1/true/yes. Cache files live in a private per-user directory
+(mode 0700) and are evicted by age and by count, so the cache neither trusts
+files other users could plant nor grows without bound.
+"""
+
+import os
+import json
+import time
+import zipfile
+import hashlib
+import inspect
+import logging
+import tempfile
+import threading
+import functools
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils.file_handler import get_full_path
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "flexiai_toolsmith",
+    "memo"
+)
+
+MEMO_CACHE_ENV = "FLEXIAI_MEMO_CACHE"
+
+# Entries older than this are ignored and removed; past MAX_CACHE_FILES the
+# oldest entries are removed. The directory is only scanned every
+# EVICT_EVERY_WRITES writes, so it can briefly hold that many extra entries.
+MAX_CACHE_AGE_SECONDS = 7 * 24 * 3600
+MAX_CACHE_FILES = 512
+EVICT_EVERY_WRITES = 32
+
+_writes_since_evict: Dict[str, int] = {}
+_writes_lock = threading.Lock()
+
+
+def memo_cache_enabled() -> bool:
+    """
+    Tell whether the disk cache is switched on through FLEXIAI_MEMO_CACHE.
+
+    Returns:
+        bool: True if the variable is set to 1, true or yes.
+    """
+    return os.environ.get(MEMO_CACHE_ENV, "").strip().lower() in ("1", "true", "yes")
+
+
+def file_fingerprint(path: str, file_name: str) -> Tuple[str, int, int, Optional[str]]:
+    """
+    Identify the current state of a file on disk.
+
+    Besides the stat data, the digest of a zip archive's central directory (the
+    name, CRC-32 and size of every member) catches rewrites that keep both the
+    size and the modification time. Only the directory at the end of the file
+    is read, not the members.
+
+    Args:
+        path (str): Directory path containing the file.
+        file_name (str): Name of the file.
+
+    Returns:
+        Tuple[str, int, int, Optional[str]]: (absolute path, mtime in nanoseconds,
+        size in bytes, central directory digest or None for non-zip files).
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    full_path = os.path.abspath(get_full_path(path, file_name))
+    stat = os.stat(full_path)
+    try:
+        with zipfile.ZipFile(full_path) as archive:
+            members = [(info.filename, info.CRC, info.file_size) for info in archive.infolist()]
+        digest = hashlib.sha1(repr(members).encode("utf-8")).hexdigest()
+    except (OSError, zipfile.BadZipFile):
+        digest = None
+    return full_path, stat.st_mtime_ns, stat.st_size, digest
+
+
+def disk_memoize(
+    key: Callable[..., Any],
+    cache_dir: str = DEFAULT_CACHE_DIR,
+    bypass: Optional[Callable[..., bool]] = None
+):
+    """
+    Memoize a standardized-response function to JSON files on disk.
+
+    Does nothing unless the cache is enabled (see memo_cache_enabled). The key callable receives the decorated function's arguments (with defaults
+    applied) as keyword arguments and must return a JSON-serializable value.
+    Including a file_fingerprint() in the key makes any change to the workbook
+    invalidate its entries. Only successful responses (status True) are cached.
+
+    Args:
+        key (Callable[..., Any]): Builds the cache key from the call arguments.
+        cache_dir (str, optional): Directory holding the cache files.
+        bypass (Optional[Callable[..., bool]], optional): Receives the same keyword
+            arguments as key; when it returns True the cache is neither read nor
+            written (e.g. while the workbook has unsaved staged changes).
+
+    Returns:
+        Callable: The decorator.
+    """
+    def decorator(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Dict[str, Any]:
+            if not memo_cache_enabled():
+                return func(*args, **kwargs)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            if bypass is not None and bypass(**bound.arguments):
+                return func(*args, **kwargs)
+            try:
+                cache_key = key(**bound.arguments)
+            except OSError:
+                # Missing or unreadable file: let the function report the error.
+                return func(*args, **kwargs)
+            if not _prepare_cache_dir(cache_dir):
+                return func(*args, **kwargs)
+
+            raw_key = json.dumps([func.__module__, func.__qualname__, cache_key], sort_keys=True, default=str)
+            cache_file = os.path.join(cache_dir, f"{hashlib.sha1(raw_key.encode('utf-8')).hexdigest()}.json")
+
+            cached = _read_cache_file(cache_file)
+            if cached is not None:
+                logger.debug(f"Memo hit for {func.__qualname__} ({cache_file}).")
+                return cached
+
+            result = func(*args, **kwargs)
+            if isinstance(result, dict) and result.get("status"):
+                _write_cache_file(cache_file, result)
+                _count_write(cache_dir)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=None)
+def _prepare_cache_dir(cache_dir: str) -> bool:
+    """
+    Create the cache directory as private to the current user, once per process.
+
+    Args:
+        cache_dir (str): Directory holding the cache files.
+
+    Returns:
+        bool: True if the directory can be trusted; False disables caching in it for the process.
+    """
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        stat = os.stat(cache_dir)
+        if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+            logger.warning(f"Memo cache directory '{cache_dir}' is owned by another user; caching disabled.")
+            return False
+        if stat.st_mode & 0o077:
+            os.chmod(cache_dir, 0o700)
+        return True
+    except OSError as e:
+        logger.warning(f"Memo cache directory '{cache_dir}' is unusable: {e}")
+        return False
+
+
+def _read_cache_file(cache_file: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a cached result, treating missing, unreadable or expired entries as misses.
+
+    Args:
+        cache_file (str): Cache file path.
+
+    Returns:
+        Optional[Dict[str, Any]]: The cached response, or None on a miss.
+    """
+    try:
+        if time.time() - os.path.getmtime(cache_file) > MAX_CACHE_AGE_SECONDS:
+            return None
+        with open(cache_file, "r", encoding="utf-8") as fh:
+            return json.load(fh)
+    except (OSError, ValueError):
+        return None
+
+
+def _write_cache_file(cache_file: str, result: Dict[str, Any]) -> None:
+    """
+    Atomically write a cached result, ignoring results or locations that cannot be stored.
+
+    Args:
+        cache_file (str): Destination file path.
+        result (Dict[str, Any]): Response to cache.
+    """
+    try:
+        payload = json.dumps(result)
+    except (TypeError, ValueError):
+        logger.debug(f"Result for '{cache_file}' is not JSON-serializable; not cached.")
+        return
+
+    # mkstemp gives every writer (process or thread) its own file, created 0600.
+    tmp_file = None
+    try:
+        fd, tmp_file = tempfile.mkstemp(dir=os.path.dirname(cache_file), suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as fh:
+            fh.write(payload)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        logger.warning(f"Failed to write memo cache file '{cache_file}': {e}")
+        if tmp_file is not None:
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
+
+
+def _count_write(cache_dir: str) -> None:
+    """
+    Count a cache write and run eviction every EVICT_EVERY_WRITES writes.
+
+    Args:
+        cache_dir (str): Directory holding the cache files.
+    """
+    with _writes_lock:
+        count = _writes_since_evict.get(cache_dir, 0) + 1
+        due = count >= EVICT_EVERY_WRITES
+        _writes_since_evict[cache_dir] = 0 if due else count
+    if due:
+        _evict(cache_dir)
+
+
+def _evict(cache_dir: str) -> None:
+    """
+    Remove expired cache files, then the oldest ones beyond MAX_CACHE_FILES.
+
+    Args:
+        cache_dir (str): Directory holding the cache files.
+    """
+    now = time.time()
+    entries = []
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    mtime = entry.stat().st_mtime
+                except OSError:
+                    continue
+                if now - mtime > MAX_CACHE_AGE_SECONDS:
+                    _remove_quietly(entry.path)
+                else:
+                    entries.append((mtime, entry.path))
+    except OSError:
+        return
+
+    if len(entries) > MAX_CACHE_FILES:
+        entries.sort()
+        for _, stale in entries[:len(entries) - MAX_CACHE_FILES]:
+            _remove_quietly(stale)
+
+
+def _remove_quietly(file_path: str) -> None:
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
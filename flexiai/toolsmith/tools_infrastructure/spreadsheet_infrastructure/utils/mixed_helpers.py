@@ -4,28 +4,102 @@
 mixed_tools_infrastructure module.
 
 Provides helper functions to serialize non-JSON-compatible Python objects (dates, decimals,
-sets, tuples, bytes) into JSON-friendly formats, and prepare tool output messages by
+sets, tuples, bytes, numpy arrays) into JSON-friendly formats, and prepare tool output messages by
 serializing and JSON-encoding them.
 """
 
 import json
+import base64
 import logging
 from datetime import datetime, date
 from typing import Any, Dict
 from decimal import Decimal
 
+import numpy as np
+
+# Optional faster encoders, preferred in this order: orjson, msgspec, stdlib json.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
 logger = logging.getLogger(__name__)
 
 
+class SafeOutput(dict):
+    """
+    Marker for messages that already hold JSON-native values only.
+
+    prepare_tool_output() encodes a SafeOutput directly, without the conversion
+    pass or per-type hooks. Producers must only wrap dicts whose contents are
+    str, int, float, bool, None, list or dict.
+    """
+
+
+def _iso(value: Any) -> str:
+    return value.isoformat()
+
+
+def _decode_bytes(value: bytes) -> str:
+    try:
+        return value.decode('utf-8')
+    except UnicodeDecodeError:
+        # Binary payloads (images, archives) are not text; base64 keeps them intact.
+        logger.debug("Bytes are not valid UTF-8; encoding %d bytes as base64.", len(value))
+        return base64.b64encode(value).decode('ascii')
+
+
+# Exact type -> converter. Containers are copied (to a dict or list) and their
+# items walked; every other entry maps a leaf to a JSON-native value.
+_DISPATCH = {
+    dict: dict,
+    list: list,
+    tuple: list,
+    set: list,
+    frozenset: list,
+    np.ndarray: np.ndarray.tolist,
+    datetime: _iso,
+    date: _iso,
+    Decimal: str,
+    bytes: _decode_bytes,
+}
+
+# Types JSON encoders handle natively; these are left untouched.
+_NATIVE_TYPES = frozenset({str, int, float, bool, type(None)})
+
+# isinstance() fallback for subclasses of the types above (e.g. OrderedDict,
+# pandas Timestamp), checked in order only when the exact-type lookup misses.
+_SUBCLASS_FALLBACK = (
+    (dict, dict),
+    ((list, tuple, set, frozenset), list),
+    (np.ndarray, np.ndarray.tolist),
+    ((datetime, date), _iso),
+    (Decimal, str),
+    (bytes, _decode_bytes),
+)
+
+
 def serialize_datetimes(data: Any) -> Any:
     """
-    Recursively serialize non-JSON-native types to JSON-compatible representations.
+    Serialize non-JSON-native types to JSON-compatible representations.
+
+    The structure is walked iteratively with an explicit worklist, so deeply
+    nested data cannot hit the recursion limit, and each value is converted
+    with a single exact-type lookup. The input is not modified. A container
+    that (directly or indirectly) contains itself is rejected, as json.dumps
+    does; the same container appearing twice without a cycle is fine.
 
     Supported conversions:
       - datetime, date -> ISO 8601 strings
       - Decimal -> string
       - set, tuple -> list
-      - bytes -> UTF-8 decoded string (raises TypeError if decoding fails)
+      - bytes -> UTF-8 decoded string, or base64 (ASCII) if not valid UTF-8
+      - numpy.ndarray -> list
 
     Args:
         data (Any): The data structure to serialize.
@@ -34,44 +108,126 @@ def serialize_datetimes(data: Any) -> Any:
         Any: The structure with all non-serializable values converted.
 
     Raises:
-        TypeError: If a bytes object cannot be decoded as UTF-8.
+        ValueError: If the structure contains a circular reference.
+    """
+    root = [data]
+    worklist = [(root, 0, data)]
+    # ids of the source containers on the path from the root to the current value.
+    on_path = set()
+    while worklist:
+        parent, key, value = worklist.pop()
+        if parent is None:
+            # Marker pushed below the items of a container: they are all walked.
+            on_path.discard(value)
+            continue
+        kind = type(value)
+        if kind in _NATIVE_TYPES:
+            continue
+        handler = _DISPATCH.get(kind)
+        if handler is None:
+            handler = next((h for base, h in _SUBCLASS_FALLBACK if isinstance(value, base)), None)
+            if handler is None:
+                continue
+        converted = handler(value)
+        parent[key] = converted
+        if type(converted) is dict or type(converted) is list:
+            if id(value) in on_path:
+                raise ValueError("Circular reference detected")
+            on_path.add(id(value))
+            worklist.append((None, None, id(value)))
+            if type(converted) is dict:
+                worklist.extend((converted, k, v) for k, v in converted.items())
+            else:
+                worklist.extend((converted, i, v) for i, v in enumerate(converted))
+    return root[0]
+
+
+def _encode_default(obj: Any) -> Any:
+    """
+    Convert a value the JSON encoder cannot handle natively, during its single pass.
+
+    Serves as orjson's default hook and as _ToolEncoder.default() for the stdlib.
+
+    Uses the same exact-type table as serialize_datetimes(), so the common types
+    cost one dict lookup; isinstance() runs only for subclasses.
+
+    Args:
+        obj (Any): Value the encoder could not serialize.
+
+    Returns:
+        Any: A JSON-native replacement.
+
+    Raises:
+        TypeError: If the type is unsupported.
     """
-    if isinstance(data, list):
-        return [serialize_datetimes(item) for item in data]
-    elif isinstance(data, dict):
-        return {key: serialize_datetimes(value) for key, value in data.items()}
-    elif isinstance(data, (datetime, date)):
-        iso = data.isoformat()
-        logger.debug(f"Serialized {type(data).__name__} {data} -> '{iso}'")
-        return iso
-    elif isinstance(data, Decimal):
-        s = str(data)
-        logger.debug(f"Serialized Decimal {data} -> '{s}'")
-        return s
-    elif isinstance(data, set):
-        lst = list(data)
-        logger.debug(f"Serialized set {data} -> {lst}")
-        return lst
-    elif isinstance(data, tuple):
-        lst = list(data)
-        logger.debug(f"Serialized tuple {data} -> {lst}")
-        return lst
-    elif isinstance(data, bytes):
-        try:
-            text = data.decode('utf-8')
-            logger.debug(f"Serialized bytes {data} -> '{text}'")
-            return text
-        except UnicodeDecodeError as e:
-            logger.error(f"Cannot decode bytes: {e}")
-            raise TypeError(f"Cannot decode bytes object: {e}") from e
-    else:
-        return data
+    handler = _DISPATCH.get(type(obj))
+    if handler is None:
+        handler = next((h for base, h in _SUBCLASS_FALLBACK if isinstance(obj, base)), None)
+    if handler is not None:
+        return handler(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class _ToolEncoder(json.JSONEncoder):
+    """
+    Stdlib encoder that converts non-native values inline via _encode_default().
+
+    The C encoder still walks the message; the Python callback only runs for the
+    (usually rare) values it does not recognize, so no converted copy is built.
+    """
+
+    def default(self, o: Any) -> Any:
+        return _encode_default(o)
+
+
+def _stdlib_dumps(output_message: Any) -> str:
+    """Encode with the stdlib json module in a single pass."""
+    return json.dumps(output_message, cls=_ToolEncoder)
+
+
+def _orjson_dumps(output_message: Any) -> str:
+    """Encode in a single orjson pass; non-native values go through _encode_default()."""
+    return orjson.dumps(
+        output_message,
+        default=_encode_default,
+        option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+    ).decode("utf-8")
+
+
+def _msgspec_dumps(output_message: Any) -> str:
+    """
+    Encode with msgspec after converting the message with serialize_datetimes().
+
+    The conversion is kept (rather than relying on msgspec's native types) so the
+    output matches the other encoders: msgspec would base64-encode every bytes value.
+    """
+    return msgspec.json.encode(serialize_datetimes(output_message)).decode("utf-8")
+
+
+# Encoder used by prepare_tool_output, picked once at import.
+if orjson is not None:
+    _dumps = _orjson_dumps
+elif msgspec is not None:
+    _dumps = _msgspec_dumps
+else:
+    _dumps = _stdlib_dumps
+
+
+def _dumps_native(output_message: Any) -> str:
+    """Encode a message known to be JSON-native, with no conversion hooks."""
+    if orjson is not None:
+        return orjson.dumps(output_message, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(output_message)
 
 
 def prepare_tool_output(output_message: Dict[str, Any]) -> Dict[str, Any]:
     """
     Prepare a tool output message by serializing non-serializable objects and JSON-encoding.
 
+    The encoder is chosen at import: orjson if installed (a single pass, with
+    datetimes and numpy arrays handled natively), then msgspec, then the stdlib
+    json module. A SafeOutput message skips all conversion.
+
     Args:
         output_message (Dict[str, Any]): Message dict that may contain dates, decimals, etc.
 
@@ -83,9 +239,11 @@ def prepare_tool_output(output_message: Dict[str, Any]) -> Dict[str, Any]:
         Exception: For any other unexpected error during preparation.
     """
     try:
-        serialized = serialize_datetimes(output_message)
-        json_str = json.dumps(serialized)
-        logger.debug(f"Prepared tool output JSON: {json_str}")
+        if isinstance(output_message, SafeOutput):
+            json_str = _dumps_native(output_message)
+        else:
+            json_str = _dumps(output_message)
+        logger.debug("Prepared tool output JSON: %s", json_str)
         return {"output": json_str}
     except Exception as e:
         logger.error(f"Error preparing tool output: {e}")
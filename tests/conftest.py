@@ -0,0 +1,35 @@
+# FILE: tests/conftest.py
+
+"""
+Shared fixtures for the toolsmith infrastructure tests.
+"""
+
+import os
+import sys
+
+import pytest
+
+# The repository is not installed as a package; make `flexiai` importable when
+# pytest is run from any directory.
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    """
+    Create a workbook with a 'Data' sheet holding a header and three rows.
+
+    Returns:
+        str: Path to the saved .xlsx file.
+    """
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "Data"
+    sheet.append(["name", "score", "city"])
+    sheet.append(["alice", 10, "Paris"])
+    sheet.append(["bob", 25, "Berlin"])
+    sheet.append(["carol", 40, "Porto"])
+    path = str(tmp_path / "book.xlsx")
+    wb.save(path)
+    return path
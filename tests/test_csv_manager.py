@@ -0,0 +1,87 @@
+# FILE: tests/test_csv_manager.py
+
+"""
+Tests for CSVManager.filter_rows against a plain Python evaluation of each condition.
+"""
+
+import csv
+
+import pytest
+
+pytest.importorskip("pandas")
+
+from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.exceptions.csv_exceptions import CSVError
+from flexiai.toolsmith.tools_infrastructure.csv_infrastructure.managers.csv_manager import CSVManager
+
+HEADER = ["name", "score", "city"]
+ROWS = [
+    ["alice", "10", "Paris"],
+    ["bob", "25.5", "Berlin"],
+    ["carol", "n/a", "Porto"],
+    ["dave", "40", " Parma "],
+    ["erin", "3", "Oslo"],
+]
+
+
+def _to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+# Reference semantics: values are trimmed on load; non-numeric cells never
+# match greater_than / less_than.
+REFERENCE = {
+    "equals": lambda cell, target: cell == str(target).strip(),
+    "greater_than": lambda cell, target: _to_float(cell) is not None and _to_float(cell) > float(target),
+    "less_than": lambda cell, target: _to_float(cell) is not None and _to_float(cell) < float(target),
+    "contains": lambda cell, target: target in cell,
+    "startswith": lambda cell, target: cell.startswith(target),
+    "endswith": lambda cell, target: cell.endswith(target),
+}
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / "people.csv"
+    with open(path, "w", newline="", encoding="utf-8") as fh:
+        writer = csv.writer(fh)
+        writer.writerow(HEADER)
+        writer.writerows(ROWS)
+    return str(path)
+
+
+@pytest.mark.parametrize("column, condition_type, condition_value", [
+    ("city", "equals", " Parma"),
+    ("city", "contains", "ar"),
+    ("city", "startswith", "P"),
+    ("city", "endswith", "o"),
+    ("score", "greater_than", "9"),
+    ("score", "less_than", 25.5),
+    (0, "equals", "erin"),
+])
+def test_filter_rows_matches_reference(csv_path, column, condition_type, condition_value):
+    col_idx = column if isinstance(column, int) else HEADER.index(column)
+    trimmed = [[value.strip() for value in row] for row in ROWS]
+    expected = [
+        dict(zip(HEADER, row)) for row in trimmed
+        if REFERENCE[condition_type](row[col_idx], condition_value)
+    ]
+
+    manager = CSVManager(csv_path)
+    assert manager.filter_rows(column, condition_type, condition_value) == expected
+
+
+def test_repeated_filters_see_updates(csv_path):
+    manager = CSVManager(csv_path, autosave=False)
+    assert len(manager.filter_rows("city", "startswith", "P")) == 3
+
+    manager.update_cell(0, "city", "Lyon")
+    assert len(manager.filter_rows("city", "startswith", "P")) == 2
+
+
+def test_filter_rows_rejects_unknown_condition(csv_path):
+    manager = CSVManager(csv_path)
+    with pytest.raises(CSVError):
+        manager.filter_rows("city", "near", "Paris")
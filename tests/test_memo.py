@@ -0,0 +1,182 @@
+# FILE: tests/test_memo.py
+
+"""
+Tests for the disk-backed memo: opt-in, hits, invalidation, bypass and eviction.
+"""
+
+import os
+import stat
+import sys
+import zipfile
+
+import pytest
+
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.utils import memo
+
+
+@pytest.fixture(autouse=True)
+def _cache_enabled(monkeypatch):
+    monkeypatch.setenv(memo.MEMO_CACHE_ENV, "1")
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.xlsx"
+    path.write_bytes(b"first version")
+    return path
+
+
+def _memoized(cache_dir, calls, bypass=None, status=True):
+    @memo.disk_memoize(
+        key=lambda path, file_name: memo.file_fingerprint(path, file_name),
+        cache_dir=cache_dir,
+        bypass=bypass
+    )
+    def summarize(path, file_name):
+        calls.append(file_name)
+        return {"status": status, "message": "ok", "result": len(calls)}
+    return summarize
+
+
+def test_repeated_call_is_served_from_cache(tmp_path, data_file):
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls)
+
+    first = summarize(str(tmp_path), data_file.name)
+    second = summarize(str(tmp_path), data_file.name)
+
+    assert first == second
+    assert len(calls) == 1
+
+
+def test_cache_is_off_unless_enabled(tmp_path, data_file, monkeypatch):
+    monkeypatch.delenv(memo.MEMO_CACHE_ENV)
+    calls = []
+    cache_dir = tmp_path / "cache"
+    summarize = _memoized(str(cache_dir), calls)
+
+    summarize(str(tmp_path), data_file.name)
+    summarize(str(tmp_path), data_file.name)
+
+    assert len(calls) == 2
+    assert not cache_dir.exists()
+
+
+def test_changing_the_file_invalidates_the_entry(tmp_path, data_file):
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls)
+
+    summarize(str(tmp_path), data_file.name)
+    data_file.write_bytes(b"second, longer version")
+    result = summarize(str(tmp_path), data_file.name)
+
+    assert len(calls) == 2
+    assert result["result"] == 2
+
+
+def test_same_size_and_mtime_rewrite_invalidates_the_entry(tmp_path):
+    archive = tmp_path / "book.xlsx"
+
+    def write(content):
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("xl/sheet1.xml", content)
+        os.utime(archive, ns=(1_000_000_000, 1_000_000_000))
+
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls)
+    write(b"aaaa")
+    summarize(str(tmp_path), archive.name)
+    before = os.stat(archive)
+    write(b"bbbb")
+    after = os.stat(archive)
+    summarize(str(tmp_path), archive.name)
+
+    assert (before.st_size, before.st_mtime_ns) == (after.st_size, after.st_mtime_ns)
+    assert len(calls) == 2
+
+
+def test_bypass_skips_reading_and_writing(tmp_path, data_file):
+    calls = []
+    cache_dir = tmp_path / "cache"
+    bypassed = {"on": True}
+    summarize = _memoized(str(cache_dir), calls, bypass=lambda **kw: bypassed["on"])
+
+    summarize(str(tmp_path), data_file.name)
+    summarize(str(tmp_path), data_file.name)
+    assert len(calls) == 2
+    assert not cache_dir.exists() or not list(cache_dir.glob("*.json"))
+
+    bypassed["on"] = False
+    summarize(str(tmp_path), data_file.name)
+    summarize(str(tmp_path), data_file.name)
+    assert len(calls) == 3
+
+
+def test_failed_responses_are_not_cached(tmp_path, data_file):
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls, status=False)
+
+    summarize(str(tmp_path), data_file.name)
+    summarize(str(tmp_path), data_file.name)
+
+    assert len(calls) == 2
+
+
+def test_missing_file_is_left_to_the_function(tmp_path):
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls)
+
+    summarize(str(tmp_path), "missing.xlsx")
+
+    assert calls == ["missing.xlsx"]
+
+
+def test_eviction_caps_the_number_of_entries(tmp_path, monkeypatch):
+    monkeypatch.setattr(memo, "MAX_CACHE_FILES", 2)
+    monkeypatch.setattr(memo, "EVICT_EVERY_WRITES", 1)
+    cache_dir = tmp_path / "cache"
+    calls = []
+    summarize = _memoized(str(cache_dir), calls)
+
+    for i in range(5):
+        (tmp_path / f"file{i}.xlsx").write_bytes(b"x" * (i + 1))
+        summarize(str(tmp_path), f"file{i}.xlsx")
+
+    assert len(list(cache_dir.glob("*.json"))) <= 2
+
+
+def test_eviction_runs_every_few_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(memo, "EVICT_EVERY_WRITES", 3)
+    cache_dir = str(tmp_path / "cache")
+    evictions = []
+    monkeypatch.setattr(memo, "_evict", evictions.append)
+    summarize = _memoized(cache_dir, [])
+
+    for i in range(7):
+        (tmp_path / f"file{i}.xlsx").write_bytes(b"x" * (i + 1))
+        summarize(str(tmp_path), f"file{i}.xlsx")
+
+    assert evictions == [cache_dir, cache_dir]
+
+
+def test_expired_entries_are_ignored(tmp_path, data_file, monkeypatch):
+    calls = []
+    summarize = _memoized(str(tmp_path / "cache"), calls)
+
+    summarize(str(tmp_path), data_file.name)
+    monkeypatch.setattr(memo, "MAX_CACHE_AGE_SECONDS", -1)
+    summarize(str(tmp_path), data_file.name)
+
+    assert len(calls) == 2
+
+
+@pytest.mark.skipif(sys.platform.startswith("win"), reason="POSIX permissions")
+def test_cache_directory_is_private(tmp_path, data_file):
+    cache_dir = tmp_path / "cache"
+    cache_dir.mkdir(mode=0o755)
+    os.chmod(cache_dir, 0o755)
+    summarize = _memoized(str(cache_dir), [])
+
+    summarize(str(tmp_path), data_file.name)
+
+    assert stat.S_IMODE(os.stat(cache_dir).st_mode) == 0o700
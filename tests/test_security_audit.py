@@ -0,0 +1,77 @@
+# FILE: tests/test_security_audit.py
+
+"""
+Tests for the socket-level helpers behind port_scan and network_scan.
+"""
+
+import socket
+import struct
+
+import pytest
+
+from flexiai.toolsmith.tools_infrastructure import security_audit
+
+
+def test_icmp_checksum_matches_rfc1071_example():
+    # RFC 1071, section 3: the one's complement sum of these words is 0xddf2.
+    assert security_audit._icmp_checksum(bytes.fromhex("0001f203f4f5f6f7")) == 0x220D
+
+
+def test_icmp_checksum_pads_odd_length():
+    assert security_audit._icmp_checksum(b"\x12\x34\x56") == security_audit._icmp_checksum(b"\x12\x34\x56\x00")
+
+
+def test_echo_request_is_well_formed():
+    packet = security_audit._echo_request(0x1234, 7)
+
+    kind, code, _, ident, seq = struct.unpack("!BBHHH", packet[:8])
+    assert (kind, code, ident, seq) == (security_audit._ICMP_ECHO_REQUEST, 0, 0x1234, 7)
+    assert packet[8:] == security_audit._ICMP_PAYLOAD
+    # A packet carrying a valid checksum sums to zero.
+    assert security_audit._icmp_checksum(packet) == 0
+
+
+def test_icmp_sweep_finds_loopback():
+    sock = security_audit._open_icmp_socket()
+    if sock is None:
+        pytest.skip("ICMP sockets are not permitted here")
+    try:
+        assert security_audit._icmp_sweep(sock, ["127.0.0.1"]) == ["127.0.0.1"]
+    finally:
+        sock.close()
+
+
+@pytest.fixture
+def listening_port():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(8)
+    try:
+        yield server.getsockname()[1]
+    finally:
+        server.close()
+
+
+@pytest.fixture
+def closed_port():
+    probe = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()
+    return port
+
+
+def test_scan_ports_reports_listening_port(listening_port):
+    assert security_audit._scan_ports("127.0.0.1", range(listening_port, listening_port + 1)) == [listening_port]
+
+
+def test_scan_ports_skips_closed_port(closed_port):
+    assert security_audit._scan_ports("127.0.0.1", range(closed_port, closed_port + 1)) == []
+
+
+def test_scan_ports_over_more_ports_than_concurrency(listening_port, monkeypatch):
+    monkeypatch.setattr(security_audit, "_PORT_SCAN_CONCURRENCY", 4)
+    low = max(1, listening_port - 10)
+    found = security_audit._scan_ports("127.0.0.1", range(low, listening_port + 11))
+    assert listening_port in found
+    assert found == sorted(found)
@@ -0,0 +1,360 @@
+# FILE: tests/test_spreadsheet_manager.py
+
+"""
+Tests for SpreadsheetManager.
+"""
+
+import os
+import re
+import time
+import zipfile
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+pytest.importorskip("pandas")
+
+from openpyxl.styles import Font
+from openpyxl.worksheet.datavalidation import DataValidation
+
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.exceptions.spreadsheet_exceptions import SpreadsheetError
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers import spreadsheet_manager
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.managers.spreadsheet_manager import (
+    SpreadsheetManager,
+    abort_transaction,
+    begin_transaction,
+    commit_transaction,
+    has_open_transaction,
+)
+from flexiai.toolsmith.tools_infrastructure.spreadsheet_infrastructure.operations.data_retrieval_operations import filter_rows
+
+
+def _rows_on_disk(path, sheet_name="Data"):
+    wb = openpyxl.load_workbook(path)
+    try:
+        return [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+@pytest.fixture(autouse=True)
+def _no_leftover_transaction(workbook_path):
+    yield
+    if has_open_transaction(workbook_path):
+        abort_transaction(workbook_path)
+
+
+# ------------------------------------------------------------------------------
+# Transactions
+# ------------------------------------------------------------------------------
+
+def test_transaction_defers_writes_until_commit(workbook_path):
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+    SpreadsheetManager(workbook_path).add_row("Data", ["erin", 7, "Rome"])
+
+    assert len(_rows_on_disk(workbook_path)) == 4
+    assert commit_transaction(workbook_path) is True
+    assert not has_open_transaction(workbook_path)
+    assert _rows_on_disk(workbook_path)[-2:] == [["dave", 5, "Oslo"], ["erin", 7, "Rome"]]
+
+
+def test_commit_without_changes_does_not_save(workbook_path):
+    begin_transaction(workbook_path)
+    assert commit_transaction(workbook_path) is False
+    assert not has_open_transaction(workbook_path)
+
+
+def test_failed_commit_keeps_transaction_open(workbook_path, monkeypatch):
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+
+    def failing_save(self, filename):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(openpyxl.Workbook, "save", failing_save)
+    with pytest.raises(SpreadsheetError):
+        commit_transaction(workbook_path)
+    assert has_open_transaction(workbook_path)
+
+    monkeypatch.undo()
+    assert commit_transaction(workbook_path) is True
+    assert _rows_on_disk(workbook_path)[-1] == ["dave", 5, "Oslo"]
+
+
+def test_abort_discards_staged_changes(workbook_path):
+    before = _rows_on_disk(workbook_path)
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+
+    assert abort_transaction(workbook_path) is True
+    assert not has_open_transaction(workbook_path)
+    assert _rows_on_disk(workbook_path) == before
+    with pytest.raises(SpreadsheetError):
+        commit_transaction(workbook_path)
+
+
+def test_idle_transaction_is_committed_by_timer(workbook_path, monkeypatch):
+    monkeypatch.setattr(spreadsheet_manager, "TRANSACTION_IDLE_SECONDS", 0.05)
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+
+    deadline = time.monotonic() + 5
+    while has_open_transaction(workbook_path) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not has_open_transaction(workbook_path)
+    assert _rows_on_disk(workbook_path)[-1] == ["dave", 5, "Oslo"]
+
+
+def test_open_transaction_is_committed_at_exit(workbook_path):
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+
+    spreadsheet_manager._commit_open_transactions()
+
+    assert not has_open_transaction(workbook_path)
+    assert _rows_on_disk(workbook_path)[-1] == ["dave", 5, "Oslo"]
+
+
+def test_workbook_lock_entry_is_dropped_after_commit_and_abort(workbook_path):
+    key = spreadsheet_manager._transaction_key(workbook_path)
+    begin_transaction(workbook_path)
+    SpreadsheetManager(workbook_path).add_row("Data", ["dave", 5, "Oslo"])
+    commit_transaction(workbook_path)
+    assert key not in spreadsheet_manager._file_locks
+
+    begin_transaction(workbook_path)
+    abort_transaction(workbook_path)
+    assert key not in spreadsheet_manager._file_locks
+
+
+def test_second_begin_is_rejected(workbook_path):
+    begin_transaction(workbook_path)
+    with pytest.raises(SpreadsheetError):
+        begin_transaction(workbook_path)
+
+
+# ------------------------------------------------------------------------------
+# add_rows_bulk
+# ------------------------------------------------------------------------------
+
+def test_add_rows_bulk_streams_into_greenfield_workbook(tmp_path):
+    wb = openpyxl.Workbook()
+    wb.active.title = "Data"
+    wb.create_sheet("Other")
+    path = str(tmp_path / "empty.xlsx")
+    wb.save(path)
+
+    manager = SpreadsheetManager(path, load_workbook=False)
+    count = manager.add_rows_bulk("Data", ([i, f"row{i}"] for i in range(1, 501)))
+
+    assert count == 500
+    assert manager.workbook is None
+    rows = _rows_on_disk(path)
+    assert len(rows) == 500
+    assert rows[0] == [1, "row1"] and rows[-1] == [500, "row500"]
+    assert openpyxl.load_workbook(path).sheetnames == ["Data", "Other"]
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_add_rows_bulk_falls_back_when_workbook_has_content(workbook_path):
+    wb = openpyxl.load_workbook(workbook_path)
+    wb["Data"]["A1"].font = Font(bold=True)
+    wb.save(workbook_path)
+
+    manager = SpreadsheetManager(workbook_path, load_workbook=False)
+    count = manager.add_rows_bulk("Data", [["dave", 5, "Oslo"], ["erin", 7, "Rome"]])
+
+    assert count == 2
+    rows = _rows_on_disk(workbook_path)
+    assert rows[0] == ["name", "score", "city"]
+    assert rows[-2:] == [["dave", 5, "Oslo"], ["erin", 7, "Rome"]]
+    assert openpyxl.load_workbook(workbook_path)["Data"]["A1"].font.bold
+
+
+def _set_width(wb):
+    wb["Data"].column_dimensions["B"].width = 42
+
+
+def _freeze(wb):
+    wb["Data"].freeze_panes = "A2"
+
+
+def _validate(wb):
+    validation = DataValidation(type="list", formula1='"yes,no"')
+    validation.add("C1:C10")
+    wb["Data"].add_data_validation(validation)
+
+
+def _hide(wb):
+    wb["Other"].sheet_state = "hidden"
+
+
+@pytest.mark.parametrize("decorate", [_set_width, _freeze, _validate, _hide])
+def test_add_rows_bulk_keeps_formatting_of_empty_sheets(tmp_path, decorate):
+    wb = openpyxl.Workbook()
+    wb.active.title = "Data"
+    wb.create_sheet("Other")
+    decorate(wb)
+    path = str(tmp_path / "formatted.xlsx")
+    wb.save(path)
+
+    count = SpreadsheetManager(path, load_workbook=False).add_rows_bulk("Data", [[1, 2, "yes"], [3, 4, "no"]])
+
+    assert count == 2
+    assert _rows_on_disk(path) == [[1, 2, "yes"], [3, 4, "no"]]
+    wb = openpyxl.load_workbook(path)
+    sheet = wb["Data"]
+    if decorate is _set_width:
+        assert sheet.column_dimensions["B"].width == 42
+    elif decorate is _freeze:
+        assert sheet.freeze_panes == "A2"
+    elif decorate is _validate:
+        assert [str(v.sqref) for v in sheet.data_validations.dataValidation] == ["C1:C10"]
+    else:
+        assert wb["Other"].sheet_state == "hidden"
+
+
+def test_add_rows_bulk_matches_add_rows_result(tmp_path):
+    rows = [[i, i * 1.5, f"name{i}"] for i in range(50)]
+    paths = []
+    for name in ("bulk.xlsx", "plain.xlsx"):
+        wb = openpyxl.Workbook()
+        wb.active.title = "Data"
+        paths.append(str(tmp_path / name))
+        wb.save(paths[-1])
+
+    SpreadsheetManager(paths[0], load_workbook=False).add_rows_bulk("Data", rows)
+    SpreadsheetManager(paths[1]).add_rows("Data", rows)
+
+    assert _rows_on_disk(paths[0]) == _rows_on_disk(paths[1])
+
+
+def test_add_rows_bulk_rejects_unknown_sheet(workbook_path):
+    manager = SpreadsheetManager(workbook_path, load_workbook=False)
+    with pytest.raises(SpreadsheetError):
+        manager.add_rows_bulk("Missing", [[1, 2]])
+
+
+# ------------------------------------------------------------------------------
+# filter_rows: vectorized (max_results=None) vs row-wise scan
+# ------------------------------------------------------------------------------
+
+@pytest.fixture
+def mixed_workbook(tmp_path):
+    wb = openpyxl.Workbook()
+    sheet = wb.active
+    sheet.title = "Data"
+    sheet.append(["name", "score", "city"])
+    sheet.append(["alice", 10, "Paris"])
+    sheet.append(["bob", 25.5, "Berlin"])
+    sheet.append(["carol", None, "Porto"])
+    sheet.append(["dave", 40, None])
+    sheet.append(["erin", 3, "Paris"])
+    sheet.append(["frank", 25.5, "Parma"])
+    path = str(tmp_path / "mixed.xlsx")
+    wb.save(path)
+    return path
+
+
+@pytest.mark.parametrize("column, condition_type, condition_value", [
+    ("city", "equals", "Paris"),
+    ("city", "contains", "ar"),
+    ("city", "startswith", "Par"),
+    ("city", "endswith", "o"),
+    ("city", "matches", r"^P.r"),
+    ("score", "greater_than", "20"),
+    ("score", "less_than", "25.5"),
+    ("name", "equals", "nobody"),
+])
+def test_filter_rows_vectorized_matches_row_wise(mixed_workbook, column, condition_type, condition_value):
+    manager = SpreadsheetManager(mixed_workbook, load_workbook=False)
+    try:
+        vectorized = manager.filter_rows("Data", column, condition_type, condition_value, max_results=None)
+        row_wise = manager.filter_rows("Data", column, condition_type, condition_value, max_results=10 ** 6)
+    finally:
+        manager.close()
+    assert vectorized == row_wise
+
+
+def test_filter_rows_respects_max_results(mixed_workbook):
+    manager = SpreadsheetManager(mixed_workbook, load_workbook=False)
+    try:
+        rows = manager.filter_rows("Data", "city", "startswith", "P", max_results=2)
+    finally:
+        manager.close()
+    assert rows == [["alice", 10, "Paris"], ["carol", None, "Porto"]]
+
+
+def test_filter_rows_rejects_unknown_condition(mixed_workbook):
+    manager = SpreadsheetManager(mixed_workbook, load_workbook=False)
+    try:
+        with pytest.raises(SpreadsheetError):
+            manager.filter_rows("Data", "city", "near", "Paris", max_results=None)
+    finally:
+        manager.close()
+
+
+# ------------------------------------------------------------------------------
+# filter_rows operation: max_results cap
+# ------------------------------------------------------------------------------
+
+@pytest.mark.parametrize("max_results, expected_names, truncated", [
+    (1, ["alice"], True),
+    (2, ["alice", "bob"], False),
+    (None, ["alice", "bob"], False),
+])
+def test_filter_rows_flags_truncated_results(workbook_path, max_results, expected_names, truncated):
+    response = filter_rows(
+        "Data", "score", "less_than", "30",
+        max_results=max_results,
+        path=os.path.dirname(workbook_path),
+        file_name=os.path.basename(workbook_path),
+    )
+
+    assert response["status"] is True
+    assert [row[0] for row in response["result"]["filtered_rows"]] == expected_names
+    assert response["result"]["truncated"] is truncated
+    assert ("more rows match" in response["message"]) is truncated
+
+
+# ------------------------------------------------------------------------------
+# _read_sheet_dimensions
+# ------------------------------------------------------------------------------
+
+def _rewrite_sheets(source, target, pattern, replacement):
+    with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, "w") as dst:
+        for item in src.infolist():
+            data = src.read(item.filename)
+            if item.filename.startswith("xl/worksheets/"):
+                data = re.sub(pattern, replacement, data)
+            dst.writestr(item, data)
+
+
+def test_read_sheet_dimensions_matches_openpyxl(workbook_path):
+    wb = openpyxl.load_workbook(workbook_path)
+    extra = wb.create_sheet("Wide")
+    extra["E7"] = "x"
+    wb.create_sheet("Empty")
+    wb.save(workbook_path)
+
+    dimensions = spreadsheet_manager._read_sheet_dimensions(workbook_path)
+
+    assert list(dimensions) == ["Data", "Wide", "Empty"]
+    assert dimensions["Data"] == {"rows": 4, "columns": 3}
+    assert dimensions["Wide"] == {"rows": 7, "columns": 5}
+    assert dimensions["Empty"] == {"rows": 1, "columns": 1}
+
+
+def test_read_sheet_dimensions_counts_cells_behind_a_stale_single_cell_dimension(workbook_path, tmp_path):
+    stale = str(tmp_path / "stale_dimension.xlsx")
+    _rewrite_sheets(workbook_path, stale, rb"<dimension [^>]*/>", b'<dimension ref="A1"/>')
+
+    assert spreadsheet_manager._read_sheet_dimensions(stale) == {"Data": {"rows": 4, "columns": 3}}
+
+
+def test_read_sheet_dimensions_without_dimension_element(workbook_path, tmp_path):
+    stripped = str(tmp_path / "no_dimension.xlsx")
+    _rewrite_sheets(workbook_path, stripped, rb"<dimension[^>]*/>", b"")
+
+    assert spreadsheet_manager._read_sheet_dimensions(stripped) is None